@@ -0,0 +1,96 @@
+"""
+Latência de entrega na thread do Tk: thread de trabalho x asyncio.
+
+Cada amostra dorme um intervalo (``time.sleep`` em uma thread ou
+``await asyncio.sleep`` no loop do AsyncBridge) e posta um callback no
+UIDispatcher; mede-se o tempo entre o fim da espera e a execução do callback
+na thread do Tk. Requer um display.
+
+Uso:
+    python benchmarks/bench_async_latency.py [--samples 300] [--interval 5]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clivgui.aio import AsyncBridge  # noqa: E402
+from clivgui.dispatch import UIDispatcher  # noqa: E402
+
+
+def percentile(values, p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def run_threaded(root: tk.Tk, dispatcher: UIDispatcher, samples: int, interval: float):
+    latencies = []
+
+    def record(sent: float):
+        latencies.append((time.perf_counter() - sent) * 1000)
+        if len(latencies) == samples:
+            root.quit()
+
+    def worker():
+        for _ in range(samples):
+            time.sleep(interval)
+            dispatcher.post(record, time.perf_counter())
+
+    threading.Thread(target=worker, daemon=True).start()
+    root.mainloop()
+    return latencies
+
+
+def run_asyncio(root: tk.Tk, dispatcher: UIDispatcher, samples: int, interval: float):
+    latencies = []
+    bridge = AsyncBridge(dispatcher)
+
+    def record(sent: float):
+        latencies.append((time.perf_counter() - sent) * 1000)
+        if len(latencies) == samples:
+            root.quit()
+
+    async def worker():
+        for _ in range(samples):
+            await asyncio.sleep(interval)
+            dispatcher.post(record, time.perf_counter())
+
+    bridge.submit(worker())
+    root.mainloop()
+    bridge.stop()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=300)
+    parser.add_argument("--interval", type=float, default=5, help="ms entre amostras")
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Display indisponível, benchmark ignorado: {e}")
+        return
+    root.withdraw()
+    dispatcher = UIDispatcher.for_widget(root)
+    interval = args.interval / 1000
+
+    print(f"{'modo':>8} {'p50 (ms)':>10} {'p99 (ms)':>10} {'máx (ms)':>10}")
+    for name, runner in (("thread", run_threaded), ("asyncio", run_asyncio)):
+        latencies = runner(root, dispatcher, args.samples, interval)
+        print(f"{name:>8} {statistics.median(latencies):>10.3f} "
+              f"{percentile(latencies, 0.99):>10.3f} {max(latencies):>10.3f}")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
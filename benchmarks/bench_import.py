@@ -0,0 +1,87 @@
+"""
+Benchmark de tempo de importação do ClivGui.
+
+Compara, em processos Python novos (sem cache de módulos):
+
+- ``eager``: ``import clivgui.cliv_gui`` (carrega tudo, como na versão monolítica)
+- ``lazy``: ``import clivgui`` + acesso a ``ClivMenu`` e ``ModernSlider``
+
+Sai com erro se o cenário ``lazy`` carregar algum de ``HEAVY_MODULES``.
+
+Uso:
+    python benchmarks/bench_import.py [--runs 15]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Não podem ser carregados pelo cenário "lazy" (o benchmark falha se forem)
+HEAVY_MODULES = ("pygame", "PIL", "psutil", "keyboard", "win32gui", "win32process",
+                 "numpy", "asyncio", "multiprocessing")
+
+SCENARIOS = {
+    "eager": "import clivgui.cliv_gui",
+    "lazy": "import clivgui; clivgui.ClivMenu; clivgui.ModernSlider",
+}
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+try:
+    {stmt}
+    error = None
+except Exception as e:
+    error = repr(e)
+elapsed = time.perf_counter() - t0
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "error": error, "heavy": heavy}}))
+"""
+
+
+def run_once(stmt: str) -> dict:
+    code = PROBE.format(stmt=stmt, heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    results = {}
+    for name, stmt in SCENARIOS.items():
+        samples = [run_once(stmt) for _ in range(args.runs)]
+        errors = {s["error"] for s in samples if s["error"]}
+        times_ms = [s["elapsed"] * 1000 for s in samples]
+        results[name] = {
+            "median_ms": statistics.median(times_ms),
+            "min_ms": min(times_ms),
+            "heavy_modules": samples[-1]["heavy"],
+            "error": errors.pop() if errors else None,
+        }
+
+    for name, r in results.items():
+        print(f"{name:>6}: mediana {r['median_ms']:8.2f} ms  "
+              f"(min {r['min_ms']:8.2f} ms)  pesados: {', '.join(r['heavy_modules']) or '-'}")
+        if r["error"]:
+            print(f"        aviso: importação incompleta ({r['error']})")
+
+    eager, lazy = results["eager"]["median_ms"], results["lazy"]["median_ms"]
+    if lazy > 0 and not results["eager"]["error"]:
+        print(f"\nGanho: {eager / lazy:.1f}x mais rápido ({eager - lazy:.1f} ms economizados)")
+
+    heavy = results["lazy"]["heavy_modules"]
+    if heavy:
+        sys.exit(f"\nERRO: 'import clivgui' carregou módulos pesados: {', '.join(heavy)}")
+
+
+if __name__ == "__main__":
+    main()
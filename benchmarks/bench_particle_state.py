@@ -0,0 +1,86 @@
+"""
+Benchmark do estado das partículas: memória por partícula e CPU por tick.
+
+Compara o formato antigo (lista de dicts atualizada em Python puro) com o
+ParticleState em estrutura de arrays (NumPy e ``array``). Não requer display.
+
+Uso:
+    python benchmarks/bench_particle_state.py [--ticks 200] [--counts 400 4000 40000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clivgui.optional import load_numpy  # noqa: E402
+from clivgui.particles import ParticleState  # noqa: E402
+
+WIDTH, HEIGHT = 450, 720
+SPEED = (0.2, 0.8)
+
+
+class LegacyParticles:
+    """Reprodução do formato original (lista de dicts)"""
+
+    def __init__(self, count: int):
+        self.particles = [{
+            'id': i,
+            'x': random.randint(0, WIDTH),
+            'y': random.randint(0, HEIGHT),
+            'speed': random.uniform(*SPEED),
+            'opacity': random.uniform(0.3, 1.0)
+        } for i in range(count)]
+
+    def step(self):
+        for p in self.particles:
+            p['y'] -= p['speed']
+            if p['y'] < 0:
+                p['y'] = HEIGHT
+                p['x'] = random.randint(0, WIDTH)
+
+
+def factories():
+    yield "dicts (antigo)", LegacyParticles
+    yield "array", lambda n: ParticleState(n, WIDTH, HEIGHT, SPEED, use_numpy=False)
+    if load_numpy() is not None:
+        yield "numpy", lambda n: ParticleState(n, WIDTH, HEIGHT, SPEED, use_numpy=True)
+
+
+def measure(factory, count: int, ticks: int):
+    # Aquecimento: exclui da medição imports tardios (ex.: numpy.random)
+    factory(1)
+    tracemalloc.start()
+    obj = factory(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    obj.step()
+    start = time.perf_counter()
+    for _ in range(ticks):
+        obj.step()
+    per_tick = (time.perf_counter() - start) / ticks
+    return current / count, per_tick * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--counts", type=int, nargs="+", default=[400, 4000, 40000])
+    args = parser.parse_args()
+
+    print(f"{'estado':>14} {'partículas':>10} {'bytes/part.':>12} {'µs/tick':>10} {'ns/part.':>9}")
+    for count in args.counts:
+        for name, factory in factories():
+            per_particle, us = measure(factory, count, args.ticks)
+            print(f"{name:>14} {count:>10} {per_particle:>12.1f} {us:>10.1f} "
+                  f"{us * 1000 / count:>9.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
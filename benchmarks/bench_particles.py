@@ -0,0 +1,69 @@
+"""
+Benchmark dos backends de partículas ('canvas' x 'image').
+
+Mede o custo médio de um frame (atualização + redesenho do Tk) para 40, 400 e
+4000 partículas em um canvas do tamanho padrão do menu. Requer um display.
+
+Uso:
+    python benchmarks/bench_particles.py [--frames 120] [--counts 40 400 4000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clivgui.particles import PARTICLE_BACKENDS, create_particle_renderer  # noqa: E402
+
+WIDTH, HEIGHT = 450, 720
+
+
+def bench(root: tk.Tk, backend: str, count: int, frames: int) -> float:
+    """Retorna o custo médio por frame em milissegundos"""
+    canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, bg="#05050a",
+                       highlightthickness=0, bd=0)
+    canvas.pack()
+    renderer = create_particle_renderer(backend, canvas, WIDTH, HEIGHT, count=count)
+    root.update()
+
+    # Aquecimento
+    for _ in range(5):
+        renderer.step()
+        root.update_idletasks()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        renderer.step()
+        root.update_idletasks()
+    elapsed = time.perf_counter() - start
+
+    renderer.destroy()
+    canvas.destroy()
+    return elapsed / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--counts", type=int, nargs="+", default=[40, 400, 4000])
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Display indisponível, benchmark ignorado: {e}")
+        return
+
+    print(f"{'partículas':>10} " + " ".join(f"{b:>12}" for b in PARTICLE_BACKENDS))
+    for count in args.counts:
+        row = [bench(root, backend, count, args.frames) for backend in PARTICLE_BACKENDS]
+        print(f"{count:>10} " + " ".join(f"{ms:>9.3f} ms" for ms in row))
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
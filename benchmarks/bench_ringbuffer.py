@@ -0,0 +1,75 @@
+"""
+Benchmark do armazenamento de valores do ModernGraph.
+
+Compara a lista original (``pop(0)`` + ``append``, O(n) por amostra) com o
+RingBuffer (``array`` e NumPy) em capacidades de 1k, 10k e 100k: custo por
+amostra adicionada e custo de obter a janela para desenhar. Não requer display.
+
+Uso:
+    python benchmarks/bench_ringbuffer.py [--samples 20000] [--capacities 1000 10000 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clivgui.optional import load_numpy  # noqa: E402
+from clivgui.ringbuffer import RingBuffer  # noqa: E402
+
+
+class ListSeries:
+    """Reprodução do formato original (lista com pop(0))"""
+
+    def __init__(self, capacity: int):
+        self.values = [0] * capacity
+
+    def append(self, value: float):
+        self.values.pop(0)
+        self.values.append(value)
+
+    def view(self):
+        return self.values
+
+
+def factories():
+    yield "lista (antigo)", ListSeries
+    yield "ring array", lambda n: RingBuffer(n, use_numpy=False)
+    if load_numpy() is not None:
+        yield "ring numpy", lambda n: RingBuffer(n, use_numpy=True)
+
+
+def measure(factory, capacity: int, samples: int):
+    series = factory(capacity)
+    append = series.append
+    start = time.perf_counter()
+    for i in range(samples):
+        append(i)
+    per_append = (time.perf_counter() - start) / samples
+
+    views = 1000
+    start = time.perf_counter()
+    for _ in range(views):
+        series.view()
+    per_view = (time.perf_counter() - start) / views
+    return per_append * 1e9, per_view * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--capacities", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'série':>14} {'capacidade':>10} {'ns/append':>10} {'ns/view':>9}")
+    for capacity in args.capacities:
+        for name, factory in factories():
+            per_append, per_view = measure(factory, capacity, args.samples)
+            print(f"{name:>14} {capacity:>10} {per_append:>10.1f} {per_view:>9.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
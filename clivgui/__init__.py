@@ -1 +1,68 @@
-from .cliv_gui import *
+"""
+ClivGui - Framework para menus GUI modernos e overlays transparentes
+
+Os componentes são carregados sob demanda: ``import clivgui`` não importa
+pygame, Pillow, psutil, keyboard nem pywin32. Cada dependência pesada só é
+carregada quando a classe que precisa dela é acessada pela primeira vez.
+"""
+
+import importlib
+import os
+
+# Silenciar mensagens do Pygame
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', "hide")
+
+# Nome público -> submódulo que o define
+_LAZY_ATTRS = {
+    'WidgetStyle': 'style',
+    'ProcessOverlay': 'overlay',
+    'NotificationManager': 'notifications',
+    'MessageBox': 'notifications',
+    'ProgressNotification': 'notifications',
+    'NotificationHistory': 'history',
+    'HistoryEntry': 'history',
+    'ClivMenu': 'menu',
+    'AudioPlayer': 'audio',
+    'AudioService': 'audio',
+    'ImageSeparator': 'widgets',
+    'ModernGraph': 'widgets',
+    'MultiSeriesGraph': 'widgets',
+    'DynamicColorPicker': 'widgets',
+    'ModernSlider': 'widgets',
+    'ModernCheck': 'widgets',
+    'KeyBind': 'widgets',
+    'ModernButton': 'widgets',
+    'RingBuffer': 'ringbuffer',
+    'AxisScaler': 'autoscale',
+    'MinMaxDecimator': 'decimate',
+    'LTTBDecimator': 'decimate',
+    'BackgroundCache': 'imagecache',
+    'CanvasParticleRenderer': 'particles',
+    'ImageParticleRenderer': 'particles',
+    'FrameGovernor': 'governor',
+    'GovernorPolicy': 'governor',
+    'QualityLevel': 'governor',
+    'FrameClock': 'clock',
+    'UIDispatcher': 'dispatch',
+    'AsyncBridge': 'aio',
+    'TaskExecutor': 'executor',
+    'Tweener': 'tween',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    # Cache no namespace do pacote: próximos acessos não passam por aqui
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,156 @@
+"""
+Integração do mainloop do Tk com asyncio.
+
+O Tk continua na thread principal e um event loop asyncio roda em uma thread
+própria. Nenhum dos dois fica consultando o outro: cada loop dorme no seu
+próprio seletor e é acordado pelo outro lado só quando há trabalho
+(``call_soon_threadsafe`` no asyncio, UIDispatcher no Tk).
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Optional, Callable, Any, Awaitable, Dict, List
+
+from .dispatch import UIDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBridge:
+    """Event loop asyncio em uma thread, ligado à thread do Tk"""
+
+    def __init__(self, dispatcher: UIDispatcher):
+        """
+        Args:
+            dispatcher: Fila da thread do Tk
+        """
+        self.dispatcher = dispatcher
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        # evento -> callbacks de espera (acesso só na thread do Tk)
+        self._waiters: Dict[str, List[Callable[[Any], None]]] = {}
+
+    @property
+    def running(self) -> bool:
+        return self.loop is not None and self.loop.is_running()
+
+    def start(self):
+        """Cria o event loop e a thread dele (idempotente)"""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.loop.call_soon(ready.set)
+            self.loop.run_forever()
+            # Encerramento: cancela o que sobrou e fecha o loop
+            tasks = [t for t in asyncio.all_tasks(self.loop) if not t.done()]
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name="cliv-asyncio", daemon=True)
+        self.thread.start()
+        ready.wait()
+
+    def stop(self, timeout: float = 2.0):
+        """Cancela as tarefas pendentes e encerra o loop"""
+        loop, thread = self.loop, self.thread
+        if loop is None or thread is None:
+            return
+        try:
+            loop.call_soon_threadsafe(loop.stop)
+        except RuntimeError:
+            # Loop já fechado
+            pass
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+        self.thread = None
+
+    def submit(self, coro: Awaitable) -> Future:
+        """Agenda uma coroutine no loop (de qualquer thread); retorna um Future"""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run_callback(self, callback: Callable, *args) -> Any:
+        """Chama um callback de widget; se ele for uma coroutine, agenda no loop"""
+        result = callback(*args)
+        if asyncio.iscoroutine(result):
+            self.schedule(result)
+        return result
+
+    def schedule(self, coro: Awaitable) -> Future:
+        """Como submit, mas erros da coroutine vão para o log"""
+        future = self.submit(coro)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    @staticmethod
+    def _log_failure(future: Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Erro em callback assíncrono", exc_info=future.exception())
+
+    async def call_ui(self, callback: Callable, *args) -> Any:
+        """Executa ``callback(*args)`` na thread do Tk e aguarda o resultado"""
+        future: Future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(callback(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+        self.dispatcher.post(run)
+        return await asyncio.wrap_future(future)
+
+    # ------------------------------------------------------------------
+    # Espera por eventos da interface
+    # ------------------------------------------------------------------
+
+    def emit(self, event: str, value: Any = None):
+        """Dispara um evento da interface (thread do Tk) para quem o aguarda"""
+        waiters = self._waiters.pop(event, None)
+        if waiters:
+            for waiter in waiters:
+                waiter(value)
+
+    async def wait_event(self, event: str) -> Any:
+        """Aguarda a próxima ocorrência de ``event`` (ex.: 'tab', 'click')"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(value):
+            loop.call_soon_threadsafe(_resolve, future, value)
+
+        self.dispatcher.post(self._add_waiter, event, resolve)
+        return await future
+
+    def _add_waiter(self, event: str, waiter: Callable[[Any], None]):
+        self._waiters.setdefault(event, []).append(waiter)
+
+    async def wait_hotkey(self, hotkey: str) -> str:
+        """Aguarda uma tecla de atalho global (requer o pacote keyboard)"""
+        import keyboard
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        handle = keyboard.add_hotkey(hotkey, lambda: loop.call_soon_threadsafe(
+            _resolve, future, hotkey))
+        try:
+            return await future
+        finally:
+            keyboard.remove_hotkey(handle)
+
+
+def _resolve(future: asyncio.Future, value: Any):
+    if not future.done():
+        future.set_result(value)
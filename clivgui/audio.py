@@ -0,0 +1,385 @@
+"""Serviço de áudio sob demanda e player baseado em pygame.mixer"""
+
+import logging
+import os
+import threading
+import tkinter as tk
+from typing import Optional, Dict, Any, TYPE_CHECKING
+
+from .profiling import traced_init
+from .style import WidgetStyle
+
+if TYPE_CHECKING:
+    from .menu import ClivMenu
+
+logger = logging.getLogger(__name__)
+
+AUDIO_BACKEND_ENV_VAR = "CLIVGUI_AUDIO_BACKEND"
+
+
+class _NullMusic:
+    """Substituto silencioso de pygame.mixer.music"""
+
+    def load(self, path: str):
+        pass
+
+    def play(self, loops: int = 0):
+        pass
+
+    def pause(self):
+        pass
+
+    def unpause(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def set_volume(self, volume: float):
+        pass
+
+    def get_busy(self) -> bool:
+        return False
+
+
+class AudioService:
+    """Inicializa o mixer do pygame apenas no primeiro uso"""
+
+    BACKENDS = ('auto', 'pygame', 'dummy', 'null')
+
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Args:
+            backend: 'auto' ou 'pygame' (pygame, cai para 'null' se falhar),
+                'dummy' (pygame com driver SDL sem dispositivo) ou 'null'
+                (sem áudio, não importa o pygame). None usa a variável de
+                ambiente CLIVGUI_AUDIO_BACKEND ou 'auto'.
+        """
+        backend = (backend or os.environ.get(AUDIO_BACKEND_ENV_VAR) or 'auto').lower()
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend de áudio inválido: {backend!r} "
+                             f"(use um de {', '.join(self.BACKENDS)})")
+
+        self.backend = backend
+        self.active_backend: Optional[str] = None
+        self.error: Optional[str] = None
+        self._mixer = None
+        self._music: Any = None
+        self._sounds: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def initialized(self) -> bool:
+        """True se o backend já foi inicializado"""
+        return self.active_backend is not None
+
+    @property
+    def available(self) -> bool:
+        """True se há um mixer real (pygame) ativo"""
+        return self.ensure() and self._mixer is not None
+
+    def ensure(self) -> bool:
+        """Inicializa o backend se ainda não foi; retorna True se há áudio real"""
+        if self.active_backend is not None:
+            return self._mixer is not None
+
+        with self._lock:
+            if self.active_backend is None:
+                self._init_backend()
+        return self._mixer is not None
+
+    def _init_backend(self):
+        """Inicializa o mixer conforme o backend escolhido"""
+        if self.backend == 'null':
+            self._use_null()
+            return
+
+        try:
+            if self.backend == 'dummy':
+                os.environ['SDL_AUDIODRIVER'] = 'dummy'
+            import pygame
+            pygame.mixer.init()
+            self._mixer = pygame.mixer
+            self._music = pygame.mixer.music
+            self.active_backend = self.backend
+        except Exception as e:
+            self.error = str(e)
+            logger.warning("Áudio indisponível (%s); usando backend nulo", e)
+            self._use_null()
+
+    def _use_null(self):
+        self._mixer = None
+        self._music = _NullMusic()
+        self.active_backend = 'null'
+
+    @property
+    def music(self):
+        """Interface de música (pygame.mixer.music ou substituto silencioso)"""
+        self.ensure()
+        return self._music
+
+    def play_sound(self, path: str, volume: float = 1.0) -> bool:
+        """Toca um efeito sonoro curto (ex.: som de notificação)"""
+        if not self.ensure():
+            return False
+        try:
+            sound = self._sounds.get(path)
+            if sound is None:
+                sound = self._mixer.Sound(path)
+                self._sounds[path] = sound
+            sound.set_volume(volume)
+            sound.play()
+            return True
+        except Exception as e:
+            logger.warning("Erro ao tocar som %r: %s", path, e)
+            return False
+
+    def shutdown(self):
+        """Para a música e libera o dispositivo (só se foi inicializado)"""
+        if self._mixer is None:
+            return
+        try:
+            self._music.stop()
+            self._mixer.quit()
+        except Exception:
+            pass
+        self._mixer = None
+        self._sounds.clear()
+        self.active_backend = None
+
+
+class AudioPlayer:
+    """Player de áudio integrado"""
+
+    @traced_init
+    def __init__(self, container: tk.Frame, menu_ref: "ClivMenu",
+                 audio_path: str = "music.mp3", autoplay: bool = False,
+                 loop: bool = True, style: Optional[WidgetStyle] = None):
+        """
+        Inicializa o player de áudio
+
+        Args:
+            container: Container pai
+            menu_ref: Referência ao menu CLIV
+            audio_path: Caminho do arquivo de áudio
+            autoplay: Reproduzir automaticamente
+            loop: Repetir em loop
+            style: Estilo customizado
+        """
+        self.menu = menu_ref
+        self.audio_path = audio_path
+        self.playing = False
+        self.loop = loop
+        self.volume = 0.5
+
+        if style is None:
+            style = WidgetStyle()
+
+        self.shell = tk.Frame(container, bg=style.bg_color,
+                             pady=style.padding[0], bd=0)
+
+        if style.pack:
+            self.shell.pack(fill='x', padx=style.padding[3], pady=style.margin[0])
+        else:
+            self.shell.place(x=style.x, y=style.y, width=style.width, height=style.height)
+
+        header_frame = tk.Frame(self.shell, bg=style.bg_color)
+        header_frame.pack(fill='x', pady=(0, 10))
+
+        tk.Label(header_frame, text="🎵 AUDIO PLAYER", fg=menu_ref.theme,
+                bg=style.bg_color, font=style.font).pack(side='left')
+
+        self.status_label = tk.Label(header_frame, text="●", fg="red",
+                                     bg=style.bg_color, font=("Arial", 8))
+        self.status_label.pack(side='right', padx=5)
+
+        controls_frame = tk.Frame(self.shell, bg=style.bg_color)
+        controls_frame.pack(fill='x')
+
+        self.play_btn = tk.Button(controls_frame, text="▶", bg=menu_ref.theme,
+                                  fg="white", font=("Arial", 12, "bold"), bd=0,
+                                  command=self.toggle_play, cursor="hand2", width=4,
+                                  activebackground=menu_ref.theme, relief='flat')
+        self.play_btn.pack(side='left', padx=2, ipady=5)
+
+        self.stop_btn = tk.Button(controls_frame, text="⏹", bg="#555",
+                                  fg="white", font=("Arial", 12, "bold"), bd=0,
+                                  command=self.stop_music, cursor="hand2", width=4,
+                                  activebackground="#444", relief='flat')
+        self.stop_btn.pack(side='left', padx=2, ipady=5)
+
+        self.loop_btn = tk.Button(controls_frame, text="🔁",
+                                  bg=menu_ref.theme if loop else "#555",
+                                  fg="white", font=("Arial", 10, "bold"), bd=0,
+                                  command=self.toggle_loop, cursor="hand2", width=4,
+                                  activebackground=menu_ref.theme, relief='flat')
+        self.loop_btn.pack(side='left', padx=2, ipady=5)
+
+        vol_frame = tk.Frame(self.shell, bg=style.bg_color)
+        vol_frame.pack(fill='x', pady=(10, 0))
+
+        tk.Label(vol_frame, text="🔊", bg=style.bg_color, fg="white",
+                font=("Arial", 10)).pack(side='left', padx=(0, 5))
+
+        self.vol_canvas = tk.Canvas(vol_frame, height=8, bg=style.bg_color,
+                                    highlightthickness=0, bd=0)
+        self.vol_canvas.pack(side='left', fill='x', expand=True)
+
+        self.vol_label = tk.Label(vol_frame, text="50%", bg=style.bg_color,
+                                 fg=menu_ref.theme, font=("Arial", 8, "bold"),
+                                 width=4)
+        self.vol_label.pack(side='right', padx=(5, 0))
+
+        self.vol_canvas.bind("<Button-1>", self.set_volume)
+        self.vol_canvas.bind("<B1-Motion>", self.set_volume)
+
+        self.shell.after(100, self.update_volume_bar)
+
+        if autoplay and os.path.exists(audio_path):
+            self.shell.after(500, self.play_music)
+
+    def update_volume_bar(self):
+        """Atualiza a barra de volume visual"""
+        try:
+            width = self.vol_canvas.winfo_width()
+            if width < 10:
+                self.shell.after(50, self.update_volume_bar)
+                return
+
+            self.vol_canvas.delete("all")
+            self.vol_canvas.create_rectangle(0, 2, width, 6, fill="#1a1a1a", outline="")
+
+            vol_width = int(width * self.volume)
+            self.vol_canvas.create_rectangle(0, 2, vol_width, 6,
+                                            fill=self.menu.theme, outline="")
+        except Exception:
+            pass
+
+    def set_volume(self, event):
+        """Define o volume baseado no clique"""
+        try:
+            width = self.vol_canvas.winfo_width()
+            x = max(0, min(event.x, width))
+            self.volume = x / width
+
+            if self.menu.audio.initialized:
+                self.menu.audio.music.set_volume(self.volume)
+            self.vol_label.config(text=f"{int(self.volume * 100)}%")
+            self.update_volume_bar()
+        except Exception:
+            pass
+
+    def toggle_play(self):
+        """Alterna entre play e pause"""
+        if self.playing:
+            self.pause_music()
+        else:
+            self.play_music()
+
+    def play_music(self):
+        """Inicia a música"""
+        try:
+            if not self.playing:
+                if os.path.exists(self.audio_path):
+                    music = self.menu.audio.music
+                    music.load(self.audio_path)
+                    music.set_volume(self.volume)
+                    music.play(-1 if self.loop else 0)
+
+                    self.playing = True
+                    self.play_btn.config(text="⏸")
+                    self.status_label.config(fg="lime")
+
+                    self.menu.show_notification(
+                        "Audio",
+                        f"Reproduzindo: {os.path.basename(self.audio_path)}",
+                        2000,
+                        "success"
+                    )
+                else:
+                    self.menu.show_notification(
+                        "Erro",
+                        f"Arquivo não encontrado: {self.audio_path}",
+                        3000,
+                        "error"
+                    )
+            else:
+                self.menu.audio.music.unpause()
+                self.playing = True
+                self.play_btn.config(text="⏸")
+                self.status_label.config(fg="lime")
+        except Exception as e:
+            self.menu.show_notification(
+                "Erro",
+                f"Erro ao reproduzir: {str(e)}",
+                3000,
+                "error"
+            )
+
+    def pause_music(self):
+        """Pausa a música"""
+        try:
+            if self.playing:
+                self.menu.audio.music.pause()
+                self.playing = False
+                self.play_btn.config(text="▶")
+                self.status_label.config(fg="yellow")
+        except Exception:
+            pass
+
+    def stop_music(self):
+        """Para a música completamente"""
+        try:
+            if self.menu.audio.initialized:
+                self.menu.audio.music.stop()
+            self.playing = False
+            self.play_btn.config(text="▶")
+            self.status_label.config(fg="red")
+
+            self.menu.show_notification(
+                "Audio",
+                "Reprodução parada",
+                2000,
+                "info"
+            )
+        except Exception:
+            pass
+
+    def toggle_loop(self):
+        """Alterna modo de repetição"""
+        self.loop = not self.loop
+
+        if self.loop:
+            self.loop_btn.config(bg=self.menu.theme)
+            self.menu.show_notification("Loop", "Repetição ativada", 2000, "info")
+        else:
+            self.loop_btn.config(bg="#555")
+            self.menu.show_notification("Loop", "Repetição desativada", 2000, "info")
+
+        if self.playing:
+            try:
+                self.menu.audio.music.stop()
+                self.menu.audio.music.play(-1 if self.loop else 0)
+            except Exception:
+                pass
+
+    def set_audio_file(self, path: str):
+        """Define um novo arquivo de áudio"""
+        was_playing = self.playing
+
+        if self.playing:
+            self.stop_music()
+
+        self.audio_path = path
+
+        if was_playing and os.path.exists(path):
+            self.play_music()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Retorna status atual"""
+        return {
+            'playing': self.playing,
+            'loop': self.loop,
+            'volume': self.volume,
+            'file': self.audio_path
+        }
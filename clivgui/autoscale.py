@@ -0,0 +1,188 @@
+"""
+Escala automática do eixo Y dos gráficos.
+
+Modos:
+
+- ``fixed``: faixa fixa (padrão 0-120, o comportamento original).
+- ``window``: mínimo e máximo da janela visível, mantidos com deques
+  monotônicas (O(1) amortizado por amostra, sem varrer o buffer).
+- ``percentile``: faixa entre dois percentis da janela (ignora picos
+  isolados); recalculada no redesenho, no máximo a cada 1/20 da janela.
+
+A faixa é arredondada para números "redondos" (1, 2, 5 x 10^n), então ela, e
+os rótulos do eixo, só mudam quando os dados saem da faixa atual.
+"""
+
+import math
+from collections import deque
+from typing import Optional, Tuple, Iterable, Sequence, Any
+
+from .optional import load_numpy
+
+AUTOSCALE_MODES = ('fixed', 'window', 'percentile')
+
+
+def nice_step(span: float) -> float:
+    """Menor passo 1/2/5 x 10^n que divide ``span`` em até ~4 intervalos"""
+    if span <= 0:
+        return 1.0
+    raw = span / 4
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            return factor * magnitude
+    return 10 * magnitude
+
+
+def nice_range(low: float, high: float) -> Tuple[float, float]:
+    """Expande [low, high] para múltiplos de um passo redondo"""
+    if high <= low:
+        pad = abs(high) * 0.1 or 1.0
+        low, high = low - pad, high + pad
+    step = nice_step(high - low)
+    return math.floor(low / step) * step, math.ceil(high / step) * step
+
+
+class SlidingMinMax:
+    """Mínimo e máximo das últimas ``capacity`` amostras em O(1) amortizado"""
+
+    def __init__(self, capacity: int, fill: float = 0.0):
+        """
+        Args:
+            capacity: Tamanho da janela
+            fill: Valor das posições ainda não gravadas
+        """
+        self.capacity = capacity
+        self.reset(fill)
+
+    def reset(self, fill: float = 0.0):
+        # (seq, valor); o preenchimento inteiro é representado pela posição -1
+        self._seq = 0
+        self._min: deque = deque([(-1, fill)])
+        self._max: deque = deque([(-1, fill)])
+
+    def push(self, value: float):
+        seq = self._seq
+        self._seq = seq + 1
+        expired = seq - self.capacity
+
+        mins = self._min
+        while mins and mins[-1][1] >= value:
+            mins.pop()
+        mins.append((seq, value))
+        if mins[0][0] <= expired:
+            mins.popleft()
+
+        maxs = self._max
+        while maxs and maxs[-1][1] <= value:
+            maxs.pop()
+        maxs.append((seq, value))
+        if maxs[0][0] <= expired:
+            maxs.popleft()
+
+    def extend(self, values: Iterable[float]):
+        values = list(values)
+        if len(values) > self.capacity:
+            # O resto sairia da janela antes de ser consultado
+            self._seq += len(values) - self.capacity
+            values = values[-self.capacity:]
+            self._min.clear()
+            self._max.clear()
+        push = self.push
+        for value in values:
+            push(value)
+
+    @property
+    def min(self) -> float:
+        return self._min[0][1]
+
+    @property
+    def max(self) -> float:
+        return self._max[0][1]
+
+
+class AxisScaler:
+    """Faixa do eixo Y de um gráfico conforme o modo de escala"""
+
+    def __init__(self, mode: str = 'fixed', capacity: int = 50,
+                 y_range: Tuple[float, float] = (0, 120),
+                 percentiles: Tuple[float, float] = (5, 95),
+                 use_numpy: Optional[bool] = None):
+        """
+        Args:
+            mode: 'fixed', 'window' ou 'percentile'
+            capacity: Tamanho da janela do gráfico
+            y_range: Faixa do modo 'fixed'
+            percentiles: Percentis inferior e superior do modo 'percentile'
+            use_numpy: Percentis com NumPy (None = se instalado; só no modo 'percentile')
+        """
+        if mode not in AUTOSCALE_MODES:
+            raise ValueError(f"Modo de escala inválido: {mode!r} (use {AUTOSCALE_MODES})")
+        if y_range[1] <= y_range[0]:
+            raise ValueError("y_range deve ser (mínimo, máximo) com máximo > mínimo")
+        self.mode = mode
+        self.capacity = capacity
+        self.y_range = y_range
+        self.percentiles = percentiles
+        self.window = SlidingMinMax(capacity) if mode == 'window' else None
+        # Só o modo percentil usa o NumPy; os outros nem o importam
+        self._np = load_numpy(use_numpy) if mode == 'percentile' else None
+        self._range = y_range if mode == 'fixed' else nice_range(0.0, 0.0)
+        # Amostras desde o último cálculo de percentis (começa forçando um)
+        self._pending = capacity
+        self._bounds: Tuple[float, float] = (0.0, 0.0)
+        self._recompute_every = max(1, capacity // 20)
+
+    def push(self, value: float):
+        if self.window is not None:
+            self.window.push(value)
+        self._pending += 1
+
+    def extend(self, values: Sequence[float], count: int):
+        """Registra ``count`` amostras (``values`` só é lido no modo 'window')"""
+        if self.window is not None:
+            self.window.extend(values)
+        self._pending += count
+
+    def reset(self):
+        if self.window is not None:
+            self.window.reset()
+        self._pending = self.capacity
+
+    def bounds(self, view: Any) -> Tuple[float, float]:
+        """Mínimo e máximo dos dados conforme o modo, sem arredondar"""
+        if self.mode == 'window':
+            return self.window.min, self.window.max
+        if self.mode == 'percentile':
+            if self._pending >= self._recompute_every:
+                self._pending = 0
+                self._bounds = self._percentiles(view)
+            return self._bounds
+        return self.y_range
+
+    def range(self, view: Any) -> Tuple[float, float]:
+        """Faixa atual; ``view`` é a janela do gráfico (usada no modo percentil)"""
+        if self.mode != 'fixed':
+            self.fit(*self.bounds(view))
+        return self._range
+
+    def fit(self, low: float, high: float) -> Tuple[float, float]:
+        """Ajusta a faixa a [low, high], mantendo a atual enquanto os dados couberem"""
+        current_low, current_high = self._range
+        if current_low <= low and high <= current_high:
+            # Encolhe só quando os dados ocupam menos de 1/4 da faixa
+            if (high - low) * 4 >= current_high - current_low:
+                return self._range
+        self._range = nice_range(low, high)
+        return self._range
+
+    def _percentiles(self, view: Any) -> Tuple[float, float]:
+        lower, upper = self.percentiles
+        np = self._np
+        if np is not None:
+            low, high = np.percentile(view, (lower, upper))
+            return float(low), float(high)
+        ordered = sorted(view)
+        last = len(ordered) - 1
+        return (ordered[int(round(last * lower / 100))],
+                ordered[int(round(last * upper / 100))])
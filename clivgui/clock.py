@@ -0,0 +1,154 @@
+"""
+Relógio de frames compartilhado por todas as animações de uma janela raiz.
+
+Em vez de cada componente manter sua própria cadeia de ``after``, os
+componentes registram callbacks de tick no ``FrameClock`` da raiz, que
+despacha todos os callbacks vencidos em um único ``after`` por frame. Sem
+nada registrado, o relógio para: um menu ocioso não acorda o Tk.
+"""
+
+import math
+import sys
+import time
+import tkinter as tk
+from typing import Optional, Callable, List
+
+# Atributo da janela raiz que guarda o relógio dela
+_ROOT_ATTR = "_cliv_frame_clock"
+
+# Tolerância para despachar um callback que vence logo em seguida (segundos)
+_EARLY_TOLERANCE = 0.002
+
+
+class FrameHandle:
+    """Registro de um callback no relógio; use ``cancel()`` para removê-lo"""
+
+    __slots__ = ('callback', 'interval_ms', 'due', 'active', '_clock')
+
+    def __init__(self, clock: "FrameClock", callback: Callable[[], Optional[bool]],
+                 interval_ms: int, due: float):
+        self._clock = clock
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self.due = due
+        self.active = True
+
+    def cancel(self):
+        """Remove o callback do relógio (idempotente)"""
+        self.active = False
+
+
+class FrameClock:
+    """Agendador central de ticks de animação de uma janela raiz do Tk"""
+
+    def __init__(self, root: tk.Misc, interval_ms: int = 16):
+        """
+        Args:
+            root: Janela raiz (tk.Tk) dona do relógio
+            interval_ms: Intervalo padrão entre ticks de um callback
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self.frames = 0
+        self.dispatched = 0
+        self._handles: List[FrameHandle] = []
+        self._after_id: Optional[str] = None
+        self._wake_at = 0.0
+        self._closed = False
+
+    @classmethod
+    def for_widget(cls, widget: tk.Misc) -> "FrameClock":
+        """Retorna (criando se preciso) o relógio da janela raiz do widget"""
+        root = widget._root()
+        clock = getattr(root, _ROOT_ATTR, None)
+        if clock is None or clock._closed:
+            clock = cls(root)
+            setattr(root, _ROOT_ATTR, clock)
+        return clock
+
+    @property
+    def running(self) -> bool:
+        """True enquanto há um frame agendado"""
+        return self._after_id is not None
+
+    def __len__(self) -> int:
+        return sum(1 for h in self._handles if h.active)
+
+    def add(self, callback: Callable[[], Optional[bool]],
+            interval_ms: Optional[int] = None) -> FrameHandle:
+        """
+        Registra um callback chamado a cada ``interval_ms``.
+
+        O callback pode retornar ``False`` para se remover. Exceções também
+        removem o callback, sem afetar os demais, e são reportadas em
+        ``root.report_callback_exception`` (traceback no stderr por padrão).
+        """
+        interval = self.interval_ms if interval_ms is None else interval_ms
+        due = time.perf_counter() + interval / 1000
+        handle = FrameHandle(self, callback, interval, due)
+        self._handles.append(handle)
+        self._schedule(due)
+        return handle
+
+    def _schedule(self, due: float):
+        """Garante um frame agendado até ``due``"""
+        if self._closed:
+            return
+        if self._after_id is not None:
+            if due >= self._wake_at:
+                return
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+        delay = max(1, math.ceil((due - time.perf_counter()) * 1000))
+        try:
+            self._after_id = self.root.after(delay, self._tick)
+            self._wake_at = due
+        except Exception:
+            # Janela raiz destruída
+            self._closed = True
+            self._handles.clear()
+
+    def _tick(self):
+        """Despacha todos os callbacks vencidos e agenda o próximo frame"""
+        self._after_id = None
+        self.frames += 1
+        now = time.perf_counter()
+        horizon = now + _EARLY_TOLERANCE
+
+        for handle in list(self._handles):
+            if not handle.active or handle.due > horizon:
+                continue
+
+            handle.due += handle.interval_ms / 1000
+            if handle.due < now:
+                # Atrasado: não acumular ticks perdidos
+                handle.due = now + handle.interval_ms / 1000
+
+            self.dispatched += 1
+            try:
+                if handle.callback() is False:
+                    handle.active = False
+            except Exception:
+                handle.active = False
+                self.root.report_callback_exception(*sys.exc_info())
+
+        self._handles = [h for h in self._handles if h.active]
+        if self._handles:
+            self._schedule(min(h.due for h in self._handles))
+
+    def stop(self):
+        """Cancela todos os callbacks e o frame agendado"""
+        for handle in self._handles:
+            handle.active = False
+        self._handles.clear()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self._closed = True
@@ -0,0 +1,248 @@
+"""
+Redução de séries longas para a largura do canvas antes de desenhar.
+
+Quando a janela tem muito mais amostras que o gráfico tem pixels, desenhar um
+segmento por amostra gasta CPU e some com picos (vários segmentos no mesmo
+pixel). Dois estágios reduzem a série a ~uma coluna por pixel:
+
+- ``minmax``: envelope mínimo/máximo de cada coluna (preserva todos os picos).
+- ``lttb``: Largest-Triangle-Three-Buckets, um ponto por coluna escolhido
+  pela maior área de triângulo com os vizinhos (preserva a forma da curva).
+
+Os baldes são alinhados ao número absoluto da amostra (``seq // tamanho``), não
+à posição na janela: quando a janela desliza, os baldes antigos continuam
+válidos. Cada amostra nova só atualiza o último balde; baldes que saem da
+janela são descartados pela esquerda.
+"""
+
+import math
+from collections import deque
+from typing import Optional, List, Tuple, Any
+
+from .ringbuffer import RingBuffer
+
+DECIMATION_MODES = ('minmax', 'lttb')
+
+# Pontos da série reduzida: (índices na janela, valores)
+Points = Tuple[List[float], List[float]]
+
+
+class _Decimator:
+    """
+    Base: sincroniza com o RingBuffer consumindo só as amostras novas
+
+    Subclasses definem ``_feed(seq, valor)`` (chamado por ``_sync``) e
+    ``points(buffer)``.
+    """
+
+    def __init__(self, capacity: int, columns: int):
+        """
+        Args:
+            capacity: Capacidade do buffer da série
+            columns: Colunas (pixels) disponíveis para desenhar
+        """
+        self.capacity = capacity
+        self.columns = columns
+        self.bucket_size = max(1, math.ceil(capacity / max(1, columns)))
+        self._seen = 0
+        # Amostras processadas na última sincronização (para medir)
+        self.last_fed = 0
+        self._buckets: deque = deque()
+        self._current: Optional[list] = None
+
+    def _stale(self, written: int) -> bool:
+        """Primeira chamada, reset do buffer ou salto maior que a janela"""
+        new = written - self._seen
+        return new < 0 or new >= self.capacity or self._current is None
+
+    def _sync(self, buffer: RingBuffer) -> Tuple[Any, int]:
+        """Processa as amostras gravadas desde a última chamada"""
+        view = buffer.view()
+        written = buffer.written
+        start = written - self.capacity
+        new = written - self._seen
+        if self._stale(written):
+            self._buckets.clear()
+            self._current = None
+            new = self.capacity
+        self.last_fed = new
+        if new:
+            feed = self._feed
+            first = self.capacity - new
+            for i in range(first, self.capacity):
+                feed(start + i, view[i])
+        self._seen = written
+
+        # Descarta baldes que saíram inteiros da janela
+        size, buckets = self.bucket_size, self._buckets
+        while buckets and (buckets[0][0] + 1) * size <= start:
+            buckets.popleft()
+        return view, start
+
+
+class MinMaxDecimator(_Decimator):
+    """Envelope mínimo/máximo por coluna"""
+
+    def _feed(self, seq: int, value: float):
+        # [balde, mínimo, seq do mínimo, máximo, seq do máximo]
+        bucket = seq // self.bucket_size
+        current = self._current
+        if current is None or current[0] != bucket:
+            if current is not None:
+                self._buckets.append(current)
+            self._current = [bucket, value, seq, value, seq]
+            return
+        if value < current[1]:
+            current[1] = value
+            current[2] = seq
+        elif value > current[3]:
+            current[3] = value
+            current[4] = seq
+
+    def _refresh_head(self, view: Any, start: int):
+        """Recalcula o balde mais antigo se o mínimo/máximo dele já saiu da janela"""
+        head = self._buckets[0] if self._buckets else self._current
+        if head is None or (head[2] >= start and head[4] >= start):
+            return
+        end = min((head[0] + 1) * self.bucket_size - start, self.capacity)
+        lo_i = hi_i = 0
+        for i in range(1, end):
+            if view[i] < view[lo_i]:
+                lo_i = i
+            elif view[i] > view[hi_i]:
+                hi_i = i
+        head[1:] = [view[lo_i], start + lo_i, view[hi_i], start + hi_i]
+
+    def points(self, buffer: RingBuffer) -> Points:
+        view, start = self._sync(buffer)
+        self._refresh_head(view, start)
+        xs: List[float] = []
+        ys: List[float] = []
+        add_x, add_y = xs.append, ys.append
+        for bucket in (*self._buckets, self._current):
+            _, lo, lo_seq, hi, hi_seq = bucket
+            # Na ordem em que ocorreram, para a linha subir e descer certo
+            if lo_seq == hi_seq:
+                add_x(lo_seq - start)
+                add_y(lo)
+            elif lo_seq < hi_seq:
+                add_x(lo_seq - start)
+                add_y(lo)
+                add_x(hi_seq - start)
+                add_y(hi)
+            else:
+                add_x(hi_seq - start)
+                add_y(hi)
+                add_x(lo_seq - start)
+                add_y(lo)
+        return xs, ys
+
+
+class LTTBDecimator(_Decimator):
+    """Largest-Triangle-Three-Buckets com baldes finalizados em cache"""
+
+    def __init__(self, capacity: int, columns: int):
+        super().__init__(capacity, columns)
+        # Última seleção finalizada (âncora do próximo balde)
+        self._anchor: Optional[Tuple[int, float]] = None
+        self._view: Any = None
+        self._start = 0
+
+    def _feed(self, seq: int, value: float):
+        # [balde, soma, quantidade, seq escolhido, valor escolhido]
+        bucket = seq // self.bucket_size
+        current = self._current
+        if current is None or current[0] != bucket:
+            if current is not None:
+                self._buckets.append(current)
+                # O penúltimo balde agora tem o seguinte completo: finaliza
+                if len(self._buckets) >= 2:
+                    self._finalize(self._buckets[-2], self._buckets[-1])
+            self._current = [bucket, value, 1, None, None]
+            return
+        current[1] += value
+        current[2] += 1
+
+    def _sync(self, buffer: RingBuffer) -> Tuple[Any, int]:
+        # _finalize lê a janela atual durante o processamento
+        self._view = buffer.view()
+        self._start = buffer.written - self.capacity
+        if self._stale(buffer.written):
+            self._anchor = None
+        return super()._sync(buffer)
+
+    def _select(self, bucket: list, anchor: Tuple[int, float],
+                next_x: float, next_y: float) -> Tuple[int, float]:
+        """Ponto do balde com maior triângulo (âncora, ponto, média seguinte)"""
+        view, start, size = self._view, self._start, self.bucket_size
+        first = max(bucket[0] * size, start)
+        last = min((bucket[0] + 1) * size, start + self.capacity)
+        if first >= last:
+            return anchor
+        ax, ay = anchor
+        best_seq, best_val, best_area = first, view[first - start], -1.0
+        for seq in range(first, last):
+            v = view[seq - start]
+            area = abs((ax - next_x) * (v - ay) - (ax - seq) * (next_y - ay))
+            if area > best_area:
+                best_seq, best_val, best_area = seq, v, area
+        return best_seq, best_val
+
+    def _finalize(self, bucket: list, following: list):
+        anchor = self._anchor
+        if anchor is None:
+            anchor = (self._start, self._view[0])
+        size = self.bucket_size
+        next_x = following[0] * size + (following[2] - 1) / 2
+        next_y = following[1] / following[2]
+        bucket[3], bucket[4] = self._select(bucket, anchor, next_x, next_y)
+        self._anchor = (bucket[3], bucket[4])
+
+    def points(self, buffer: RingBuffer) -> Points:
+        view, start = self._sync(buffer)
+        xs: List[float] = [0]
+        ys: List[float] = [view[0]]
+        anchor = (start, view[0])
+        pending = None
+        for bucket in self._buckets:
+            if bucket[3] is None:
+                pending = bucket
+            elif bucket[3] > start:
+                xs.append(bucket[3] - start)
+                ys.append(bucket[4])
+                anchor = (bucket[3], bucket[4])
+
+        # Balde completo ainda sem o seguinte completo: escolhe com a média parcial
+        current = self._current
+        if pending is not None:
+            size = self.bucket_size
+            next_x = current[0] * size + (current[2] - 1) / 2
+            seq, value = self._select(pending, anchor, next_x, current[1] / current[2])
+            xs.append(seq - start)
+            ys.append(value)
+
+        last = self.capacity - 1
+        if xs[-1] != last:
+            xs.append(last)
+            ys.append(view[last])
+        return xs, ys
+
+
+def create_decimator(mode: Optional[str], capacity: int,
+                     columns: int) -> Optional[_Decimator]:
+    """
+    Cria o estágio de redução, ou None se a série já cabe nas colunas
+
+    Args:
+        mode: 'minmax', 'lttb' ou None (sem redução)
+        capacity: Capacidade do buffer da série
+        columns: Largura do gráfico em pixels
+    """
+    if mode is None:
+        return None
+    if mode not in DECIMATION_MODES:
+        raise ValueError(f"Redução inválida: {mode!r} (use {DECIMATION_MODES} ou None)")
+    if mode == 'minmax':
+        # Dois pontos por coluna: só compensa com mais de duas amostras por pixel
+        return MinMaxDecimator(capacity, columns) if capacity > 2 * columns else None
+    return LTTBDecimator(capacity, columns) if capacity > columns else None
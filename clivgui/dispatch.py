@@ -0,0 +1,243 @@
+"""
+Fila de despacho thread-safe para a thread do Tk.
+
+Threads de trabalho não podem tocar widgets do Tk. Elas enfileiram callbacks
+com ``post`` (um ``deque``: ``append``/``popleft`` são atômicos, sem lock) e a
+thread do Tk executa a fila em lotes, uma vez por frame, respeitando um
+orçamento de tempo por frame. Com a fila vazia nada é agendado: a primeira
+postagem acorda o Tk com um evento virtual.
+"""
+
+import functools
+import itertools
+import logging
+import threading
+import time
+import tkinter as tk
+from collections import deque
+from typing import Optional, Callable, Dict, Any
+
+from .clock import FrameClock, FrameHandle
+
+logger = logging.getLogger(__name__)
+
+# Atributo da janela raiz que guarda o despachante dela
+_ROOT_ATTR = "_cliv_dispatcher"
+
+# Evento virtual usado para acordar a thread do Tk
+WAKE_EVENT = "<<ClivWake>>"
+
+
+class UIDispatcher:
+    """Executa na thread do Tk callbacks postados por qualquer thread"""
+
+    def __init__(self, root: tk.Misc, budget_ms: float = 8.0, interval_ms: int = 16):
+        """
+        Deve ser criado na thread do Tk.
+
+        Args:
+            root: Janela raiz (tk.Tk)
+            budget_ms: Tempo máximo gasto com a fila por frame
+            interval_ms: Intervalo entre frames enquanto houver fila
+        """
+        self.root = root
+        self.clock = FrameClock.for_widget(root)
+        self.budget_ms = budget_ms
+        self.interval_ms = interval_ms
+        self.thread_id = threading.get_ident()
+
+        self._queue: deque = deque()
+        self._posted = itertools.count(1)
+        self._last_posted = 0
+        self._scheduled = False
+        self._handle: Optional[FrameHandle] = None
+        # True depois do primeiro frame do mainloop: só então event_generate
+        # de outra thread funciona (antes, o Tkinter espera ~1 s e falha)
+        self._loop_ready = False
+        self._ready_handle: Optional[FrameHandle] = None
+
+        self.executed = 0
+        self.errors = 0
+        self.frames = 0
+        self.over_budget = 0
+        self.max_depth = 0
+        self.last_depth = 0
+        self.max_drain_ms = 0.0
+
+        root.bind(WAKE_EVENT, self._on_wake, add='+')
+
+        # Tcl sem threads não aceita event_generate de outra thread:
+        # nesse caso a fila é verificada a cada frame
+        self._polling = not self._tcl_threaded()
+        if self._polling:
+            self._handle = self.clock.add(self._poll, interval_ms)
+        else:
+            self._watch_loop()
+
+    @classmethod
+    def for_widget(cls, widget: tk.Misc) -> "UIDispatcher":
+        """Retorna (criando se preciso) o despachante da janela raiz do widget"""
+        root = widget._root()
+        dispatcher = getattr(root, _ROOT_ATTR, None)
+        if dispatcher is None or dispatcher.clock._closed:
+            dispatcher = cls(root)
+            setattr(root, _ROOT_ATTR, dispatcher)
+        return dispatcher
+
+    @staticmethod
+    def of(widget: tk.Misc) -> Optional["UIDispatcher"]:
+        """Despachante já existente da janela raiz do widget (sem criar)"""
+        try:
+            return getattr(widget._root(), _ROOT_ATTR, None)
+        except Exception:
+            return None
+
+    def _tcl_threaded(self) -> bool:
+        try:
+            return bool(int(self.root.tk.eval("set tcl_platform(threaded)")))
+        except Exception:
+            return False
+
+    @property
+    def in_ui_thread(self) -> bool:
+        """True se chamado na thread do Tk"""
+        return threading.get_ident() == self.thread_id
+
+    @property
+    def depth(self) -> int:
+        """Callbacks aguardando na fila"""
+        return len(self._queue)
+
+    def post(self, callback: Callable, *args):
+        """Enfileira ``callback(*args)`` para a thread do Tk (qualquer thread)"""
+        self._queue.append((callback, args))
+        self._last_posted = next(self._posted)
+        if not self._scheduled:
+            self._scheduled = True
+            self._wake()
+
+    def call(self, callback: Callable, *args):
+        """Executa agora se estiver na thread do Tk; senão, enfileira"""
+        if self.in_ui_thread:
+            return callback(*args)
+        self.post(callback, *args)
+        return None
+
+    def _wake(self):
+        if self._polling:
+            return
+        if self.in_ui_thread:
+            self._ensure_draining()
+            return
+        if not self._loop_ready:
+            # mainloop ainda não rodou: _loop_started esvazia a fila no
+            # primeiro frame (_scheduled fica True, sem novas tentativas)
+            return
+        try:
+            self.root.event_generate(WAKE_EVENT, when='tail')
+        except Exception:
+            # mainloop encerrado (ou janela destruída): ninguém atende o
+            # evento. A fila fica para o próximo frame da thread do Tk
+            self._loop_ready = False
+
+    def _watch_loop(self):
+        """Agenda _loop_started para o próximo frame (thread do Tk)"""
+        if self._ready_handle is None or not self._ready_handle.active:
+            self._ready_handle = self.clock.add(self._loop_started, 1)
+
+    def _loop_started(self) -> bool:
+        """Primeiro frame do mainloop: entrega o que foi postado antes dele"""
+        self._loop_ready = True
+        if self._queue:
+            self._on_wake()
+        return False
+
+    def _on_wake(self, event=None):
+        if self._drain() is not False:
+            self._ensure_draining()
+
+    def _ensure_draining(self):
+        if not self._loop_ready and not self._polling:
+            # Postagens da própria thread do Tk antes do mainloop (ou depois de
+            # uma falha do wake): o próximo frame volta a aceitar event_generate
+            self._watch_loop()
+        if self._handle is None or not self._handle.active:
+            self._handle = self.clock.add(self._drain, self.interval_ms)
+
+    def _poll(self):
+        if self._queue:
+            self._drain()
+        return None
+
+    def _drain(self) -> Optional[bool]:
+        """Executa a fila até esvaziar ou estourar o orçamento do frame"""
+        queue = self._queue
+        depth = len(queue)
+        if depth:
+            self.frames += 1
+            self.last_depth = depth
+            if depth > self.max_depth:
+                self.max_depth = depth
+
+            started = time.perf_counter()
+            deadline = started + self.budget_ms / 1000
+            while True:
+                try:
+                    callback, args = queue.popleft()
+                except IndexError:
+                    break
+                try:
+                    callback(*args)
+                except Exception:
+                    self.errors += 1
+                    logger.exception("Erro em callback despachado para a thread do Tk")
+                self.executed += 1
+                if time.perf_counter() >= deadline:
+                    if queue:
+                        self.over_budget += 1
+                    break
+
+            elapsed = (time.perf_counter() - started) * 1000
+            if elapsed > self.max_drain_ms:
+                self.max_drain_ms = elapsed
+
+        if queue or self._polling:
+            return None
+
+        self._scheduled = False
+        # Postagem entre o esvaziamento e a flag: continua agendado
+        if queue:
+            self._scheduled = True
+            return None
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        """Métricas da fila"""
+        return {
+            'posted': self._last_posted,
+            'executed': self.executed,
+            'depth': len(self._queue),
+            'max_depth': self.max_depth,
+            'last_depth': self.last_depth,
+            'frames': self.frames,
+            'over_budget_frames': self.over_budget,
+            'max_drain_ms': self.max_drain_ms,
+            'errors': self.errors,
+        }
+
+
+def ui_thread(method: Callable) -> Callable:
+    """
+    Torna um método de widget seguro para chamar de qualquer thread.
+
+    Fora da thread do Tk a chamada é enfileirada no despachante da janela
+    (e retorna None); na thread do Tk, ou sem despachante, roda direto.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        dispatcher = UIDispatcher.of(self.shell)
+        if dispatcher is None or dispatcher.in_ui_thread:
+            return method(self, *args, **kwargs)
+        dispatcher.post(functools.partial(method, self, *args, **kwargs))
+        return None
+    return wrapper
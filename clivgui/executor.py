@@ -0,0 +1,300 @@
+"""
+Pool de trabalho gerenciado pelo menu.
+
+Tarefas rodam em um pool de threads (ou de processos, para trabalho pesado de
+CPU) e o resultado é entregue na thread do Tk pelo UIDispatcher, então o
+``on_done`` pode mexer em widgets. Laços periódicos (monitores, timers) usam
+``loop`` em vez de ``threading.Thread`` soltas. Ao fechar o menu tudo é
+cancelado: tarefas na fila não rodam, laços param e nenhum resultado chega a
+uma janela destruída.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Callable, Dict, Any, List, Set, TYPE_CHECKING
+
+from .dispatch import UIDispatcher
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class TaskStats:
+    """Tempos acumulados das tarefas de um mesmo nome"""
+
+    __slots__ = ('submitted', 'completed', 'failed', 'cancelled',
+                 'total_ms', 'max_ms', 'last_ms', 'wait_ms')
+
+    def __init__(self):
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        # Tempo total na fila antes de começar (só no pool de threads)
+        self.wait_ms = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'cancelled': self.cancelled,
+            'avg_ms': self.total_ms / finished if finished else 0.0,
+            'max_ms': self.max_ms,
+            'last_ms': self.last_ms,
+            'avg_wait_ms': self.wait_ms / finished if finished else 0.0,
+        }
+
+
+class LoopHandle:
+    """Laço periódico criado por TaskExecutor.loop()"""
+
+    def __init__(self, name: str, interval_ms: int):
+        self.name = name
+        # Pode ser alterado com o laço rodando (vale a partir da próxima espera)
+        self.interval_ms = interval_ms
+        self.stopped = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        return self.thread is not None and self.thread.is_alive() and not self.stopped.is_set()
+
+    def cancel(self):
+        """Para o laço (a iteração em andamento termina normalmente)"""
+        self.stopped.set()
+
+
+class TaskExecutor:
+    """Pools de threads e processos com entrega de resultados na thread do Tk"""
+
+    def __init__(self, dispatcher: UIDispatcher, max_workers: int = 4,
+                 max_processes: Optional[int] = None):
+        """
+        Args:
+            dispatcher: Fila da thread do Tk
+            max_workers: Threads do pool
+            max_processes: Processos do pool de processos (None = núcleos da CPU);
+                o pool só é criado na primeira tarefa com ``process=True``
+        """
+        self.dispatcher = dispatcher
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+        # Sinalizado no shutdown; tarefas longas podem consultar ``stopping.is_set()``
+        self.stopping = threading.Event()
+
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional["ProcessPoolExecutor"] = None
+        self._pending: Set[Future] = set()
+        self._loops: List[LoopHandle] = []
+        self._stats: Dict[str, TaskStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def closed(self) -> bool:
+        return self.stopping.is_set()
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(self.max_workers, thread_name_prefix="cliv-worker")
+        return self._threads
+
+    def _process_pool(self) -> "ProcessPoolExecutor":
+        if self._processes is None:
+            # multiprocessing só é importado por quem usa process=True
+            from concurrent.futures import ProcessPoolExecutor
+            self._processes = ProcessPoolExecutor(self.max_processes)
+        return self._processes
+
+    def _task_stats(self, name: str) -> TaskStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = TaskStats()
+        return stats
+
+    def submit(self, fn: Callable, *args,
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               process: bool = False, name: Optional[str] = None) -> Future:
+        """
+        Executa ``fn(*args)`` em segundo plano
+
+        Args:
+            fn: Função a executar (com ``process=True``, deve ser picklable)
+            on_done: Recebe o resultado, na thread do Tk
+            on_error: Recebe a exceção, na thread do Tk (sem ele, vai para o log)
+            process: Usa o pool de processos em vez do de threads
+            name: Nome da tarefa nas estatísticas (padrão: nome da função)
+
+        Returns:
+            Future da tarefa; ``cancel()`` impede a execução se ainda na fila
+        """
+        if self.closed:
+            raise RuntimeError("TaskExecutor já foi encerrado")
+
+        name = name or getattr(fn, '__qualname__', None) or repr(fn)
+        submitted = time.perf_counter()
+        timing = [submitted, submitted]  # [início da execução, fim]
+
+        if process:
+            future = self._process_pool().submit(fn, *args)
+        else:
+            def run():
+                timing[0] = time.perf_counter()
+                try:
+                    return fn(*args)
+                finally:
+                    timing[1] = time.perf_counter()
+            future = self._thread_pool().submit(run)
+
+        with self._lock:
+            self._task_stats(name).submitted += 1
+            self._pending.add(future)
+
+        def finished(f: Future):
+            if process:
+                # Sem acesso ao processo: conta do envio até a conclusão
+                timing[1] = time.perf_counter()
+            self._finish(f, name, submitted, timing, on_done, on_error)
+
+        future.add_done_callback(finished)
+        return future
+
+    def _finish(self, future: Future, name: str, submitted: float, timing: List[float],
+                on_done: Optional[Callable[[Any], None]],
+                on_error: Optional[Callable[[BaseException], None]]):
+        """Contabiliza a tarefa e entrega o resultado (thread do pool)"""
+        with self._lock:
+            self._pending.discard(future)
+            stats = self._task_stats(name)
+            if future.cancelled():
+                stats.cancelled += 1
+                return
+            elapsed = (timing[1] - timing[0]) * 1000
+            stats.last_ms = elapsed
+            stats.total_ms += elapsed
+            stats.wait_ms += (timing[0] - submitted) * 1000
+            if elapsed > stats.max_ms:
+                stats.max_ms = elapsed
+            error = future.exception()
+            if error is None:
+                stats.completed += 1
+            else:
+                stats.failed += 1
+
+        # Menu fechado: não há mais widgets para receber o resultado
+        if self.closed:
+            return
+        if error is None:
+            if on_done is not None:
+                self.dispatcher.post(on_done, future.result())
+        elif on_error is not None:
+            self.dispatcher.post(on_error, error)
+        else:
+            logger.error("Erro na tarefa %s", name, exc_info=error)
+
+    def loop(self, fn: Callable[[], Any], interval_ms: int,
+             on_done: Optional[Callable[[Any], None]] = None,
+             name: Optional[str] = None) -> LoopHandle:
+        """
+        Chama ``fn()`` a cada ``interval_ms`` em uma thread própria até cancelar
+
+        Substitui os laços ``while True`` + ``time.sleep`` em threads soltas:
+        a espera é interrompida na hora pelo shutdown do menu. Erros vão para
+        o log e o laço continua.
+
+        Args:
+            fn: Função de cada iteração
+            interval_ms: Pausa entre iterações
+            on_done: Recebe o retorno de cada iteração, na thread do Tk
+            name: Nome do laço nas estatísticas
+        """
+        if self.closed:
+            raise RuntimeError("TaskExecutor já foi encerrado")
+
+        name = name or getattr(fn, '__qualname__', None) or repr(fn)
+        handle = LoopHandle(name, interval_ms)
+
+        def run():
+            stopped, stopping = handle.stopped, self.stopping
+            while not stopped.is_set() and not stopping.is_set():
+                started = time.perf_counter()
+                try:
+                    result = fn()
+                    error = None
+                except Exception as e:
+                    result, error = None, e
+                elapsed = (time.perf_counter() - started) * 1000
+
+                with self._lock:
+                    stats = self._task_stats(name)
+                    stats.submitted += 1
+                    stats.last_ms = elapsed
+                    stats.total_ms += elapsed
+                    if elapsed > stats.max_ms:
+                        stats.max_ms = elapsed
+                    if error is None:
+                        stats.completed += 1
+                    else:
+                        stats.failed += 1
+
+                if error is not None:
+                    logger.error("Erro no laço %s", name, exc_info=error)
+                elif on_done is not None and not stopping.is_set():
+                    self.dispatcher.post(on_done, result)
+                # Espera interrompível (cancel ou shutdown acordam na hora)
+                if stopped.wait(handle.interval_ms / 1000):
+                    break
+
+        handle.thread = threading.Thread(target=run, name=f"cliv-loop-{name}", daemon=True)
+        with self._lock:
+            self._loops = [h for h in self._loops if h.active]
+            self._loops.append(handle)
+        handle.thread.start()
+        return handle
+
+    def shutdown(self, wait: bool = False, timeout: float = 1.0):
+        """
+        Cancela tarefas na fila, para os laços e encerra os pools
+
+        Tarefas já em execução não são interrompidas; o resultado delas é
+        descartado. Com ``wait=True`` aguarda os laços por até ``timeout``.
+        """
+        if self.closed:
+            return
+        self.stopping.set()
+
+        with self._lock:
+            pending = list(self._pending)
+            loops = list(self._loops)
+        for future in pending:
+            future.cancel()
+        for handle in loops:
+            handle.cancel()
+
+        if self._threads is not None:
+            self._threads.shutdown(wait=wait)
+        if self._processes is not None:
+            self._processes.shutdown(wait=wait)
+        if wait:
+            for handle in loops:
+                if handle.thread is not None and handle.thread is not threading.current_thread():
+                    handle.thread.join(timeout)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Estatísticas por nome de tarefa (contagens e tempos em ms)"""
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    @property
+    def pending(self) -> int:
+        """Tarefas na fila ou em execução"""
+        return len(self._pending)
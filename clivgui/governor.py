@@ -0,0 +1,179 @@
+"""Governador adaptativo de qualidade das animações"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional, Callable, List, Dict, Any, Tuple
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """Um nível de qualidade das animações"""
+    name: str
+    particle_fraction: float  # fração das partículas ativas (0.0 a 1.0)
+    animation_scale: float  # multiplicador dos delays de animação (>= 1.0)
+    overlay_poll_ms: int  # intervalo de acompanhamento do ProcessOverlay
+
+
+DEFAULT_LEVELS: Tuple[QualityLevel, ...] = (
+    QualityLevel("high", 1.0, 1.0, 16),
+    QualityLevel("medium", 0.5, 1.5, 33),
+    QualityLevel("low", 0.2, 2.0, 50),
+    QualityLevel("minimal", 0.0, 3.0, 100),
+)
+
+
+@dataclass
+class GovernorPolicy:
+    """Limites configuráveis do governador"""
+    frame_budget_ms: float = 30.0  # intervalo esperado entre frames
+    overload_ratio: float = 1.5  # intervalo médio > budget * ratio = sobrecarga
+    cost_ratio: float = 0.5  # custo médio do callback > budget * ratio = sobrecarga
+    headroom_ratio: float = 1.15  # intervalo médio < budget * ratio = folga
+    window: int = 30  # frames considerados na média
+    downgrade_after: int = 15  # frames seguidos em sobrecarga para reduzir a qualidade
+    upgrade_after: int = 150  # frames seguidos com folga para restaurar a qualidade
+    levels: Tuple[QualityLevel, ...] = field(default=DEFAULT_LEVELS)
+
+
+class FrameGovernor:
+    """Mede intervalos reais de frame e custo dos callbacks e ajusta a qualidade"""
+
+    def __init__(self, policy: Optional[GovernorPolicy] = None):
+        """
+        Args:
+            policy: Limites e níveis de qualidade (padrão: GovernorPolicy())
+        """
+        self.policy = policy or GovernorPolicy()
+        if not self.policy.levels:
+            raise ValueError("GovernorPolicy.levels não pode ser vazio")
+
+        self.level_index = 0
+        self.changes = 0
+        self._intervals: deque = deque(maxlen=self.policy.window)
+        self._costs: deque = deque(maxlen=self.policy.window)
+        self._over = 0
+        self._under = 0
+        self._last_frame: Optional[float] = None
+        self._listeners: List[Callable[[QualityLevel], None]] = []
+        self._overlays: List[Any] = []
+
+    @property
+    def level(self) -> QualityLevel:
+        """Nível de qualidade atual"""
+        return self.policy.levels[self.level_index]
+
+    def add_listener(self, callback: Callable[[QualityLevel], None]):
+        """Registra uma função chamada a cada mudança de nível"""
+        self._listeners.append(callback)
+
+    def attach_overlay(self, overlay):
+        """Passa a controlar o intervalo de acompanhamento de um ProcessOverlay"""
+        self._overlays.append(overlay)
+        overlay.poll_interval = self.level.overlay_poll_ms
+
+    def detach_overlay(self, overlay):
+        if overlay in self._overlays:
+            self._overlays.remove(overlay)
+
+    def animation_delay(self, base_ms: int) -> int:
+        """Delay de um passo de animação ajustado ao nível atual"""
+        return int(base_ms * self.level.animation_scale)
+
+    def frame_started(self):
+        """Marca o início de um frame: mede o intervalo desde o anterior"""
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self._intervals.append((now - self._last_frame) * 1000)
+        self._last_frame = now
+        return now
+
+    def frame_finished(self, started: float):
+        """Marca o fim do callback do frame iniciado em ``started`` e reavalia"""
+        self._costs.append((time.perf_counter() - started) * 1000)
+        self._evaluate()
+
+    def reset_clock(self):
+        """Descarta o último instante (ex.: menu oculto, loop pausado)"""
+        self._last_frame = None
+
+    def record(self, interval_ms: float, cost_ms: float):
+        """Registra manualmente um frame (intervalo e custo em ms)"""
+        self._intervals.append(interval_ms)
+        self._costs.append(cost_ms)
+        self._evaluate()
+
+    def _averages(self) -> Tuple[float, float]:
+        intervals = sum(self._intervals) / len(self._intervals) if self._intervals else 0.0
+        costs = sum(self._costs) / len(self._costs) if self._costs else 0.0
+        return intervals, costs
+
+    def _evaluate(self):
+        policy = self.policy
+        if len(self._intervals) < min(policy.window, policy.downgrade_after):
+            return
+
+        interval, cost = self._averages()
+        budget = policy.frame_budget_ms
+        overloaded = interval > budget * policy.overload_ratio or cost > budget * policy.cost_ratio
+        headroom = interval < budget * policy.headroom_ratio and cost < budget * policy.cost_ratio / 2
+
+        if overloaded:
+            self._over += 1
+            self._under = 0
+            if self._over >= policy.downgrade_after:
+                self._set_level(self.level_index + 1)
+        elif headroom:
+            self._under += 1
+            self._over = 0
+            if self._under >= policy.upgrade_after:
+                self._set_level(self.level_index - 1)
+        else:
+            self._over = 0
+            self._under = 0
+
+    def _set_level(self, index: int):
+        index = max(0, min(index, len(self.policy.levels) - 1))
+        self._over = 0
+        self._under = 0
+        if index == self.level_index:
+            return
+
+        self.level_index = index
+        self.changes += 1
+        # Nova janela de medição: o nível anterior não representa o atual
+        self._intervals.clear()
+        self._costs.clear()
+
+        level = self.level
+        for overlay in list(self._overlays):
+            overlay.poll_interval = level.overlay_poll_ms
+        for callback in list(self._listeners):
+            try:
+                callback(level)
+            except Exception:
+                pass
+
+    def set_level(self, name: str):
+        """Força um nível pelo nome"""
+        for i, level in enumerate(self.policy.levels):
+            if level.name == name:
+                self._set_level(i)
+                return
+        raise ValueError(f"Nível de qualidade desconhecido: {name!r}")
+
+    def report(self) -> Dict[str, Any]:
+        """Retorna o estado atual do governador"""
+        interval, cost = self._averages()
+        level = self.level
+        return {
+            'level': level.name,
+            'level_index': self.level_index,
+            'particle_fraction': level.particle_fraction,
+            'animation_scale': level.animation_scale,
+            'overlay_poll_ms': level.overlay_poll_ms,
+            'avg_frame_interval_ms': interval,
+            'avg_callback_cost_ms': cost,
+            'frame_budget_ms': self.policy.frame_budget_ms,
+            'changes': self.changes,
+        }
@@ -0,0 +1,248 @@
+"""
+Histórico de notificações em buffer circular de tamanho fixo.
+
+Cada notificação (exibida ou descartada pela fila) é gravada em arrays
+pré-alocados: gravar é O(1), sem crescer memória, e as mais antigas são
+sobrescritas quando o buffer enche. O painel de histórico só é montado
+quando a aba é aberta.
+"""
+
+import threading
+import time
+import tkinter as tk
+from array import array
+from typing import Optional, List, Dict, Iterable, NamedTuple
+
+
+class HistoryEntry(NamedTuple):
+    """Uma notificação registrada"""
+    seq: int  # número sequencial (cresce sempre, também após sobrescrever)
+    timestamp: float  # time.time()
+    notification_type: str
+    title: str
+    message: str
+    repeat: int
+    dropped: bool  # descartada pela fila (rate limit ou fila cheia)
+
+
+class NotificationHistory:
+    """Buffer circular thread-safe das últimas ``capacity`` notificações"""
+
+    def __init__(self, capacity: int = 500):
+        """
+        Args:
+            capacity: Quantidade máxima de notificações guardadas
+        """
+        if capacity < 1:
+            raise ValueError("capacity deve ser >= 1")
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self._timestamps = array('d', [0.0]) * capacity
+        self._repeats = array('l', [0]) * capacity
+        self._dropped = bytearray(capacity)
+        self._types: List[Optional[str]] = [None] * capacity
+        self._titles: List[Optional[str]] = [None] * capacity
+        self._messages: List[Optional[str]] = [None] * capacity
+        # Total já gravado; a próxima posição é _written % capacity
+        self._written = 0
+        # Seqs abaixo deste ficaram para trás em clear() (_written nunca volta)
+        self._cleared = 0
+        self._changes = 0
+
+    def __len__(self) -> int:
+        return self._written - self._first()
+
+    def _first(self) -> int:
+        """Menor seq ainda guardado (nem sobrescrito nem apagado)"""
+        return max(self._cleared, self._written - self.capacity)
+
+    @property
+    def version(self) -> int:
+        """Muda a cada gravação ou repetição (para atualizar painéis)"""
+        return self._changes
+
+    def record(self, title: str, message: str, notification_type: str = "info",
+               repeat: int = 1, dropped: bool = False,
+               timestamp: Optional[float] = None) -> int:
+        """
+        Grava uma notificação em O(1)
+
+        Returns:
+            Número sequencial da entrada (para ``add_repeats``)
+        """
+        with self.lock:
+            seq = self._written
+            i = seq % self.capacity
+            self._timestamps[i] = time.time() if timestamp is None else timestamp
+            self._types[i] = notification_type
+            self._titles[i] = title
+            self._messages[i] = message
+            self._repeats[i] = repeat
+            self._dropped[i] = dropped
+            self._written = seq + 1
+            self._changes += 1
+        return seq
+
+    def add_repeats(self, seq: int, count: int = 1) -> bool:
+        """Soma repetições a uma entrada; False se ela já foi sobrescrita"""
+        with self.lock:
+            if seq < self._first() or seq >= self._written:
+                return False
+            self._repeats[seq % self.capacity] += count
+            self._changes += 1
+        return True
+
+    def _entry(self, seq: int) -> HistoryEntry:
+        i = seq % self.capacity
+        return HistoryEntry(seq, self._timestamps[i], self._types[i], self._titles[i],
+                            self._messages[i], self._repeats[i], bool(self._dropped[i]))
+
+    def query(self, types: Optional[Iterable[str]] = None,
+              since: Optional[float] = None, until: Optional[float] = None,
+              limit: Optional[int] = None) -> List[HistoryEntry]:
+        """
+        Retorna entradas da mais recente para a mais antiga
+
+        Args:
+            types: Tipos aceitos ('info', 'warning'...); None = todos
+            since: Timestamp mínimo (time.time())
+            until: Timestamp máximo
+            limit: Quantidade máxima de entradas
+        """
+        wanted = set(types) if types is not None else None
+        result: List[HistoryEntry] = []
+        with self.lock:
+            first = self._first()
+            for seq in range(self._written - 1, first - 1, -1):
+                i = seq % self.capacity
+                ts = self._timestamps[i]
+                if until is not None and ts > until:
+                    continue
+                # Timestamps crescem com seq: nada mais antigo interessa
+                if since is not None and ts < since:
+                    break
+                if wanted is not None and self._types[i] not in wanted:
+                    continue
+                result.append(self._entry(seq))
+                if limit is not None and len(result) >= limit:
+                    break
+        return result
+
+    def counts_by_type(self) -> Dict[str, int]:
+        """Quantidade de notificações (com repetições) por tipo"""
+        counts: Dict[str, int] = {}
+        with self.lock:
+            for seq in range(self._first(), self._written):
+                i = seq % self.capacity
+                counts[self._types[i]] = counts.get(self._types[i], 0) + self._repeats[i]
+        return counts
+
+    def clear(self):
+        with self.lock:
+            self._cleared = self._written
+            self._changes += 1
+            for i in range(self.capacity):
+                self._titles[i] = self._messages[i] = self._types[i] = None
+
+
+class HistoryPanel:
+    """Lista do histórico dentro de um container (montada no primeiro refresh)"""
+
+    TYPE_COLORS = {
+        'info': '#3498db',
+        'success': '#2ecc71',
+        'warning': '#f39c12',
+        'error': '#e74c3c'
+    }
+
+    def __init__(self, container: tk.Frame, history: NotificationHistory,
+                 theme: str = "#8e44ad", bg_color: str = "#05050a", limit: int = 100):
+        """
+        Args:
+            container: Container pai (ex.: frame de uma aba)
+            history: Histórico exibido
+            theme: Cor do tema
+            bg_color: Cor de fundo
+            limit: Entradas mostradas (as mais recentes)
+        """
+        self.container = container
+        self.history = history
+        self.theme = theme
+        self.bg_color = bg_color
+        self.limit = limit
+        self.type_filter: Optional[str] = None
+        self.text: Optional[tk.Text] = None
+        self._filter_buttons: Dict[Optional[str], tk.Label] = {}
+        self._shown_version = -1
+
+    def _build(self):
+        bar = tk.Frame(self.container, bg=self.bg_color)
+        bar.pack(fill='x', padx=10, pady=(10, 5))
+
+        for key, label in ((None, "TODAS"), ('info', "INFO"), ('success', "OK"),
+                           ('warning', "AVISO"), ('error', "ERRO")):
+            btn = tk.Label(bar, text=label, bg="#1a1a1a", fg="gray",
+                           font=("Arial", 7, "bold"), padx=6, pady=3, cursor="hand2")
+            btn.pack(side='left', padx=(0, 4))
+            btn.bind("<Button-1>", lambda e, k=key: self.set_filter(k))
+            self._filter_buttons[key] = btn
+
+        clear_btn = tk.Label(bar, text="LIMPAR", bg="#1a1a1a", fg="white",
+                             font=("Arial", 7, "bold"), padx=6, pady=3, cursor="hand2")
+        clear_btn.pack(side='right')
+        clear_btn.bind("<Button-1>", lambda e: self._clear())
+
+        self.text = tk.Text(self.container, bg="#0a0a15", fg="white", bd=0,
+                            highlightthickness=0, font=("Consolas", 8), height=30,
+                            wrap='word', cursor="arrow")
+        self.text.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        for name, color in self.TYPE_COLORS.items():
+            self.text.tag_configure(name, foreground=color)
+        self.text.tag_configure("time", foreground="gray")
+        self.text.tag_configure("dropped", foreground="#555")
+        self.text.config(state='disabled')
+        self._paint_filter()
+
+    def set_filter(self, notification_type: Optional[str]):
+        """Mostra só um tipo (None = todos)"""
+        self.type_filter = notification_type
+        self._shown_version = -1
+        self._paint_filter()
+        self.refresh()
+
+    def _paint_filter(self):
+        for key, btn in self._filter_buttons.items():
+            btn.config(fg=self.theme if key == self.type_filter else "gray")
+
+    def _clear(self):
+        self.history.clear()
+        self._shown_version = -1
+        self.refresh()
+
+    def refresh(self):
+        """Monta o painel (na primeira vez) e redesenha se o histórico mudou"""
+        if self.text is None:
+            self._build()
+
+        version = self.history.version
+        if version == self._shown_version:
+            return
+        self._shown_version = version
+
+        types = None if self.type_filter is None else (self.type_filter,)
+        entries = self.history.query(types=types, limit=self.limit)
+
+        text = self.text
+        text.config(state='normal')
+        text.delete("1.0", "end")
+        if not entries:
+            text.insert("end", "Nenhuma notificação registrada.", "time")
+        for entry in entries:
+            stamp = time.strftime("%H:%M:%S", time.localtime(entry.timestamp))
+            text.insert("end", f"{stamp}  ", "time")
+            title = entry.title.upper()
+            if entry.repeat > 1:
+                title += f"  ×{entry.repeat}"
+            text.insert("end", title, "dropped" if entry.dropped else entry.notification_type)
+            text.insert("end", f"\n{entry.message}\n\n")
+        text.config(state='disabled')
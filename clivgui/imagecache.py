@@ -0,0 +1,232 @@
+"""
+Cache em disco da imagem de fundo já processada do ClivMenu.
+
+A imagem é armazenada já redimensionada e escurecida, como pixels brutos
+(RGB/RGBA), para que as próximas inicializações não precisem decodificar,
+redimensionar nem aplicar o brilho novamente.
+
+Aquecer o cache antes da primeira execução:
+    python -m clivgui.imagecache wallpaper.png --size 450x720
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+from typing import Optional, Tuple, Iterable, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+BACKGROUND_BRIGHTNESS = 0.15
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Incrementar quando o processamento ou o formato do arquivo mudar
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4s4sII")
+_MAGIC = b"CLIV"
+_SUFFIX = ".raw"
+
+
+def default_cache_dir() -> str:
+    """Diretório padrão do cache (CLIVGUI_CACHE_DIR tem prioridade)"""
+    env_dir = os.environ.get("CLIVGUI_CACHE_DIR")
+    if env_dir:
+        return env_dir
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "clivgui", "backgrounds")
+
+
+def process_background(path: str, size: Tuple[int, int],
+                       brightness: float = BACKGROUND_BRIGHTNESS) -> "Image.Image":
+    """Abre, redimensiona (LANCZOS) e escurece a imagem de fundo"""
+    from PIL import Image, ImageEnhance
+
+    img = Image.open(path).resize(size, Image.Resampling.LANCZOS)
+    img = ImageEnhance.Brightness(img).enhance(brightness)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    return img
+
+
+class BackgroundCache:
+    """Cache em disco, endereçado por conteúdo, de imagens de fundo processadas"""
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Diretório do cache (padrão: default_cache_dir())
+            max_bytes: Tamanho máximo total; entradas menos usadas são removidas
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, path: str, size: Tuple[int, int],
+            brightness: float = BACKGROUND_BRIGHTNESS) -> str:
+        """Chave da entrada: caminho, mtime, tamanho do arquivo, dimensões e brilho"""
+        st = os.stat(path)
+        raw = "|".join((
+            os.path.abspath(path),
+            str(st.st_mtime_ns),
+            str(st.st_size),
+            f"{size[0]}x{size[1]}",
+            repr(float(brightness)),
+            str(_FORMAT_VERSION),
+        ))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + _SUFFIX)
+
+    def get(self, path: str, size: Tuple[int, int],
+            brightness: float = BACKGROUND_BRIGHTNESS) -> Optional["Image.Image"]:
+        """Retorna a imagem do cache ou None se não existir/estiver corrompida"""
+        try:
+            entry = self._entry_path(self.key(path, size, brightness))
+            with open(entry, "rb") as fh:
+                data = fh.read()
+        except OSError:
+            return None
+
+        try:
+            from PIL import Image
+
+            magic, mode, width, height = _HEADER.unpack_from(data)
+            mode = mode.rstrip(b"\0").decode("ascii")
+            if magic != _MAGIC or (width, height) != tuple(size):
+                return None
+            img = Image.frombytes(mode, (width, height), data[_HEADER.size:])
+        except Exception:
+            return None
+
+        # Atualizar mtime: a remoção descarta primeiro as entradas menos usadas
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return img
+
+    def put(self, path: str, size: Tuple[int, int], image: "Image.Image",
+            brightness: float = BACKGROUND_BRIGHTNESS) -> bool:
+        """Grava uma imagem processada no cache (escrita atômica)"""
+        try:
+            entry = self._entry_path(self.key(path, size, brightness))
+            os.makedirs(self.cache_dir, exist_ok=True)
+            header = _HEADER.pack(_MAGIC, image.mode.encode("ascii"),
+                                  image.width, image.height)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(header)
+                    fh.write(image.tobytes())
+                os.replace(tmp, entry)
+            except Exception:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                raise
+        except Exception:
+            return False
+
+        self.evict()
+        return True
+
+    def load(self, path: str, size: Tuple[int, int],
+             brightness: float = BACKGROUND_BRIGHTNESS) -> "Image.Image":
+        """Retorna a imagem processada, usando o cache quando possível"""
+        img = self.get(path, size, brightness)
+        if img is not None:
+            self.hits += 1
+            return img
+
+        self.misses += 1
+        img = process_background(path, size, brightness)
+        self.put(path, size, img, brightness)
+        return img
+
+    def warm(self, paths: Iterable[str], size: Tuple[int, int],
+             brightness: float = BACKGROUND_BRIGHTNESS) -> int:
+        """Processa antecipadamente as imagens ainda fora do cache; retorna quantas"""
+        warmed = 0
+        for path in paths:
+            if self.get(path, size, brightness) is None:
+                self.put(path, size, process_background(path, size, brightness), brightness)
+                warmed += 1
+        return warmed
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """Lista (mtime, tamanho, caminho) das entradas do cache"""
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            full = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, full))
+        return entries
+
+    def size_bytes(self) -> int:
+        """Tamanho total ocupado pelo cache"""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove as entradas menos usadas até respeitar max_bytes"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, full in sorted(entries):
+            try:
+                os.remove(full)
+                total -= size
+            except OSError:
+                continue
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        """Remove todas as entradas do cache"""
+        for _, _, full in self._entries():
+            try:
+                os.remove(full)
+            except OSError:
+                pass
+
+
+def warm_background_cache(paths: Iterable[str], size: Tuple[int, int] = (450, 720),
+                          brightness: float = BACKGROUND_BRIGHTNESS,
+                          cache: Optional[BackgroundCache] = None) -> int:
+    """Aquece o cache padrão (ou o informado) para as imagens e dimensões dadas"""
+    return (cache or BackgroundCache()).warm(paths, size, brightness)
+
+
+def _main(argv: Optional[List[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Aquece o cache de fundos do ClivGui")
+    parser.add_argument("paths", nargs="+", help="Imagens de fundo")
+    parser.add_argument("--size", default="450x720", help="Dimensões do menu (LxA)")
+    parser.add_argument("--brightness", type=float, default=BACKGROUND_BRIGHTNESS)
+    parser.add_argument("--cache-dir", default=None)
+    args = parser.parse_args(argv)
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    cache = BackgroundCache(args.cache_dir)
+    warmed = cache.warm(args.paths, (width, height), args.brightness)
+    print(f"{warmed} imagem(ns) processada(s) em {cache.cache_dir}")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,865 @@
+"""Menu principal CLIV"""
+
+import logging
+import os
+import threading
+import time
+import tkinter as tk
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from contextlib import nullcontext
+from typing import Optional, Tuple, Dict, Any, Union, Callable, Sequence, Awaitable, TYPE_CHECKING
+
+from .audio import AudioService
+from .clock import FrameClock, FrameHandle
+from .dispatch import UIDispatcher
+from .executor import TaskExecutor
+from .governor import FrameGovernor, GovernorPolicy, QualityLevel
+from .history import HistoryPanel
+from .imagecache import BackgroundCache, process_background
+from .notifications import NotificationManager, MessageBox, ProgressNotification
+from .particles import ParticleRenderer, create_particle_renderer
+from .profiling import StartupProfiler, profiling_requested
+from .tween import Tweener
+
+if TYPE_CHECKING:
+    from PIL import Image
+    from .aio import AsyncBridge
+
+logger = logging.getLogger(__name__)
+
+
+class ClivMenu:
+    """Menu principal CLIV melhorado"""
+
+    def __init__(self, title: str = "CLIV1 EXTREME", theme_color: str = "#8e44ad",
+                 bg_img_path: Optional[str] = None, width: int = 450, height: int = 720,
+                 part_color: str = "white", part_count: int = 40,
+                 part_speed: Tuple[float, float] = (0.2, 0.8),
+                 enable_tray_icon: bool = False, tray_icon_path: Optional[str] = None,
+                 enable_tabs: bool = True, profile_startup: Optional[bool] = None,
+                 bg_cache: Union[bool, BackgroundCache] = True,
+                 bg_async: bool = True, bg_load_timeout: float = 10.0,
+                 audio_backend: Optional[str] = None,
+                 particle_backend: str = "canvas",
+                 governor: Union[bool, GovernorPolicy] = True,
+                 notif_pool_size: int = 4,
+                 notif_max_visible: Optional[int] = None,
+                 notif_rate_limit: Optional[Tuple[int, float]] = None,
+                 notif_mode: str = "windows",
+                 notif_history_size: int = 500,
+                 workers: int = 4,
+                 worker_processes: Optional[int] = None):
+        """
+        Inicializa o menu CLIV
+
+        Args:
+            title: Título da janela
+            theme_color: Cor do tema
+            bg_img_path: Caminho para imagem de fundo
+            width: Largura da janela
+            height: Altura da janela
+            part_color: Cor das partículas
+            part_count: Quantidade de partículas
+            part_speed: Range de velocidade das partículas
+            enable_tray_icon: Habilita ícone na bandeja
+            tray_icon_path: Caminho para ícone da bandeja
+            enable_tabs: Habilita sistema de abas
+            profile_startup: Registra o tempo de cada fase da inicialização
+                (None = usa a variável de ambiente CLIVGUI_PROFILE_STARTUP)
+            bg_cache: Cache em disco da imagem de fundo processada
+                (True = cache padrão, False = desativado, ou um BackgroundCache)
+            bg_async: Processa a imagem de fundo em uma thread; o menu aparece
+                com a cor de fundo e a imagem entra quando estiver pronta
+            bg_load_timeout: Tempo máximo (segundos) de espera pela imagem
+            audio_backend: Backend de áudio ('auto', 'pygame', 'dummy', 'null');
+                o mixer só é inicializado no primeiro som tocado
+            particle_backend: 'canvas' (uma oval por partícula) ou 'image'
+                (todas as partículas em um único PhotoImage por frame)
+            governor: Reduz partículas e taxa das animações quando a máquina
+                está sobrecarregada (True, False ou uma GovernorPolicy)
+            notif_pool_size: Janelas de notificação pré-criadas e reutilizadas
+            notif_max_visible: Ativa a fila de notificações com no máximo N na
+                tela; repetições viram contador e o excesso vira um resumo
+            notif_rate_limit: (quantidade, segundos) de notificações aceitas
+                por origem no modo com fila
+            notif_mode: 'windows' (uma janela por notificação) ou 'stack'
+                (todas as notificações em uma única janela)
+            notif_history_size: Notificações guardadas no histórico
+                (0 = desativado); veja add_history_tab
+            workers: Threads do pool de tarefas em segundo plano (submit)
+            worker_processes: Processos do pool de processos (None = núcleos
+                da CPU; criado só no primeiro submit com process=True)
+        """
+        self.startup_profiler: Optional[StartupProfiler] = (
+            StartupProfiler() if profiling_requested(profile_startup) else None
+        )
+
+        with self._phase("tk_root"):
+            self.root = tk.Tk()
+        if self.startup_profiler:
+            self.startup_profiler.attach(self.root)
+
+        # Relógio único de animações desta janela raiz
+        self.clock = FrameClock.for_widget(self.root)
+        self.tweener = Tweener.for_widget(self.root)
+        # Fila para chamadas vindas de outras threads (post/call_soon_threadsafe)
+        self.dispatcher = UIDispatcher.for_widget(self.root)
+        # Loop asyncio (criado no primeiro uso: run_async, callbacks async)
+        self._aio: Optional["AsyncBridge"] = None
+        # Tarefas em segundo plano (cancelado em _on_close)
+        self.executor = TaskExecutor(self.dispatcher, workers, worker_processes)
+        self._particle_handle: Optional[FrameHandle] = None
+        self._alpha = 1.0
+
+        self.theme = theme_color
+        self.bg_color = "#05050a"
+        self.data: Dict[str, Any] = {}
+        self.abas: Dict[str, Dict] = {}
+        self.botoes_abas: Dict[str, tk.Button] = {}
+        self.aba_atual: Optional[str] = None
+        self.aberto = True
+        self.bg_img_path = bg_img_path
+        if bg_cache is True:
+            bg_cache = BackgroundCache()
+        self.bg_cache: Optional[BackgroundCache] = bg_cache or None
+        self.bg_async = bg_async
+        self.bg_load_timeout = bg_load_timeout
+        # 'none', 'pending', 'ready', 'error' ou 'timeout'
+        self.bg_status = 'none'
+        self.bg_photo = None
+        self.bg_image: Optional["Image.Image"] = None
+        self.title = title
+        self.width = width
+        self.height = height
+        self.enable_tabs = enable_tabs
+
+        self.p_color = part_color
+        self.p_count = part_count
+        self.p_speed_range = part_speed
+        self.particle_backend = particle_backend
+        self.particle_renderer: Optional[ParticleRenderer] = None
+
+        self.governor: Optional[FrameGovernor] = None
+        if governor:
+            self.governor = FrameGovernor(governor if isinstance(governor, GovernorPolicy) else None)
+            self.governor.add_listener(self._on_quality_change)
+
+        self.notif_manager = NotificationManager(self.governor, pool_size=notif_pool_size,
+                                                 max_visible=notif_max_visible,
+                                                 rate_limit=notif_rate_limit,
+                                                 dispatcher=self.dispatcher,
+                                                 mode=notif_mode,
+                                                 history_size=notif_history_size)
+        if self.notif_manager.queued:
+            self.notif_manager.start_queue(self.root)
+        # Pré-cria as janelas do pool quando o menu ficar ocioso
+        self.root.after_idle(self.notif_manager.warm_up)
+
+        self.enable_tray = enable_tray_icon
+        self.tray_icon_path = tray_icon_path
+        self.tray_icon = None
+        self.tray_thread = None
+
+        # Container principal direto (sem abas por padrão)
+        self.main_container = None
+
+        # Mixer inicializado sob demanda (AudioPlayer ou som de notificação)
+        self.audio = AudioService(audio_backend)
+
+        with self._phase("setup_main_ui"):
+            self._setup_main_ui(title)
+
+        with self._phase("init_particles"):
+            self._init_particles()
+
+        if self.enable_tray:
+            with self._phase("init_tray_icon"):
+                self._init_tray_icon()
+
+    def _phase(self, name: str):
+        """Retorna o context manager de uma fase do trace (no-op se desativado)"""
+        if self.startup_profiler is None:
+            return nullcontext()
+        return self.startup_profiler.phase(name)
+
+    def startup_report(self) -> Optional[Dict[str, Any]]:
+        """Retorna o relatório de inicialização (None se o trace estiver desativado)"""
+        if self.startup_profiler is None:
+            return None
+        return self.startup_profiler.report()
+
+    def _setup_main_ui(self, title: str):
+        """Configura a interface principal"""
+        self.root.geometry(f"{self.width}x{self.height}")
+        self.root.overrideredirect(True)
+        self.root.attributes("-topmost", True)
+        self.root.config(bg=self.bg_color)
+
+        # Canvas de fundo
+        self.bg_canvas = tk.Canvas(self.root, highlightthickness=0,
+                                   bg=self.bg_color, bd=0)
+        self.bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
+
+        # Carregar imagem de fundo se especificada
+        if self.bg_img_path and os.path.exists(self.bg_img_path):
+            with self._phase("background_image"):
+                self._load_background_image()
+
+        # Header
+        self.header = tk.Frame(self.root, bg=self.theme, height=35, bd=0)
+        self.header.pack(fill='x', side='top')
+        self.header.pack_propagate(False)
+
+        tk.Label(self.header, text=title, bg=self.theme, fg="white",
+                font=("Impact", 11)).pack(side='left', padx=15)
+
+        min_btn = tk.Button(self.header, text="−", command=self.toggle_visibility,
+                           bg=self.theme, fg="white", bd=0, width=5,
+                           activebackground="#555", cursor="hand2")
+        min_btn.pack(side='right', fill='y')
+
+        close_btn = tk.Button(self.header, text="✕", command=self._on_close,
+                             bg=self.theme, fg="white", bd=0, width=5,
+                             activebackground="#ff4444", cursor="hand2")
+        close_btn.pack(side='right', fill='y')
+
+        self.header.bind("<Button-1>", self._start_move)
+        self.header.bind("<B1-Motion>", self._on_move)
+
+        # Barra de abas (opcional)
+        if self.enable_tabs:
+            self.tab_bar = tk.Frame(self.root, bg="#000", height=35, bd=0)
+            self.tab_bar.pack(fill='x', side='top')
+            self.tab_bar.pack_propagate(False)
+
+            self.container_principal = tk.Frame(self.root, bg=self.bg_color, bd=0)
+            self.container_principal.place(x=0, y=70, width=self.width,
+                                         height=self.height - 70)
+        else:
+            self.tab_bar = None
+            # Container principal sem abas
+            self.container_principal = tk.Frame(self.root, bg=self.bg_color, bd=0)
+            self.container_principal.place(x=0, y=35, width=self.width,
+                                         height=self.height - 35)
+
+            # Criar container scrollável direto
+            self.main_container = self._create_scrollable_container(
+                self.container_principal
+            )
+
+    def _process_background_image(self) -> "Image.Image":
+        """Decodifica, redimensiona e escurece a imagem de fundo (sem tocar no Tk)"""
+        size = (self.width, self.height)
+        if self.bg_cache is not None:
+            return self.bg_cache.load(self.bg_img_path, size)
+        return process_background(self.bg_img_path, size)
+
+    def _load_background_image(self):
+        """Carrega a imagem de fundo (em uma thread se bg_async estiver ativo)"""
+        self.bg_status = 'pending'
+
+        if not self.bg_async:
+            try:
+                self._apply_background_image(self._process_background_image())
+            except Exception:
+                self.bg_status = 'error'
+                logger.warning("Erro ao carregar imagem de fundo %r",
+                               self.bg_img_path, exc_info=True)
+            return
+
+        future: Future = Future()
+
+        def worker():
+            try:
+                future.set_result(self._process_background_image())
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=worker, name="cliv-bg-decode", daemon=True).start()
+        deadline = time.monotonic() + self.bg_load_timeout
+        self.clock.add(lambda: self._poll_background_image(future, deadline), 15)
+
+    def _poll_background_image(self, future: Future, deadline: float) -> Optional[bool]:
+        """Aguarda o resultado da thread sem bloquear o Tk (False = encerrar)"""
+        if not self._root_alive():
+            return False
+
+        if not future.done():
+            if time.monotonic() >= deadline:
+                self.bg_status = 'timeout'
+                logger.warning("Tempo esgotado ao carregar imagem de fundo %r "
+                               "(%.1fs); usando cor sólida",
+                               self.bg_img_path, self.bg_load_timeout)
+                return False
+            return None
+
+        error = future.exception()
+        if error is not None:
+            self.bg_status = 'error'
+            logger.warning("Erro ao carregar imagem de fundo %r: %s",
+                           self.bg_img_path, error,
+                           exc_info=(type(error), error, error.__traceback__))
+            return False
+
+        try:
+            with self._phase("background_swap"):
+                self._apply_background_image(future.result())
+        except Exception:
+            self.bg_status = 'error'
+            logger.warning("Erro ao exibir imagem de fundo %r",
+                           self.bg_img_path, exc_info=True)
+        return False
+
+    def _apply_background_image(self, img: "Image.Image"):
+        """Cria o PhotoImage (thread do Tk) e o coloca atrás das partículas"""
+        from PIL import ImageTk
+
+        self.bg_photo = ImageTk.PhotoImage(img)
+        item = self.bg_canvas.create_image(0, 0, image=self.bg_photo, anchor="nw",
+                                           tags="background")
+        self.bg_canvas.tag_lower(item)
+        self.bg_image = img
+        if self.particle_renderer is not None:
+            self.particle_renderer.set_background(img)
+        self.bg_status = 'ready'
+
+    def _root_alive(self) -> bool:
+        """Verifica se a janela principal ainda existe"""
+        try:
+            return bool(self.root.winfo_exists())
+        except Exception:
+            return False
+
+    def _create_scrollable_container(self, parent: tk.Frame) -> tk.Frame:
+        """Cria um container com scroll"""
+        frame_container = tk.Frame(parent, bg=self.bg_color, bd=0)
+        frame_container.pack(fill='both', expand=True)
+
+        canvas = tk.Canvas(frame_container, bg=self.bg_color,
+                          highlightthickness=0, bd=0)
+
+        scrollbar_frame = tk.Frame(frame_container, bg=self.bg_color,
+                                  width=8, bd=0)
+        scrollbar_canvas = tk.Canvas(scrollbar_frame, bg="#0a0a15", width=8,
+                                    highlightthickness=0, bd=0)
+        scrollbar_canvas.pack(fill='both', expand=True)
+
+        scroll_data = {
+            'dragging': False,
+            'start_y': 0,
+            'thumb': None,
+            'thumb_y': 0,
+            'thumb_height': 100
+        }
+
+        def update_scrollbar(*args):
+            try:
+                first, last = canvas.yview()
+                canvas_height = scrollbar_canvas.winfo_height()
+
+                if canvas_height < 10:
+                    return
+
+                visible_ratio = last - first
+                thumb_height = max(30, canvas_height * visible_ratio)
+                thumb_y = first * canvas_height
+
+                scrollbar_canvas.delete("all")
+
+                scrollbar_canvas.create_rectangle(
+                    1, 0, 7, canvas_height,
+                    fill="#0a0a15", outline=""
+                )
+
+                scrollbar_canvas.create_rectangle(
+                    1, thumb_y, 7, thumb_y + thumb_height,
+                    fill=self.theme, outline="", tags="thumb"
+                )
+
+                scroll_data['thumb_height'] = thumb_height
+                scroll_data['thumb_y'] = thumb_y
+
+            except Exception:
+                pass
+
+        def on_scroll_click(event):
+            scroll_data['dragging'] = True
+            scroll_data['start_y'] = event.y
+
+        def on_scroll_drag(event):
+            if scroll_data['dragging']:
+                canvas_height = scrollbar_canvas.winfo_height()
+                if canvas_height < 10:
+                    return
+
+                delta = event.y - scroll_data['start_y']
+                new_y = scroll_data['thumb_y'] + delta
+
+                max_y = canvas_height - scroll_data['thumb_height']
+                new_y = max(0, min(new_y, max_y))
+
+                fraction = new_y / canvas_height
+                canvas.yview_moveto(fraction)
+                scroll_data['start_y'] = event.y
+
+        def on_scroll_release(event):
+            scroll_data['dragging'] = False
+
+        scrollbar_canvas.bind("<Button-1>", on_scroll_click)
+        scrollbar_canvas.bind("<B1-Motion>", on_scroll_drag)
+        scrollbar_canvas.bind("<ButtonRelease-1>", on_scroll_release)
+
+        canvas.configure(yscrollcommand=lambda f, l: (update_scrollbar(f, l), None)[-1])
+
+        scrollable_frame = tk.Frame(canvas, bg=self.bg_color, bd=0)
+
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: (canvas.configure(scrollregion=canvas.bbox("all")),
+                      update_scrollbar())
+        )
+
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+
+        def _on_mousewheel(event):
+            try:
+                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+                update_scrollbar()
+            except Exception:
+                pass
+
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+
+        scrollbar_frame.pack(side="right", fill="y", padx=(2, 0))
+        canvas.pack(side="left", fill="both", expand=True)
+
+        frame_container.after(100, update_scrollbar)
+
+        return scrollable_frame
+
+    def _init_particles(self):
+        """Inicializa sistema de partículas"""
+        self.particle_renderer = create_particle_renderer(
+            self.particle_backend, self.bg_canvas, self.width, self.height,
+            color=self.p_color, count=self.p_count, speed_range=self.p_speed_range,
+            bg_color=self.bg_color
+        )
+        self.particle_renderer.set_background(self.bg_image)
+        self.particles = self.particle_renderer.state
+        self._start_particles()
+
+    def _init_tray_icon(self):
+        """Inicializa o ícone na system tray"""
+        try:
+            from PIL import Image
+            from pystray import Icon, Menu, MenuItem
+
+            if self.tray_icon_path and os.path.exists(self.tray_icon_path):
+                icon_image = Image.open(self.tray_icon_path)
+            else:
+                icon_image = self._create_default_icon()
+
+            menu = Menu(
+                # Ações do pystray rodam na thread dele: passam pela fila
+                MenuItem('Mostrar/Ocultar', lambda: self.post(self.toggle_visibility),
+                         default=True),
+                MenuItem('Notificação de Teste', lambda: self.post(self._tray_test_notification)),
+                Menu.SEPARATOR,
+                MenuItem('Fechar', self._tray_quit)
+            )
+
+            self.tray_icon = Icon(
+                name=self.title,
+                icon=icon_image,
+                title=self.title,
+                menu=menu
+            )
+
+            self.tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
+            self.tray_thread.start()
+
+            self.root.after(800, lambda: self.show_notification(
+                "System Tray",
+                "Ícone adicionado à bandeja do sistema!",
+                3000,
+                "success"
+            ))
+
+        except ImportError:
+            self.show_notification(
+                "Erro",
+                "pystray não instalado! Execute: pip install pystray",
+                5000,
+                "error"
+            )
+        except Exception as e:
+            print(f"Erro ao criar tray icon: {e}")
+
+    def _create_default_icon(self) -> "Image.Image":
+        """Cria um ícone padrão"""
+        from PIL import Image, ImageDraw
+
+        image = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+
+        hex_color = self.theme.lstrip('#')
+        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+        draw.ellipse([4, 4, 60, 60], fill=rgb, outline=(255, 255, 255))
+
+        lighter = tuple(min(c + 50, 255) for c in rgb)
+        draw.ellipse([16, 16, 48, 48], fill=lighter)
+
+        return image
+
+    def _tray_test_notification(self):
+        """Mostra notificação de teste via tray icon"""
+        self.show_notification(
+            "Tray Icon",
+            "Clique com botão direito no ícone para mais opções!",
+            3000,
+            "info"
+        )
+
+    def _tray_quit(self):
+        """Fecha o programa via tray icon (thread do pystray)"""
+        if self.tray_icon:
+            self.tray_icon.stop()
+        self.post(self._on_close)
+
+    def _start_particles(self):
+        """Registra a atualização das partículas no relógio de frames"""
+        if self._particle_handle is None or not self._particle_handle.active:
+            self._particle_handle = self.clock.add(self._update_particles, 30)
+
+    def _stop_particles(self):
+        """Remove a atualização das partículas do relógio"""
+        if self._particle_handle is not None:
+            self._particle_handle.cancel()
+            self._particle_handle = None
+
+    def _update_particles(self) -> Optional[bool]:
+        """Atualiza partículas (tick do relógio; False = parar)"""
+        if not self.aberto:
+            return False
+
+        if self.governor is not None:
+            started = self.governor.frame_started()
+            self.particle_renderer.step()
+            self.governor.frame_finished(started)
+        else:
+            self.particle_renderer.step()
+        return None
+
+    def _on_quality_change(self, level: QualityLevel):
+        """Aplica um novo nível de qualidade do governador"""
+        if self.particle_renderer is not None:
+            self.particle_renderer.set_active_fraction(level.particle_fraction)
+        self.tweener.set_interval(self.governor.animation_delay(16))
+
+    @property
+    def quality_level(self) -> str:
+        """Nome do nível de qualidade atual ('high' se o governador estiver desativado)"""
+        return self.governor.level.name if self.governor else "high"
+
+    def get_container(self) -> tk.Frame:
+        """
+        Retorna o container principal para adicionar widgets.
+        Se tabs estiverem desabilitadas, retorna o container direto.
+        Se tabs estiverem habilitadas mas nenhuma foi criada, cria uma aba padrão.
+        """
+        if not self.enable_tabs:
+            return self.main_container
+
+        # Se tabs estão habilitadas mas nenhuma existe, criar uma padrão
+        if not self.abas:
+            return self.add_tab("Main")
+
+        # Retornar a aba atual ou a primeira disponível
+        if self.aba_atual and self.aba_atual in self.abas:
+            return self.abas[self.aba_atual]['frame']
+
+        first_tab = next(iter(self.abas))
+        return self.abas[first_tab]['frame']
+
+    def add_tab(self, name: str) -> tk.Frame:
+        """Adiciona uma nova aba ao menu (apenas se tabs estiverem habilitadas)"""
+        if not self.enable_tabs:
+            raise RuntimeError("Tabs não estão habilitadas neste menu. "
+                             "Use get_container() para obter o container principal.")
+
+        with self._phase(f"add_tab:{name}"):
+            frame_container = self._create_scrollable_container(self.container_principal)
+
+            self.abas[name] = {
+                'container': frame_container.master.master,  # Frame principal
+                'frame': frame_container,  # Frame scrollável
+            }
+
+            btn = tk.Button(self.tab_bar, text=name.upper(), bg="#000", fg="gray",
+                            activeforeground=self.theme, font=("Arial", 7, "bold"),
+                            bd=0, command=lambda n=name: self.show_tab(n),
+                            activebackground="#111", cursor="hand2", relief='flat')
+            btn.pack(side='left', expand=True, fill='both')
+            self.botoes_abas[name] = btn
+
+            if not self.aba_atual:
+                self.show_tab(name)
+
+        return frame_container
+
+    def show_tab(self, name: str):
+        """Mostra a aba selecionada"""
+        if not self.enable_tabs:
+            return
+
+        for n, tab_data in self.abas.items():
+            tab_data['container'].pack_forget()
+            self.botoes_abas[n].config(fg="gray", relief='flat')
+
+        self.abas[name]['container'].pack(fill='both', expand=True)
+        self.botoes_abas[name].config(fg=self.theme, relief='sunken')
+        self.aba_atual = name
+
+        on_show = self.abas[name].get('on_show')
+        if on_show:
+            on_show()
+        self._emit("tab", name)
+
+    def add_history_tab(self, name: str = "Histórico", limit: int = 100) -> HistoryPanel:
+        """
+        Adiciona uma aba com o histórico de notificações
+
+        O painel só é montado quando a aba é aberta pela primeira vez e é
+        atualizado sempre que ela volta a ser exibida.
+        """
+        if self.notif_manager.history is None:
+            raise RuntimeError("Histórico de notificações desativado (notif_history_size=0)")
+
+        frame = self.add_tab(name)
+        panel = HistoryPanel(frame, self.notif_manager.history, self.theme,
+                             self.bg_color, limit)
+        self.abas[name]['on_show'] = panel.refresh
+        if self.aba_atual == name:
+            panel.refresh()
+        return panel
+
+    def set_alpha(self, val: float):
+        """Define transparência da janela (0-100)"""
+        self._alpha = max(0.2, min(1.0, float(val) / 100))
+        self.root.attributes("-alpha", self._alpha)
+
+    def _start_move(self, event):
+        """Inicia movimentação da janela"""
+        self.root.x = event.x
+        self.root.y = event.y
+
+    def _on_move(self, event):
+        """Move a janela"""
+        dx = event.x - self.root.x
+        dy = event.y - self.root.y
+        new_x = self.root.winfo_x() + dx
+        new_y = self.root.winfo_y() + dy
+        self.root.geometry(f"+{new_x}+{new_y}")
+
+    def _on_close(self):
+        """Fecha o menu com limpeza completa"""
+        try:
+            if self.tray_icon:
+                try:
+                    self.tray_icon.stop()
+                except Exception:
+                    pass
+
+            for notif in list(self.notif_manager.notification_windows):
+                try:
+                    if notif.winfo_exists():
+                        if hasattr(notif, 'cancel_progress'):
+                            notif.cancel_progress()
+                        notif.destroy()
+                except Exception:
+                    pass
+
+            self.notif_manager.notification_windows.clear()
+
+            self.executor.shutdown()
+            self.audio.shutdown()
+            self.clock.stop()
+            if self._aio is not None:
+                self._aio.stop()
+
+            self.root.quit()
+            self.root.destroy()
+        except Exception:
+            pass
+
+    def show_notification(self, title: str, message: str,
+                         duration: int = 3000, notif_type: str = "info",
+                         sound: Optional[str] = None, source: Any = None):
+        """
+        Mostra notificação no canto da tela (com som opcional)
+
+        Pode ser chamada de qualquer thread. ``source`` identifica a origem
+        para o rate limit da fila (notif_max_visible).
+        """
+        if self.notif_manager.queued:
+            if not self.notif_manager.enqueue(title, message, duration, notif_type, source):
+                return
+        else:
+            self.dispatcher.call(self.notif_manager.show, title, message, duration, notif_type)
+        if sound:
+            self.audio.play_sound(sound)
+
+    def show_progress(self, title: str, message: str = "",
+                      notif_type: str = "info") -> ProgressNotification:
+        """
+        Mostra uma notificação de progresso que só fecha com ``finish``
+
+        Pode ser chamada de qualquer thread; ``update``/``finish`` do handle
+        também.
+        """
+        return self.notif_manager.show_progress(title, message, notif_type)
+
+    def post(self, callback: Callable, *args):
+        """
+        Executa ``callback(*args)`` na thread do Tk (seguro de qualquer thread)
+
+        As chamadas são executadas em lotes a cada frame, em ordem.
+        """
+        self.dispatcher.post(callback, *args)
+
+    def call_soon_threadsafe(self, callback: Callable, *args):
+        """Mesmo que post (nome compatível com asyncio)"""
+        self.dispatcher.post(callback, *args)
+
+    def submit(self, fn: Callable, *args,
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               process: bool = False, name: Optional[str] = None) -> Future:
+        """
+        Executa ``fn(*args)`` no pool de segundo plano do menu
+
+        ``on_done`` (resultado) e ``on_error`` (exceção) rodam na thread do
+        Tk. Tarefas ainda na fila são canceladas quando o menu fecha.
+        Veja TaskExecutor.submit.
+        """
+        return self.executor.submit(fn, *args, on_done=on_done, on_error=on_error,
+                                    process=process, name=name)
+
+    def show_message(self, title: str, message: str, msg_type: str = "info"):
+        """Mostra messagebox personalizado"""
+        MessageBox.show(title, message, msg_type, self.theme)
+
+    def ask(self, title: str, message: str, msg_type: str = "question",
+            buttons: Optional[Sequence[Tuple[str, str]]] = None) -> Future:
+        """
+        Messagebox sem bloqueio; retorna um Future com a escolha do usuário
+
+        Pode ser chamada de qualquer thread. Resultados: 'yes'/'no' para
+        'question', 'ok' para os demais tipos, 'cancel' ao fechar no ✕.
+        """
+        return MessageBox.show_async(title, message, msg_type, self.theme,
+                                     buttons, self.dispatcher)
+
+    @property
+    def aio(self) -> "AsyncBridge":
+        """Ponte com o loop asyncio (a thread do loop inicia no primeiro submit)"""
+        if self._aio is None:
+            # asyncio só é importado por quem usa a ponte
+            from .aio import AsyncBridge
+            self._aio = AsyncBridge(self.dispatcher)
+        return self._aio
+
+    def run_callback(self, callback: Callable, *args) -> Any:
+        """Chama um callback de widget; coroutines são agendadas no loop asyncio"""
+        result = callback(*args)
+        if isinstance(result, Coroutine):
+            self.aio.schedule(result)
+        return result
+
+    def _emit(self, event: str, value: Any = None):
+        """Entrega um evento da interface a quem o aguarda (wait_tab, wait_click...)"""
+        if self._aio is not None:
+            self._aio.emit(event, value)
+
+    async def wait_tab(self, name: Optional[str] = None) -> str:
+        """Aguarda a troca de aba (para ``name``, se informado) e retorna o nome"""
+        while True:
+            tab = await self.aio.wait_event("tab")
+            if name is None or tab == name:
+                return tab
+
+    async def wait_click(self, button: Any = None) -> Any:
+        """Aguarda o clique em um ModernButton (qualquer um, se None)"""
+        while True:
+            clicked = await self.aio.wait_event("click")
+            if button is None or clicked is button:
+                return clicked
+
+    async def wait_hotkey(self, hotkey: str) -> str:
+        """Aguarda uma tecla de atalho global"""
+        return await self.aio.wait_hotkey(hotkey)
+
+    def run_async(self, main: Optional[Callable[[], Awaitable]] = None,
+                  hotkey: str = "insert"):
+        """
+        Inicia o loop principal junto com um event loop asyncio
+
+        O Tk roda nesta thread e o asyncio em uma thread própria; nenhum dos
+        dois faz polling. Callbacks de widgets podem ser coroutines.
+
+        Args:
+            main: Função async iniciada junto com o menu (ex.: cliente websocket)
+            hotkey: Tecla para mostrar/ocultar o menu
+        """
+        self.aio.start()
+        if main is not None:
+            self.aio.schedule(main())
+        try:
+            self.run(hotkey)
+        finally:
+            self.aio.stop()
+
+    def run(self, hotkey: str = "insert"):
+        """Inicia o loop principal"""
+        try:
+            import keyboard
+            keyboard.add_hotkey(hotkey, lambda: self.post(self.toggle_visibility))
+        except Exception as e:
+            print(f"Erro ao registrar hotkey: {e}")
+
+        self.root.after(500, lambda: self.show_notification(
+            "Menu Iniciado",
+            f"Pressione {hotkey.upper()} para mostrar/ocultar",
+            3000,
+            "success"
+        ))
+
+        if self.startup_profiler:
+            self.root.after_idle(self.startup_profiler.mark_first_paint)
+
+        self.root.mainloop()
+
+    def toggle_visibility(self):
+        """Alterna visibilidade do menu"""
+        try:
+            if self.aberto:
+                self.aberto = False
+                self._emit("visibility", False)
+                self._stop_particles()
+                # Fade-out e só então oculta; reabrir no meio reverte o fade
+                self.tweener.fade_window(self.root, 0.0, 150, start=self._alpha,
+                                         on_done=self.root.withdraw)
+            else:
+                self.root.deiconify()
+                self.aberto = True
+                self._emit("visibility", True)
+                self.tweener.fade_window(self.root, self._alpha, 150, start=0.0)
+                if self.governor is not None:
+                    # O intervalo em que o menu ficou oculto não é um frame lento
+                    self.governor.reset_clock()
+                self._start_particles()
+        except Exception:
+            pass
@@ -0,0 +1,1012 @@
+"""Notificações toast e MessageBox personalizados"""
+
+import threading
+import time
+import tkinter as tk
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Optional, Callable, List, Dict, Tuple, Hashable, Sequence, TYPE_CHECKING
+
+from .clock import FrameClock, FrameHandle
+from .dispatch import UIDispatcher
+from .history import NotificationHistory
+from .notifstack import NotificationStack
+from .tween import Tweener
+
+if TYPE_CHECKING:
+    from .governor import FrameGovernor
+
+# Atributo da janela raiz que guarda a fila de MessageBox.show_async
+_QUEUE_ATTR = "_cliv_messagebox_queue"
+
+
+class NotificationManager:
+    """Gerenciador de notificações estilo Roblox"""
+
+    WIDTH = 320
+    HEIGHT = 90
+
+    COLORS = {
+        'info': '#3498db',
+        'success': '#2ecc71',
+        'warning': '#f39c12',
+        'error': '#e74c3c'
+    }
+
+    # Chave da notificação de resumo ("+N notificações") do modo com fila
+    SUMMARY_KEY = ('', '', 'summary')
+
+    def __init__(self, governor: Optional["FrameGovernor"] = None, pool_size: int = 4,
+                 max_visible: Optional[int] = None,
+                 rate_limit: Optional[Tuple[int, float]] = None,
+                 max_queue: int = 50, pump_interval: int = 100,
+                 dispatcher: Optional[UIDispatcher] = None, mode: str = "windows",
+                 history_size: int = 500):
+        """
+        Args:
+            governor: Governador de qualidade; ajusta a taxa das animações
+            pool_size: Janelas de notificação mantidas prontas para reuso
+                (0 = cria e destrói uma janela por notificação)
+            max_visible: Ativa o modo com fila: no máximo N notificações na
+                tela, as demais aguardam (None = sem fila)
+            rate_limit: (quantidade, segundos) aceitos por origem no modo com
+                fila; o excedente entra no resumo "+N"
+            max_queue: Notificações distintas aguardando; o excedente entra
+                no resumo "+N"
+            pump_interval: Intervalo (ms) de entrega da fila
+            dispatcher: Fila da thread do Tk; permite show_progress e
+                atualizações de progresso a partir de outras threads
+            mode: 'windows' (uma janela por notificação) ou 'stack' (todas
+                desenhadas em uma única janela com canvas)
+            history_size: Notificações guardadas em ``history`` (0 = sem histórico)
+        """
+        if mode not in ("windows", "stack"):
+            raise ValueError(f"Modo de notificação desconhecido: {mode!r}")
+        self.notifications: List[tk.Toplevel] = []
+        self.notification_windows: List[tk.Toplevel] = []
+        self.lock = threading.Lock()
+        self.governor = governor
+        self.dispatcher = dispatcher
+        self.mode = mode
+        self._stack: Optional[NotificationStack] = None
+        self.history: Optional[NotificationHistory] = (
+            NotificationHistory(history_size) if history_size else None
+        )
+        self.pool_size = pool_size
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self._pool: List[tk.Toplevel] = []
+
+        self.max_visible = max_visible
+        self.rate_limit = rate_limit
+        self.max_queue = max_queue
+        self.pump_interval = pump_interval
+        # (title, message, type) -> [title, message, duration, type, repetições]
+        self._pending: "OrderedDict[Hashable, list]" = OrderedDict()
+        # Notificações na tela por chave, para somar repetições
+        self._visible: Dict[Hashable, tk.Toplevel] = {}
+        # origem -> [tokens, último reabastecimento]
+        self._buckets: Dict[Hashable, List[float]] = {}
+        self._overflow = 0
+        # (title, message, type) -> seq da entrada "descartada" no histórico
+        self._dropped_seq: Dict[Hashable, int] = {}
+        self._pump_handle: Optional[FrameHandle] = None
+        self._queue_widget: Optional[tk.Misc] = None
+        # True enquanto o pump está inscrito no relógio (ou a caminho)
+        self._pump_armed = False
+        self.queue_stats = {'enqueued': 0, 'coalesced': 0, 'rate_limited': 0,
+                            'overflowed': 0, 'delivered': 0}
+
+    def _delay(self, base_ms: int) -> int:
+        """Delay de um passo de animação conforme o nível de qualidade"""
+        return self.governor.animation_delay(base_ms) if self.governor else base_ms
+
+    def show(self, title: str, message: str, duration: int = 3000,
+             notification_type: str = "info", sticky: bool = False) -> tk.Toplevel:
+        """
+        Mostra uma notificação no canto inferior direito
+
+        Args:
+            title: Título da notificação
+            message: Mensagem da notificação
+            duration: Duração em milissegundos
+            notification_type: Tipo ('info', 'success', 'warning', 'error')
+            sticky: Sem contagem de tempo: a barra começa vazia e a
+                notificação só fecha pelo ✕ ou por quem a abriu
+        """
+        return self._show(title, message, duration, notification_type, sticky)
+
+    def _show(self, title: str, message: str, duration: int, notification_type: str,
+              sticky: bool = False, record: bool = True) -> tk.Toplevel:
+        """show() com opção de não gravar no histórico (ex.: resumo da fila)"""
+        color = self.COLORS.get(notification_type, '#3498db')
+
+        try:
+            notif = self._acquire_window()
+            self._theme_window(notif, title, message, color)
+
+            width = self.WIDTH
+            height = self.HEIGHT
+
+            with self.lock:
+                index = len(self.notification_windows)
+
+            if self._stack is None:
+                screen_width = notif.winfo_screenwidth()
+                screen_height = notif.winfo_screenheight()
+
+                offset = index * (height + 10)
+                x = screen_width - width - 20
+                y = screen_height - height - 60 - offset
+
+                notif.attributes("-alpha", 0.0)
+                notif.geometry(f"{width}x{height}+{x + width}+{y}")
+                notif.deiconify()
+
+            notif.notif_key = None
+            notif.owner = None
+            notif.notif_title = title
+            notif.repeat = 1
+            notif.duration = duration
+            notif.color = color
+            notif.history_seq = None
+            if record and self.history is not None:
+                notif.history_seq = self.history.record(title, message, notification_type)
+
+            with self.lock:
+                self.notification_windows.append(notif)
+
+            if self._stack is None:
+                self._animate_in(notif, x, y, width)
+            else:
+                self._tweener(notif)
+                self._stack.present(notif, index)
+            if sticky:
+                notif.progress_canvas.coords(notif.progress_bar, 0, 0, 0, 3)
+                notif.cancel_progress = lambda: None
+            else:
+                self._start_progress_fixed(notif, notif.progress_canvas, notif.progress_bar,
+                                           duration, width, color)
+
+            return notif
+        except Exception as e:
+            print(f"Erro ao criar notificação: {e}")
+            return None
+
+    def _build_window(self) -> tk.Toplevel:
+        """Cria uma janela de notificação oculta, sem tema nem texto"""
+        notif = tk.Toplevel()
+        notif.withdraw()
+        notif.overrideredirect(True)
+        notif.attributes("-topmost", True)
+        notif.attributes("-alpha", 0.0)
+
+        main_frame = tk.Frame(notif, bd=0)
+        main_frame.pack(fill='both', expand=True, padx=2, pady=2)
+
+        inner_frame = tk.Frame(main_frame, bg="#1a1a1a", bd=0)
+        inner_frame.pack(fill='both', expand=True)
+
+        header = tk.Frame(inner_frame, height=30, bd=0)
+        header.pack(fill='x', side='top')
+        header.pack_propagate(False)
+
+        title_label = tk.Label(header, fg="white", font=("Arial", 9, "bold"))
+        title_label.pack(side='left', padx=10, pady=5)
+
+        close_btn = tk.Label(header, text="✕", fg="white",
+                            font=("Arial", 10), cursor="hand2")
+        close_btn.pack(side='right', padx=10)
+        close_btn.bind("<Button-1>", lambda e: self._close_notification(notif))
+
+        msg_frame = tk.Frame(inner_frame, bg="#1a1a1a", bd=0)
+        msg_frame.pack(fill='both', expand=True, padx=10, pady=5)
+
+        message_label = tk.Label(msg_frame, bg="#1a1a1a", fg="white",
+                                font=("Arial", 8), wraplength=280, justify='left')
+        message_label.pack(anchor='w')
+
+        progress_canvas = tk.Canvas(inner_frame, height=3, bg="#1a1a1a",
+                                   highlightthickness=0, bd=0)
+        progress_canvas.pack(fill='x', side='bottom')
+
+        notif.progress_canvas = progress_canvas
+        notif.progress_bar = progress_canvas.create_rectangle(0, 0, self.WIDTH, 3, outline="")
+        # Widgets que recebem a cor do tipo da notificação
+        notif.themed = (main_frame, header, title_label, close_btn)
+        notif.title_label = title_label
+        notif.message_label = message_label
+        return notif
+
+    @staticmethod
+    def _theme_window(notif: tk.Toplevel, title: str, message: str, color: str):
+        """Aplica tipo, título e mensagem a uma janela (nova ou do pool)"""
+        for widget in notif.themed:
+            widget.config(bg=color)
+        notif.title_label.config(text=title.upper())
+        notif.message_label.config(text=message)
+        notif.progress_canvas.itemconfig(notif.progress_bar, fill=color)
+
+    def _acquire_window(self) -> tk.Toplevel:
+        """Retorna uma janela do pool ou cria uma nova (um card no modo 'stack')"""
+        if self.mode == "stack":
+            return self._stack_window().create_card()
+        with self.lock:
+            while self._pool:
+                notif = self._pool.pop()
+                if self._is_window_valid(notif):
+                    self.pool_hits += 1
+                    return notif
+            self.pool_misses += 1
+        return self._build_window()
+
+    def _release_window(self, window: tk.Toplevel):
+        """Devolve a janela ao pool (oculta) ou a destrói se o pool estiver cheio"""
+        try:
+            if not window.winfo_exists():
+                return
+            if self._stack is not None:
+                self._stack.remove(window)
+                return
+            with self.lock:
+                keep = len(self._pool) < self.pool_size
+                if keep:
+                    self._pool.append(window)
+            if keep:
+                window.withdraw()
+                window.attributes("-alpha", 0.0)
+            else:
+                window.destroy()
+        except Exception:
+            pass
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """
+        Cria janelas ocultas até o pool ter ``count`` (padrão: pool_size)
+
+        No modo 'stack' apenas cria a janela única.
+
+        Returns:
+            Quantidade de janelas criadas
+        """
+        if self.mode == "stack":
+            created = self._stack is None
+            self._stack_window()
+            return int(created)
+
+        target = self.pool_size if count is None else min(count, self.pool_size)
+        created = 0
+        while True:
+            with self.lock:
+                if len(self._pool) >= target:
+                    break
+            window = self._build_window()
+            with self.lock:
+                self._pool.append(window)
+            created += 1
+        return created
+
+    def _stack_window(self) -> NotificationStack:
+        """Janela única do modo 'stack' (criada no primeiro uso)"""
+        if self._stack is None:
+            self._stack = NotificationStack(self._close_notification)
+        return self._stack
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Retorna tamanho, janelas disponíveis e acertos/faltas do pool"""
+        with self.lock:
+            return {
+                'size': self.pool_size,
+                'available': len(self._pool),
+                'hits': self.pool_hits,
+                'misses': self.pool_misses,
+            }
+
+    def show_progress(self, title: str, message: str = "",
+                      notification_type: str = "info") -> "ProgressNotification":
+        """
+        Abre uma notificação de progresso e retorna o handle dela
+
+        Com ``dispatcher`` definido pode ser chamada de qualquer thread;
+        sem ele, apenas na thread do Tk.
+        """
+        handle = ProgressNotification(self, title, message, notification_type)
+        if self.dispatcher is None:
+            handle._open()
+            if handle.window is None:
+                # show falhou (erro já reportado): update/finish viram no-op
+                handle.done = True
+            else:
+                handle.dispatcher = UIDispatcher.for_widget(handle.window)
+        else:
+            self.dispatcher.call(handle._open)
+        return handle
+
+    # ------------------------------------------------------------------
+    # Modo com fila (max_visible)
+    # ------------------------------------------------------------------
+
+    @property
+    def queued(self) -> bool:
+        """True se as notificações passam pela fila (max_visible definido)"""
+        return self.max_visible is not None
+
+    def enqueue(self, title: str, message: str, duration: int = 3000,
+                notification_type: str = "info", source: Hashable = None) -> bool:
+        """
+        Coloca uma notificação na fila (seguro para chamar de qualquer thread)
+
+        Repetições de (title, message, type) na fila ou na tela viram um
+        contador na mesma notificação. Acima do rate limit da origem ou do
+        tamanho da fila, a notificação só incrementa o resumo "+N".
+
+        Returns:
+            False se a notificação foi descartada para o resumo
+        """
+        key = (title, message, notification_type)
+        with self.lock:
+            self.queue_stats['enqueued'] += 1
+            entry = self._pending.get(key)
+            accepted = True
+            if entry is not None:
+                entry[4] += 1
+                self.queue_stats['coalesced'] += 1
+            elif not self._take_token(source):
+                self.queue_stats['rate_limited'] += 1
+                self._overflow += 1
+                self._record_dropped(key)
+                accepted = False
+            elif len(self._pending) >= self.max_queue and key not in self._visible:
+                self.queue_stats['overflowed'] += 1
+                self._overflow += 1
+                self._record_dropped(key)
+                accepted = False
+            else:
+                self._pending[key] = [title, message, duration, notification_type, 1]
+            # O pump se desinscreve com a fila vazia; a primeira entrada o reativa
+            wake = not self._pump_armed
+            self._pump_armed = True
+        if wake:
+            self._wake_pump()
+        return accepted
+
+    def _record_dropped(self, key: Tuple[str, str, str]):
+        """Grava um descarte; repetições somam na entrada anterior (chamado com o lock)"""
+        history = self.history
+        if history is None:
+            return
+        seq = self._dropped_seq.get(key)
+        if seq is not None and history.add_repeats(seq):
+            return
+        title, message, notification_type = key
+        seq = self._dropped_seq[key] = history.record(title, message, notification_type,
+                                                      dropped=True)
+        if len(self._dropped_seq) > history.capacity:
+            # Entradas já sobrescritas no histórico não recebem mais repetições
+            oldest = seq - history.capacity
+            self._dropped_seq = {k: s for k, s in self._dropped_seq.items() if s > oldest}
+
+    def _take_token(self, source: Hashable) -> bool:
+        """Token bucket por origem; chamado com o lock"""
+        if self.rate_limit is None:
+            return True
+        capacity, period = self.rate_limit
+        now = time.monotonic()
+        bucket = self._buckets.get(source)
+        if bucket is None:
+            bucket = self._buckets[source] = [float(capacity), now]
+        else:
+            bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * capacity / period)
+            bucket[1] = now
+        if bucket[0] < 1:
+            return False
+        bucket[0] -= 1
+        return True
+
+    def start_queue(self, widget: tk.Misc):
+        """
+        Passa a entregar a fila no relógio da janela raiz de ``widget``
+
+        O pump só fica no relógio enquanto há o que entregar: com a fila
+        vazia ele se remove, e ``enqueue`` o inscreve de novo.
+        """
+        self._queue_widget = widget
+        with self.lock:
+            self._pump_armed = True
+        self._arm_pump()
+
+    def stop_queue(self):
+        self._queue_widget = None
+        if self._pump_handle is not None:
+            self._pump_handle.cancel()
+            self._pump_handle = None
+
+    def _wake_pump(self):
+        """Reinscreve o pump a partir de qualquer thread"""
+        if self.dispatcher is not None:
+            self.dispatcher.call(self._arm_pump)
+        else:
+            self._arm_pump()
+
+    def _arm_pump(self):
+        """Inscreve o pump no relógio, se ainda não estiver (thread do Tk)"""
+        if self._queue_widget is None:
+            return
+        if self._pump_handle is None or not self._pump_handle.active:
+            clock = FrameClock.for_widget(self._queue_widget)
+            self._pump_handle = clock.add(self._pump, self.pump_interval)
+
+    def _pump(self) -> Optional[bool]:
+        """Entrega a fila na thread do Tk: soma repetições e abre vagas livres"""
+        with self.lock:
+            if not self._pending and not self._overflow:
+                # Fila vazia: sai do relógio até o próximo enqueue
+                self._pump_armed = False
+                self._pump_handle = None
+                return False
+            free = self.max_visible - sum(1 for w in self.notification_windows
+                                          if getattr(w, 'notif_key', None) != self.SUMMARY_KEY)
+            repeats = []
+            deliver = []
+            for key in list(self._pending):
+                if key in self._visible:
+                    repeats.append((self._visible[key], self._pending.pop(key)[4]))
+                elif free > 0:
+                    deliver.append(self._pending.pop(key))
+                    free -= 1
+            overflow = self._overflow
+            self._overflow = 0
+
+        for window, count in repeats:
+            self._add_repeats(window, count)
+
+        for title, message, duration, notification_type, count in deliver:
+            window = self.show(title, message, duration, notification_type)
+            if window is None:
+                continue
+            window.notif_key = (title, message, notification_type)
+            with self.lock:
+                self._visible[window.notif_key] = window
+                self.queue_stats['delivered'] += 1
+            if count > 1:
+                self._add_repeats(window, count - 1)
+
+        if overflow:
+            self._show_summary(overflow)
+        return None
+
+    def _add_repeats(self, window: tk.Toplevel, count: int):
+        """Soma repetições a uma notificação visível e reinicia o tempo dela"""
+        try:
+            window.repeat += count
+            if count and self.history is not None and window.history_seq is not None:
+                self.history.add_repeats(window.history_seq, count)
+            window.title_label.config(text=f"{window.notif_title.upper()}  ×{window.repeat}")
+            self._restart_progress(window)
+        except Exception:
+            pass
+
+    def _restart_progress(self, window: tk.Toplevel):
+        """Recomeça a contagem de tempo de uma notificação visível"""
+        window.cancel_progress()
+        self._start_progress_fixed(window, window.progress_canvas, window.progress_bar,
+                                   window.duration, self.WIDTH, window.color)
+
+    def _show_summary(self, count: int):
+        """Mostra (ou atualiza) o resumo das notificações descartadas"""
+        with self.lock:
+            window = self._visible.get(self.SUMMARY_KEY)
+        if window is not None:
+            try:
+                window.hidden_count += count
+                window.message_label.config(text=self._summary_text(window.hidden_count))
+                self._restart_progress(window)
+            except Exception:
+                pass
+            return
+
+        window = self._show("Notificações", self._summary_text(count), 4000, "warning",
+                            record=False)
+        if window is None:
+            return
+        window.notif_key = self.SUMMARY_KEY
+        window.hidden_count = count
+        with self.lock:
+            self._visible[self.SUMMARY_KEY] = window
+
+    @staticmethod
+    def _summary_text(count: int) -> str:
+        return f"+{count} notificações não exibidas"
+
+    def _start_progress_fixed(self, window: tk.Toplevel, canvas: tk.Canvas,
+                             bar: int, duration: int, width: int, color: str):
+        """Anima a barra de progresso"""
+        tween = self._tweener(window).move_item(
+            canvas, bar, (0, 0, 0, 3), duration, easing='linear',
+            start=(0, 0, width, 3), on_done=lambda: self._close_notification(window))
+        window.cancel_progress = tween.cancel
+
+    def _animate_in(self, window: tk.Toplevel, target_x: int,
+                    target_y: int, width: int):
+        """Animação de entrada (slide da direita + fade)"""
+        tweener = self._tweener(window)
+        tweener.move_window(window, target_x, target_y, 225, 'out_cubic',
+                            start=(target_x + width, target_y))
+        tweener.fade_window(window, 0.95, 225, start=0.0)
+
+    def _animate_out(self, window: tk.Toplevel, callback: Optional[Callable] = None):
+        """Animação de saída (slide para direita + fade)"""
+        def finish():
+            if callback:
+                callback()
+
+        try:
+            if not window.winfo_exists():
+                finish()
+                return
+
+            if self._stack is not None:
+                self._tweener(window)
+                self._stack.dismiss(window, finish)
+                return
+
+            tweener = self._tweener(window)
+            # Parte de onde a janela está, mesmo no meio de outro movimento
+            moving = tweener.get((window, 'position'))
+            if moving is not None:
+                current_x, current_y = moving.current
+            else:
+                current_x, current_y = window.winfo_x(), window.winfo_y()
+
+            tweener.move_window(window, current_x + 350, current_y, 225, 'in_cubic')
+            tweener.fade_window(window, 0.0, 225, on_done=finish)
+        except Exception:
+            finish()
+
+    def _tweener(self, window: tk.Misc) -> Tweener:
+        """Tweener da janela raiz, no ritmo do nível de qualidade"""
+        tweener = Tweener.for_widget(window)
+        if self.governor:
+            tweener.set_interval(self._delay(16))
+        return tweener
+
+    def _close_notification(self, window: tk.Toplevel):
+        """Fecha a notificação com animação"""
+        try:
+            if not window.winfo_exists():
+                return
+        except Exception:
+            return
+
+        if hasattr(window, 'cancel_progress'):
+            try:
+                window.cancel_progress()
+            except Exception:
+                pass
+
+        with self.lock:
+            # Já fechando (ex.: clique no ✕ e fim do tempo ao mesmo tempo)
+            if window not in self.notification_windows:
+                return
+            self.notification_windows.remove(window)
+            key = getattr(window, 'notif_key', None)
+            if key is not None and self._visible.get(key) is window:
+                del self._visible[key]
+
+        def destroy():
+            self._release_window(window)
+
+            if self.notification_windows:
+                try:
+                    valid_windows = [w for w in self.notification_windows
+                                   if self._is_window_valid(w)]
+                    if valid_windows:
+                        valid_windows[0].after(50, self._reposition_notifications)
+                except Exception:
+                    pass
+
+        self._animate_out(window, destroy)
+
+    @staticmethod
+    def _is_window_valid(window: tk.Toplevel) -> bool:
+        """Verifica se janela ainda é válida"""
+        try:
+            return window.winfo_exists()
+        except Exception:
+            return False
+
+    def _reposition_notifications(self):
+        """Reposiciona notificações após fechamento"""
+        try:
+            with self.lock:
+                self.notification_windows = [w for w in self.notification_windows
+                                           if self._is_window_valid(w)]
+
+                if not self.notification_windows:
+                    return
+
+                if self._stack is not None:
+                    for i, notif in enumerate(self.notification_windows):
+                        self._stack.move_card(notif, i)
+                    return
+
+                first_notif = self.notification_windows[0]
+                screen_height = first_notif.winfo_screenheight()
+                screen_width = first_notif.winfo_screenwidth()
+
+                for i, notif in enumerate(self.notification_windows):
+                    try:
+                        if self._is_window_valid(notif):
+                            height = self.HEIGHT
+                            offset = i * (height + 10)
+                            x = screen_width - self.WIDTH - 20
+                            y = screen_height - height - 60 - offset
+
+                            self._smooth_move(notif, y)
+                    except Exception:
+                        continue
+        except Exception:
+            pass
+
+    def _smooth_move(self, window: tk.Toplevel, target_y: int):
+        """Move suavemente a janela para nova posição Y"""
+        tweener = self._tweener(window)
+        # Um novo destino substitui o movimento em andamento a partir da posição atual
+        moving = tweener.get((window, 'position'))
+        target_x = moving.end[0] if moving is not None else window.winfo_x()
+        tweener.move_window(window, target_x, target_y, 200, 'out_cubic')
+
+
+class ProgressNotification:
+    """
+    Handle de uma notificação de progresso (NotificationManager.show_progress)
+
+    ``update`` e ``finish`` podem ser chamados de qualquer thread e em
+    qualquer frequência: só o último valor é desenhado, no máximo uma vez
+    por frame.
+    """
+
+    def __init__(self, manager: NotificationManager, title: str, message: str,
+                 notification_type: str):
+        self.manager = manager
+        self.dispatcher = manager.dispatcher
+        self.title = title
+        self.message = message
+        self.notification_type = notification_type
+        self.fraction = 0.0
+        self.window: Optional[tk.Toplevel] = None
+        self.done = False
+        self.updates = 0
+        self.redraws = 0
+        self._drawn_message = message
+        self._dirty = False
+        self._redraw_handle: Optional[FrameHandle] = None
+
+    def update(self, fraction: float, message: Optional[str] = None):
+        """Atualiza o progresso (0.0 a 1.0) e, opcionalmente, a mensagem"""
+        if self.done:
+            return
+        self.fraction = max(0.0, min(float(fraction), 1.0))
+        if message is not None:
+            self.message = message
+        self.updates += 1
+        # Valores gravados antes de checar a flag: a thread do Tk limpa a
+        # flag antes de ler, então nenhuma atualização se perde
+        if not self._dirty:
+            self._dirty = True
+            self.dispatcher.post(self._request_redraw)
+
+    def finish(self, message: Optional[str] = None,
+               notification_type: Optional[str] = "success", linger_ms: int = 1500):
+        """
+        Completa a barra e fecha a notificação após ``linger_ms``
+
+        Args:
+            message: Mensagem final (None = mantém a atual)
+            notification_type: Novo tipo/cor (None = mantém)
+            linger_ms: Tempo visível após concluir
+        """
+        if self.done:
+            return
+        self.done = True
+        self.fraction = 1.0
+        if message is not None:
+            self.message = message
+        self.dispatcher.post(self._finish, notification_type, linger_ms)
+
+    def _open(self):
+        """Cria a janela (thread do Tk)"""
+        self.window = self.manager.show(self.title, self.message, 0,
+                                        self.notification_type, sticky=True)
+        self._drawn_message = self.message
+        if self.window is not None:
+            self.window.owner = self
+            if self.fraction:
+                self._redraw()
+
+    @property
+    def visible(self) -> bool:
+        """False depois de fechada (ex.: pelo ✕); a janela pode ter voltado ao pool"""
+        return self.window is not None and getattr(self.window, 'owner', None) is self
+
+    def _request_redraw(self):
+        """Agenda o redesenho no relógio (thread do Tk)"""
+        if not self.visible:
+            return
+        if self._redraw_handle is None or not self._redraw_handle.active:
+            self._redraw_handle = FrameClock.for_widget(self.window).add(self._redraw_tick)
+
+    def _redraw_tick(self) -> Optional[bool]:
+        if not self._dirty or not self.visible:
+            return False
+        self._redraw()
+        return None
+
+    def _redraw(self):
+        self._dirty = False
+        window = self.window
+        try:
+            window.progress_canvas.coords(window.progress_bar, 0, 0,
+                                          self.manager.WIDTH * self.fraction, 3)
+            message = self.message
+            if message != self._drawn_message:
+                window.message_label.config(text=message)
+                self._drawn_message = message
+            self.redraws += 1
+        except Exception:
+            # Janela fechada pelo usuário
+            self._dirty = False
+
+    def _finish(self, notification_type: Optional[str], linger_ms: int):
+        window = self.window
+        if not self.visible:
+            return
+        if self._redraw_handle is not None:
+            self._redraw_handle.cancel()
+        self._redraw()
+        try:
+            if notification_type is not None:
+                color = self.manager.COLORS.get(notification_type, '#3498db')
+                for widget in window.themed:
+                    widget.config(bg=color)
+                window.progress_canvas.itemconfig(window.progress_bar, fill=color)
+        except Exception:
+            return
+
+        def close():
+            if self.visible:
+                window.owner = None
+                self.manager._close_notification(window)
+            return False
+
+        FrameClock.for_widget(window).add(close, linger_ms)
+
+
+class MessageBox:
+    """MessageBox personalizado estilo CLIV"""
+
+    COLORS = {
+        'info': '#3498db',
+        'success': '#2ecc71',
+        'warning': '#f39c12',
+        'error': '#e74c3c',
+        'question': '#9b59b6'
+    }
+
+    ICONS = {
+        'info': 'ℹ',
+        'success': '✓',
+        'warning': '⚠',
+        'error': '✕',
+        'question': '?'
+    }
+
+    # Botões (texto, resultado) padrão de cada tipo em show_async
+    QUESTION_BUTTONS = (("NÃO", "no"), ("SIM", "yes"))
+    OK_BUTTONS = (("OK", "ok"),)
+
+    @staticmethod
+    def show(title: str, message: str, msg_type: str = "info",
+             theme_color: str = "#8e44ad") -> None:
+        """
+        Mostra um messagebox personalizado
+
+        Args:
+            title: Título da janela
+            message: Mensagem a ser exibida
+            msg_type: Tipo ('info', 'success', 'warning', 'error', 'question')
+            theme_color: Cor do tema
+        """
+        try:
+            box = MessageBox._build(title, message, msg_type, theme_color,
+                                    MessageBox.OK_BUTTONS, lambda result: box.destroy())
+            box.grab_set()
+            box.focus_force()
+            box.wait_window()
+        except Exception as e:
+            print(f"Erro ao mostrar messagebox: {e}")
+
+    @staticmethod
+    def show_async(title: str, message: str, msg_type: str = "info",
+                   theme_color: str = "#8e44ad",
+                   buttons: Optional[Sequence[Tuple[str, str]]] = None,
+                   dispatcher: Optional[UIDispatcher] = None) -> Future:
+        """
+        Mostra um messagebox sem bloquear e retorna um Future com a escolha
+
+        O Future recebe o resultado do botão clicado ('ok', 'yes', 'no' ou o
+        definido em ``buttons``) ou 'cancel' se a caixa for fechada no ✕.
+        Não usa grab nem loop aninhado: várias chamadas formam uma fila e
+        as caixas aparecem uma por vez. Em asyncio, use
+        ``await asyncio.wrap_future(future)``.
+
+        Args:
+            title: Título da janela
+            message: Mensagem a ser exibida
+            msg_type: Tipo ('info', 'success', 'warning', 'error', 'question')
+            theme_color: Cor do tema
+            buttons: Pares (texto, resultado), da esquerda para a direita
+                (padrão: SIM/NÃO para 'question', OK para os demais)
+            dispatcher: Fila da thread do Tk; necessária para chamar de
+                outras threads (ClivMenu.ask já a usa)
+        """
+        if buttons is None:
+            buttons = MessageBox.QUESTION_BUTTONS if msg_type == "question" else MessageBox.OK_BUTTONS
+
+        root = dispatcher.root if dispatcher is not None else tk._default_root
+        if root is None:
+            raise RuntimeError("show_async requer uma janela Tk ativa")
+
+        future: Future = Future()
+        request = (future, title, message, msg_type, theme_color, tuple(buttons))
+        if dispatcher is None:
+            MessageBox._enqueue(root, request)
+        else:
+            dispatcher.call(MessageBox._enqueue, root, request)
+        return future
+
+    @staticmethod
+    def _enqueue(root: tk.Misc, request: tuple):
+        _MessageBoxQueue.for_widget(root).add(request)
+
+    @staticmethod
+    def _build(title: str, message: str, msg_type: str, theme_color: str,
+               buttons: Sequence[Tuple[str, str]],
+               on_result: Callable[[str], None],
+               master: Optional[tk.Misc] = None) -> tk.Toplevel:
+        """Monta a caixa; cada botão chama ``on_result`` com seu resultado"""
+        box = tk.Toplevel(master)
+        box.overrideredirect(True)
+        box.geometry("420x220")
+        box.configure(bg="#05050a")
+        box.attributes("-topmost", True)
+
+        box.update_idletasks()
+        x = (box.winfo_screenwidth() // 2) - (420 // 2)
+        y = (box.winfo_screenheight() // 2) - (220 // 2)
+        box.geometry(f"420x220+{x}+{y}")
+
+        color = MessageBox.COLORS.get(msg_type, theme_color)
+        icon = MessageBox.ICONS.get(msg_type, 'ℹ')
+
+        header = tk.Frame(box, bg=color, height=35, bd=0)
+        header.pack(fill='x', side='top')
+        header.pack_propagate(False)
+
+        title_frame = tk.Frame(header, bg=color)
+        title_frame.pack(side='left', fill='y', padx=10)
+
+        tk.Label(title_frame, text=icon, bg=color, fg="white",
+                font=("Arial", 14, "bold")).pack(side='left', padx=(0, 8))
+        tk.Label(title_frame, text=title.upper(), bg=color, fg="white",
+                font=("Impact", 10)).pack(side='left')
+
+        close_btn = tk.Button(header, text="✕", command=lambda: on_result("cancel"),
+                             bg=color, fg="white", bd=0, width=5,
+                             activebackground="#ff4444", cursor="hand2",
+                             font=("Arial", 10))
+        close_btn.pack(side='right', fill='y')
+
+        def start_move(event):
+            box.x = event.x
+            box.y = event.y
+
+        def on_move(event):
+            deltax = event.x - box.x
+            deltay = event.y - box.y
+            new_x = box.winfo_x() + deltax
+            new_y = box.winfo_y() + deltay
+            box.geometry(f"+{new_x}+{new_y}")
+
+        header.bind("<Button-1>", start_move)
+        header.bind("<B1-Motion>", on_move)
+        title_frame.bind("<Button-1>", start_move)
+        title_frame.bind("<B1-Motion>", on_move)
+
+        body = tk.Frame(box, bg="#05050a", bd=0)
+        body.pack(fill='both', expand=True, padx=25, pady=20)
+
+        msg_label = tk.Label(body, text=message, bg="#05050a", fg="white",
+                            font=("Arial", 9), wraplength=370, justify='left')
+        msg_label.pack(expand=True)
+
+        btn_frame = tk.Frame(box, bg="#05050a", bd=0)
+        btn_frame.pack(fill='x', padx=25, pady=(0, 20))
+
+        width = 18 if len(buttons) == 1 else 12
+        # Empacotados da direita para a esquerda: o último fica na ponta
+        for text, result in reversed(buttons):
+            btn = tk.Button(btn_frame, text=text, bg=color, fg="white",
+                            font=("Arial", 9, "bold"), bd=0, width=width,
+                            command=lambda r=result: on_result(r), cursor="hand2",
+                            activebackground=color, activeforeground="white",
+                            relief='flat')
+            btn.pack(side='right', ipady=8, padx=(8, 0))
+            btn.bind("<Enter>", lambda e, b=btn: b.config(relief='raised'))
+            btn.bind("<Leave>", lambda e, b=btn: b.config(relief='flat'))
+
+        box.attributes("-alpha", 0.0)
+        Tweener.for_widget(box).fade_window(box, 0.95, 200, start=0.0)
+        return box
+
+
+class _MessageBoxQueue:
+    """Caixas de show_async de uma janela raiz, exibidas uma por vez (thread do Tk)"""
+
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        self.pending: deque = deque()
+        self.box: Optional[tk.Toplevel] = None
+
+    @classmethod
+    def for_widget(cls, widget: tk.Misc) -> "_MessageBoxQueue":
+        """Retorna (criando se preciso) a fila da janela raiz do widget"""
+        root = widget._root()
+        queue = getattr(root, _QUEUE_ATTR, None)
+        if queue is None:
+            queue = cls(root)
+            setattr(root, _QUEUE_ATTR, queue)
+        return queue
+
+    def add(self, request: tuple):
+        self.pending.append(request)
+        if self.box is None:
+            self.open_next()
+
+    def open_next(self):
+        """Abre a próxima caixa da fila (pulando Futures cancelados)"""
+        while self.pending:
+            future, title, message, msg_type, theme_color, buttons = self.pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            def close(result: str, future=future):
+                box = self.box
+                if box is None or box.future is not future:
+                    return  # já fechada
+                self.box = None
+                if not future.done():
+                    future.set_result(result)
+                try:
+                    box.destroy()
+                except Exception:
+                    pass
+                self.open_next()
+
+            def on_destroy(event, future=future):
+                # Destruída por fora (ex.: a janela raiz fechou): conta como ✕
+                if event.widget is self.box:
+                    close("cancel", future)
+
+            try:
+                box = MessageBox._build(title, message, msg_type, theme_color,
+                                        buttons, close, self.root)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            box.future = future
+            box.bind("<Destroy>", on_destroy, add="+")
+            self.box = box
+            box.focus_force()
+            return
+
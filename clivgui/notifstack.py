@@ -0,0 +1,239 @@
+"""
+Modo 'stack' das notificações: todas desenhadas em uma única janela.
+
+Cada notificação é um card de itens de canvas (retângulos e textos) dentro de
+uma janela sem borda e sempre no topo. Entrada, saída e reposição movem os
+itens do card e o fade mistura as cores dele com o fundo, sem ``geometry``
+ou ``winfo`` por notificação: o gerenciador de janelas só vê uma janela.
+
+Os cards imitam os atributos das janelas de notificação usados pelo
+NotificationManager (``title_label``, ``message_label``, ``themed``,
+``progress_canvas``...), então fila, repetições e progresso funcionam igual.
+"""
+
+import tkinter as tk
+from typing import Optional, Callable, List, Dict, Tuple
+
+from .tween import Tweener
+
+BG_COLOR = "#0a0a0a"
+
+
+class _ItemProxy:
+    """Imita ``config`` de Label/Frame sobre um item do canvas"""
+
+    __slots__ = ('card', 'item')
+
+    def __init__(self, card: "StackCard", item: int):
+        self.card = card
+        self.item = item
+
+    def config(self, text: Optional[str] = None, bg: Optional[str] = None, **kwargs):
+        if text is not None:
+            self.card.canvas.itemconfig(self.item, text=text)
+        if bg is not None:
+            self.card.set_color(self.item, bg)
+
+    configure = config
+
+
+class _ProgressProxy:
+    """Barra de progresso com coordenadas locais, como no canvas próprio da janela"""
+
+    __slots__ = ('card', 'scale')
+
+    def __init__(self, card: "StackCard"):
+        self.card = card
+        self.scale = (card.stack.WIDTH - 4) / card.stack.WIDTH
+
+    def coords(self, item: int, *coords):
+        card = self.card
+        if not coords:
+            x0, y0, x1, y1 = card.canvas.coords(item)
+            return [(x0 - card.x - 2) / self.scale, y0 - card.y - 85,
+                    (x1 - card.x - 2) / self.scale, y1 - card.y - 85]
+        x0, y0, x1, y1 = coords
+        card.canvas.coords(item, card.x + 2 + x0 * self.scale, card.y + 85 + y0,
+                           card.x + 2 + x1 * self.scale, card.y + 85 + y1)
+        return None
+
+    def itemconfig(self, item: int, fill: Optional[str] = None, **kwargs):
+        if fill is not None:
+            self.card.set_color(item, fill)
+
+
+class StackCard:
+    """Uma notificação desenhada no canvas da NotificationStack"""
+
+    def __init__(self, stack: "NotificationStack", serial: int):
+        self.stack = stack
+        self.canvas = stack.canvas
+        self.tag = f"card{serial}"
+        self.alive = True
+        self.slot = 0
+        self.alpha = 0.0
+        # Posição do canto superior esquerdo do card no canvas
+        self.x = 0.0
+        self.y = 0.0
+        # item -> cor final (RGB 0-255), misturada com o fundo conforme alpha
+        self._colors: Dict[int, Tuple[int, int, int]] = {}
+
+        canvas, tag, width = self.canvas, self.tag, stack.WIDTH
+        height = stack.CARD_HEIGHT
+        border = canvas.create_rectangle(0, 0, width, height, outline="", tags=tag)
+        inner = canvas.create_rectangle(2, 2, width - 2, height - 2, outline="", tags=tag)
+        header = canvas.create_rectangle(2, 2, width - 2, 32, outline="", tags=tag)
+        title = canvas.create_text(12, 17, anchor='w', font=("Arial", 9, "bold"), tags=tag)
+        close = canvas.create_text(width - 12, 17, anchor='e', text="✕",
+                                   font=("Arial", 10), tags=tag)
+        message = canvas.create_text(12, 40, anchor='nw', width=280, justify='left',
+                                     font=("Arial", 8), tags=tag)
+        bar = canvas.create_rectangle(2, height - 5, width - 2, height - 2,
+                                      outline="", tags=tag)
+
+        for item, color in ((inner, "#1a1a1a"), (title, "white"),
+                            (close, "white"), (message, "white")):
+            self.set_color(item, color)
+        self.close_item = close
+        # Aplicadores dos tweens, criados uma vez por card
+        self.apply_position = lambda v: self.move_to(v[0], v[1])
+        self.apply_alpha = lambda v: self.set_alpha(v[0])
+
+        # Interface das janelas de notificação (ver NotificationManager._build_window)
+        self.themed = (_ItemProxy(self, border), _ItemProxy(self, header))
+        self.title_label = _ItemProxy(self, title)
+        self.message_label = _ItemProxy(self, message)
+        self.progress_canvas = _ProgressProxy(self)
+        self.progress_bar = bar
+
+    def _root(self) -> tk.Tk:
+        return self.canvas._root()
+
+    def winfo_exists(self) -> bool:
+        return self.alive
+
+    def after(self, ms: int, func: Callable):
+        return self.canvas.after(ms, func)
+
+    def set_color(self, item: int, color: str):
+        """Define a cor final de um item (aplicada conforme o alpha atual)"""
+        r, g, b = self.canvas.winfo_rgb(color)
+        self._colors[item] = (r >> 8, g >> 8, b >> 8)
+        self.canvas.itemconfig(item, fill=self.stack.blend(self._colors[item], self.alpha))
+
+    def set_alpha(self, alpha: float):
+        """Fade do card: mistura todas as cores com o fundo da janela"""
+        self.alpha = alpha
+        blend, itemconfig = self.stack.blend, self.canvas.itemconfig
+        for item, rgb in self._colors.items():
+            itemconfig(item, fill=blend(rgb, alpha))
+
+    def move_to(self, x: float, y: float):
+        self.canvas.move(self.tag, x - self.x, y - self.y)
+        self.x = x
+        self.y = y
+
+    def destroy(self):
+        if self.alive:
+            self.alive = False
+            self.canvas.delete(self.tag)
+
+
+class NotificationStack:
+    """Janela única, sem borda e no topo, com todas as notificações empilhadas"""
+
+    WIDTH = 320
+    CARD_HEIGHT = 90
+    GAP = 10
+
+    def __init__(self, on_close: Callable[[StackCard], None]):
+        """
+        Args:
+            on_close: Chamado com o card quando o ✕ dele é clicado
+        """
+        self.on_close = on_close
+        self.window = tk.Toplevel()
+        self.window.withdraw()
+        self.window.overrideredirect(True)
+        self.window.attributes("-topmost", True)
+        self.window.attributes("-alpha", 0.95)
+
+        self.canvas = tk.Canvas(self.window, width=self.WIDTH, height=0, bg=BG_COLOR,
+                                highlightthickness=0, bd=0)
+        self.canvas.pack(fill='both', expand=True)
+
+        r, g, b = self.canvas.winfo_rgb(BG_COLOR)
+        self._bg = (r >> 8, g >> 8, b >> 8)
+        self.cards: List[StackCard] = []
+        self.tweener = Tweener.for_widget(self.window)
+        self._serial = 0
+        self._slots = 0
+
+    def blend(self, rgb: Tuple[int, int, int], alpha: float) -> str:
+        """Cor ``rgb`` com opacidade ``alpha`` sobre o fundo"""
+        br, bg, bb = self._bg
+        return '#%02x%02x%02x' % (int(br + (rgb[0] - br) * alpha),
+                                  int(bg + (rgb[1] - bg) * alpha),
+                                  int(bb + (rgb[2] - bb) * alpha))
+
+    def slot_y(self, index: int) -> float:
+        """Topo do card na posição ``index`` (0 = embaixo); o fundo do canvas é y=0"""
+        return -(index + 1) * (self.CARD_HEIGHT + self.GAP) + self.GAP
+
+    def create_card(self) -> StackCard:
+        """Cria um card invisível fora da área visível"""
+        self._serial += 1
+        card = StackCard(self, self._serial)
+        card.move_to(self.WIDTH, 0)
+        self.canvas.tag_bind(card.close_item, "<Button-1>", lambda e: self.on_close(card))
+        self.cards.append(card)
+        return card
+
+    def present(self, card: StackCard, index: int):
+        """Desliza o card da direita para a posição ``index`` com fade-in"""
+        card.slot = index
+        self._fit()
+        y = self.slot_y(index)
+        card.move_to(self.WIDTH, y)
+        self.tweener.tween((card, 'position'), (self.WIDTH, y), (0, y), 225,
+                           card.apply_position, 'out_cubic')
+        self.tweener.tween((card, 'alpha'), (0.0,), (1.0,), 225, card.apply_alpha, 'linear')
+
+    def move_card(self, card: StackCard, index: int):
+        """Leva o card para a posição ``index`` (retoma de onde estiver)"""
+        card.slot = index
+        self.tweener.tween((card, 'position'), (card.x, card.y), (0, self.slot_y(index)),
+                           200, card.apply_position, 'out_cubic', on_done=self._fit)
+
+    def dismiss(self, card: StackCard, callback: Optional[Callable[[], None]] = None):
+        """Desliza o card para a direita com fade-out e chama ``callback``"""
+        self.tweener.tween((card, 'position'), (card.x, card.y), (self.WIDTH, card.y),
+                           225, card.apply_position, 'in_cubic')
+        self.tweener.tween((card, 'alpha'), (card.alpha,), (0.0,), 225,
+                           card.apply_alpha, 'linear', on_done=callback)
+
+    def remove(self, card: StackCard):
+        """Apaga o card; a janela some quando não há mais nenhum"""
+        card.destroy()
+        if card in self.cards:
+            self.cards.remove(card)
+        self._fit()
+
+    def _fit(self):
+        """Ajusta a altura da janela às posições ocupadas (uma chamada geometry)"""
+        slots = max((c.slot + 1 for c in self.cards), default=0)
+        if slots == self._slots:
+            return
+        self._slots = slots
+        window = self.window
+        if not slots:
+            window.withdraw()
+            return
+
+        height = slots * (self.CARD_HEIGHT + self.GAP) - self.GAP
+        x = window.winfo_screenwidth() - self.WIDTH - 20
+        y = window.winfo_screenheight() - 60 - height
+        window.geometry(f"{self.WIDTH}x{height}+{x}+{y}")
+        self.canvas.configure(height=height, scrollregion=(0, -height, self.WIDTH, 0))
+        self.canvas.yview_moveto(0)
+        window.deiconify()
@@ -0,0 +1,34 @@
+"""
+Dependências opcionais carregadas sob demanda.
+
+O NumPy acelera partículas, buffers e escala dos gráficos, mas importá-lo
+custa ~90 ms. Nenhum módulo o importa no topo: ``import clivgui`` não paga
+por ele, e o import só acontece quando um objeto escolhe o backend NumPy.
+"""
+
+from typing import Optional, Any
+
+_numpy: Any = None
+_numpy_missing = False
+
+
+def load_numpy(use_numpy: Optional[bool] = None) -> Any:
+    """
+    Módulo ``numpy`` para o backend escolhido, ou None para usar a alternativa
+
+    Args:
+        use_numpy: True exige o NumPy (RuntimeError se ausente), False desativa,
+            None usa se estiver instalado
+    """
+    global _numpy, _numpy_missing
+    if use_numpy is False:
+        return None
+    if _numpy is None and not _numpy_missing:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy_missing = True
+    if _numpy is None and use_numpy:
+        raise RuntimeError("NumPy não está instalado")
+    return _numpy
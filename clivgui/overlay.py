@@ -0,0 +1,248 @@
+"""Overlay transparente sobre janelas de processos Windows"""
+
+import tkinter as tk
+from typing import Optional, Tuple, Callable, Awaitable
+
+import psutil
+import win32gui
+import win32process
+
+from .clock import FrameClock, FrameHandle
+from .dispatch import UIDispatcher
+
+
+class ProcessOverlay:
+    """Overlay transparente que acompanha a janela de um processo"""
+
+    def __init__(self, process_name: str, bg_color: str = "#000000", alpha: float = 0.3):
+        """
+        Args:
+            process_name: Nome do processo (ex: "notepad.exe" ou "chrome.exe")
+            bg_color: Cor de fundo do overlay
+            alpha: Transparência (0.0 a 1.0)
+        """
+        if not 0.0 <= alpha <= 1.0:
+            raise ValueError("Alpha deve estar entre 0.0 e 1.0")
+
+        self.process_name = process_name
+        self.hwnd = None
+        self.running = False
+        self.alpha = alpha
+        self._poll_interval = 16
+        self._poll_handle: Optional[FrameHandle] = None
+
+        try:
+            self.root = tk.Tk()
+            self.root.overrideredirect(True)
+            self.root.attributes("-topmost", True)
+            self.root.attributes("-transparentcolor", bg_color)
+            self.root.attributes("-alpha", alpha)
+            self.root.config(bg=bg_color)
+
+            self.canvas = tk.Canvas(
+                self.root,
+                bg=bg_color,
+                highlightthickness=0,
+                bd=0
+            )
+            self.canvas.pack(fill='both', expand=True)
+            self.drawings = []
+            self.clock = FrameClock.for_widget(self.root)
+        except Exception as e:
+            raise RuntimeError(f"Erro ao inicializar overlay: {e}")
+
+    def find_process_window(self) -> Optional[int]:
+        """Encontra a janela do processo pelo nome"""
+        def callback(hwnd, hwnds):
+            if win32gui.IsWindowVisible(hwnd):
+                try:
+                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                    process = psutil.Process(pid)
+                    if process.name().lower() == self.process_name.lower():
+                        hwnds.append(hwnd)
+                except (psutil.NoSuchProcess, psutil.AccessDenied, Exception):
+                    pass
+            return True
+
+        hwnds = []
+        try:
+            win32gui.EnumWindows(callback, hwnds)
+        except Exception:
+            return None
+        return hwnds[0] if hwnds else None
+
+    def get_window_rect(self, hwnd: int) -> Optional[Tuple[int, int, int, int]]:
+        """Obtém posição e tamanho da janela"""
+        try:
+            rect = win32gui.GetWindowRect(hwnd)
+            x, y = rect[0], rect[1]
+            w = rect[2] - rect[0]
+            h = rect[3] - rect[1]
+            return x, y, w, h
+        except Exception:
+            return None
+
+    @property
+    def poll_interval(self) -> int:
+        """Intervalo (ms) de acompanhamento da janela (ajustável pelo FrameGovernor)"""
+        return self._poll_interval
+
+    @poll_interval.setter
+    def poll_interval(self, value: int):
+        self._poll_interval = int(value)
+        if self._poll_handle is not None:
+            self._poll_handle.interval_ms = self._poll_interval
+
+    def update_position(self) -> Optional[bool]:
+        """Atualiza posição do overlay para seguir a janela do processo"""
+        if not self.running:
+            return False
+
+        try:
+            if not self.hwnd:
+                self.hwnd = self.find_process_window()
+
+            if self.hwnd:
+                if not win32gui.IsWindow(self.hwnd):
+                    self.hwnd = self.find_process_window()
+
+                if self.hwnd:
+                    rect = self.get_window_rect(self.hwnd)
+                    if rect:
+                        x, y, w, h = rect
+                        self.root.geometry(f"{w}x{h}+{x}+{y}")
+        except Exception:
+            self.hwnd = None
+
+        return None
+
+    def draw_rectangle(self, x: int, y: int, width: int, height: int,
+                      color: str = "red", thickness: int = 2,
+                      fill: Optional[str] = None) -> int:
+        """Desenha um retângulo no overlay"""
+        rect_id = self.canvas.create_rectangle(
+            x, y, x + width, y + height,
+            outline=color,
+            width=thickness,
+            fill=fill if fill else ""
+        )
+        self.drawings.append(rect_id)
+        return rect_id
+
+    def draw_line(self, x1: int, y1: int, x2: int, y2: int,
+                  color: str = "red", thickness: int = 2) -> int:
+        """Desenha uma linha no overlay"""
+        line_id = self.canvas.create_line(
+            x1, y1, x2, y2,
+            fill=color,
+            width=thickness
+        )
+        self.drawings.append(line_id)
+        return line_id
+
+    def draw_circle(self, x: int, y: int, radius: int,
+                    color: str = "red", thickness: int = 2,
+                    fill: Optional[str] = None) -> int:
+        """Desenha um círculo no overlay"""
+        circle_id = self.canvas.create_oval(
+            x - radius, y - radius,
+            x + radius, y + radius,
+            outline=color,
+            width=thickness,
+            fill=fill if fill else ""
+        )
+        self.drawings.append(circle_id)
+        return circle_id
+
+    def draw_text(self, x: int, y: int, text: str,
+                  color: str = "white",
+                  font: Tuple[str, int, str] = ("Arial", 12, "bold")) -> int:
+        """Desenha texto no overlay"""
+        text_id = self.canvas.create_text(
+            x, y,
+            text=text,
+            fill=color,
+            font=font
+        )
+        self.drawings.append(text_id)
+        return text_id
+
+    def draw_crosshair(self, x: int, y: int, size: int = 20,
+                       color: str = "lime", thickness: int = 2):
+        """Desenha uma mira (crosshair) no overlay"""
+        self.draw_line(x - size, y, x + size, y, color, thickness)
+        self.draw_line(x, y - size, x, y + size, color, thickness)
+
+    def clear_drawings(self):
+        """Limpa todos os desenhos"""
+        for drawing_id in self.drawings:
+            try:
+                self.canvas.delete(drawing_id)
+            except Exception:
+                pass
+        self.drawings.clear()
+
+    def delete_drawing(self, drawing_id: int):
+        """Remove um desenho específico"""
+        try:
+            self.canvas.delete(drawing_id)
+            if drawing_id in self.drawings:
+                self.drawings.remove(drawing_id)
+        except Exception:
+            pass
+
+    def set_alpha(self, alpha: float):
+        """Define a transparência do overlay (0.0 a 1.0)"""
+        if not 0.0 <= alpha <= 1.0:
+            raise ValueError("Alpha deve estar entre 0.0 e 1.0")
+        self.alpha = alpha
+        self.root.attributes("-alpha", self.alpha)
+
+    def start(self) -> bool:
+        """Inicia o overlay"""
+        self.running = True
+        self.hwnd = self.find_process_window()
+
+        if not self.hwnd:
+            print(f"Processo '{self.process_name}' não encontrado!")
+            return False
+
+        self.update_position()
+        if self._poll_handle is None or not self._poll_handle.active:
+            self._poll_handle = self.clock.add(self.update_position, self._poll_interval)
+        return True
+
+    def stop(self):
+        """Para o overlay"""
+        self.running = False
+        if self._poll_handle is not None:
+            self._poll_handle.cancel()
+            self._poll_handle = None
+        try:
+            self.root.destroy()
+        except Exception:
+            pass
+
+    def run(self):
+        """Inicia o loop principal do overlay"""
+        if self.start():
+            self.root.mainloop()
+
+    def run_async(self, main: Optional[Callable[[], Awaitable]] = None):
+        """
+        Inicia o loop principal junto com um event loop asyncio
+
+        Args:
+            main: Função async iniciada junto com o overlay
+        """
+        from .aio import AsyncBridge
+
+        if not self.start():
+            return
+        bridge = AsyncBridge(UIDispatcher.for_widget(self.root))
+        if main is not None:
+            bridge.schedule(main())
+        try:
+            self.root.mainloop()
+        finally:
+            bridge.stop()
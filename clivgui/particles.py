@@ -0,0 +1,367 @@
+"""
+Sistema de partículas do fundo do ClivMenu.
+
+O estado das partículas fica em ``ParticleState`` como estrutura de arrays
+(um array por atributo), com NumPy quando disponível e ``array`` da
+biblioteca padrão como alternativa. Movimento, wraparound e respawn são
+feitos em lote a cada tick.
+
+Renderizadores:
+
+- ``canvas``: um ``create_oval`` por partícula, movido com ``coords`` a cada
+  frame (comportamento original; barato com poucas partículas).
+- ``image``: todas as partículas são rasterizadas em um buffer fora da tela,
+  compostas sobre o fundo e enviadas ao Tk com uma única atualização de
+  ``PhotoImage`` por frame (custo do Tk independe da quantidade).
+"""
+
+import random
+import tkinter as tk
+from array import array
+from itertools import islice, repeat
+from operator import add, mod, sub
+from typing import Optional, Tuple, Any, TYPE_CHECKING
+
+from .optional import load_numpy
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+PARTICLE_BACKENDS = ('canvas', 'image')
+
+# Fração superior da tela em que as partículas desaparecem gradualmente
+FADE_ZONE = 0.25
+
+
+def _hex_to_rgb(color: str, widget: Optional[tk.Misc] = None) -> Tuple[int, int, int]:
+    """Converte um nome/hex de cor em RGB 0-255"""
+    if widget is not None:
+        r, g, b = widget.winfo_rgb(color)
+        return r >> 8, g >> 8, b >> 8
+    from PIL import ImageColor
+    return ImageColor.getrgb(color)[:3]
+
+
+class ParticleState:
+    """Estado das partículas em estrutura de arrays (NumPy ou array)"""
+
+    FIELDS = ('x', 'y', 'vx', 'vy', 'size', 'alpha')
+
+    def __init__(self, count: int, width: int, height: int,
+                 speed_range: Tuple[float, float] = (0.2, 0.8),
+                 drift: float = 0.15, size_range: Tuple[int, int] = (1, 3),
+                 opacity_range: Tuple[float, float] = (0.3, 1.0),
+                 use_numpy: Optional[bool] = None):
+        """
+        Args:
+            count: Quantidade de partículas
+            width: Largura da área
+            height: Altura da área
+            speed_range: Range da velocidade vertical (pixels por tick)
+            drift: Deriva horizontal máxima (pixels por tick, para ambos os lados)
+            size_range: Range do tamanho (pixels)
+            opacity_range: Range da opacidade base
+            use_numpy: Força (True) ou desativa (False) o NumPy; None = automático
+        """
+        # Importa o NumPy só aqui, quando o backend é escolhido
+        np = load_numpy(use_numpy)
+
+        self.count = count
+        self.active = count
+        self.width = width
+        self.height = height
+        self.speed_range = speed_range
+        self.drift = drift
+        self.size_range = size_range
+        self.opacity_range = opacity_range
+        self.backend = 'numpy' if np is not None else 'array'
+        self._fade_scale = 1.0 / max(1.0, height * FADE_ZONE)
+
+        if self.backend == 'numpy':
+            rng = np.random.default_rng()
+            self._rng = rng
+            f32 = np.float32
+            self.x = rng.uniform(0, width, count).astype(f32)
+            self.y = rng.uniform(0, height, count).astype(f32)
+            self.vx = rng.uniform(-drift, drift, count).astype(f32)
+            self.vy = rng.uniform(speed_range[0], speed_range[1], count).astype(f32)
+            self.size = rng.integers(size_range[0], size_range[1] + 1, count).astype(f32)
+            self.alpha = rng.uniform(opacity_range[0], opacity_range[1], count).astype(f32)
+        else:
+            uniform = random.uniform
+            self.x = array('f', (uniform(0, width) for _ in range(count)))
+            self.y = array('f', (uniform(0, height) for _ in range(count)))
+            self.vx = array('f', (uniform(-drift, drift) for _ in range(count)))
+            self.vy = array('f', (uniform(*speed_range) for _ in range(count)))
+            self.size = array('f', (random.randint(*size_range) for _ in range(count)))
+            self.alpha = array('f', (uniform(*opacity_range) for _ in range(count)))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def set_active(self, active: int):
+        """Define quantas partículas (as primeiras) são simuladas e desenhadas"""
+        self.active = max(0, min(int(active), self.count))
+
+    def step(self):
+        """Avança um tick: sobe, deriva, faz wraparound horizontal e respawn embaixo"""
+        width, height = self.width, self.height
+        n = self.active
+
+        if self.backend == 'numpy':
+            import numpy as np
+
+            x, y = self.x[:n], self.y[:n]
+            y -= self.vy[:n]
+            x += self.vx[:n]
+            np.mod(x, width, out=x)
+            dead = y < 0
+            respawned = int(np.count_nonzero(dead))
+            if respawned:
+                y[dead] = height
+                x[dead] = self._rng.uniform(0, width, respawned)
+            return
+
+        # Sem NumPy: operações em lote via map (laço em C), respawn só se preciso
+        x, y = self.x, self.y
+        y[:n] = array('f', map(sub, islice(y, n), self.vy))
+        x[:n] = array('f', map(mod, map(add, islice(x, n), self.vx), repeat(width)))
+        if n and min(islice(y, n)) < 0:
+            uniform = random.uniform
+            for i in [i for i, v in enumerate(islice(y, n)) if v < 0]:
+                y[i] = height
+                x[i] = uniform(0, width)
+
+    def opacity(self) -> Any:
+        """Opacidade efetiva das partículas ativas (base x desvanecimento no topo)"""
+        n = self.active
+        if self.backend == 'numpy':
+            import numpy as np
+
+            fade = np.minimum(self.y[:n] * self._fade_scale, 1.0)
+            return fade * self.alpha[:n]
+        scale = self._fade_scale
+        return array('f', (min(yv * scale, 1.0) * a
+                           for yv, a in zip(islice(self.y, n), self.alpha)))
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelos arrays de estado"""
+        total = 0
+        for name in self.FIELDS:
+            arr = getattr(self, name)
+            total += arr.nbytes if self.backend == 'numpy' else arr.itemsize * len(arr)
+        return total
+
+    @property
+    def bytes_per_particle(self) -> float:
+        return self.nbytes / self.count if self.count else 0.0
+
+
+class ParticleRenderer:
+    """
+    Base dos renderizadores: mantém e avança o estado das partículas
+
+    Subclasses definem ``render()``, que desenha o estado atual no canvas.
+    """
+
+    def __init__(self, canvas: tk.Canvas, width: int, height: int,
+                 color: str = "white", count: int = 40,
+                 speed_range: Tuple[float, float] = (0.2, 0.8),
+                 bg_color: str = "#05050a", use_numpy: Optional[bool] = None):
+        """
+        Args:
+            canvas: Canvas de fundo do menu
+            width: Largura da área das partículas
+            height: Altura da área das partículas
+            color: Cor das partículas
+            count: Quantidade de partículas
+            speed_range: Range de velocidade das partículas
+            bg_color: Cor sólida de fundo (mistura de opacidade)
+            use_numpy: Ver ParticleState
+        """
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.color = color
+        self.bg_color = bg_color
+        self.speed_range = speed_range
+        self.state = ParticleState(count, width, height, speed_range,
+                                   use_numpy=use_numpy)
+
+    def set_background(self, image: Optional["Image.Image"]):
+        """Informa a imagem de fundo atual (usada apenas pelo backend 'image')"""
+
+    def set_active_fraction(self, fraction: float):
+        """Mantém ativa apenas uma fração das partículas (governador de qualidade)"""
+        state = self.state
+        old = state.active
+        state.set_active(round(state.count * max(0.0, min(fraction, 1.0))))
+        if state.active != old:
+            self._active_changed(old, state.active)
+
+    def _active_changed(self, old: int, new: int):
+        """Chamado quando a quantidade de partículas ativas muda"""
+
+    def step(self):
+        """Avança um frame e redesenha"""
+        self.state.step()
+        self.render()
+
+    def destroy(self):
+        """Remove os itens criados no canvas"""
+
+
+class CanvasParticleRenderer(ParticleRenderer):
+    """Uma oval do canvas por partícula"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        state = self.state
+        fg = _hex_to_rgb(self.color, self.canvas)
+        bg = _hex_to_rgb(self.bg_color, self.canvas)
+        self.ids = []
+        # Opacidade base aplicada uma vez, misturando a cor com o fundo;
+        # o desvanecimento por frame exigiria um itemconfig por partícula
+        for a in state.alpha:
+            a = float(a)
+            fill = '#%02x%02x%02x' % tuple(int(b + (f - b) * a) for f, b in zip(fg, bg))
+            self.ids.append(self.canvas.create_oval(0, 0, 0, 0, fill=fill, outline=""))
+
+    def render(self):
+        state = self.state
+        n = state.active
+        if state.backend == 'numpy':
+            xs, ys, sizes = state.x[:n].tolist(), state.y[:n].tolist(), state.size[:n].tolist()
+        else:
+            xs, ys, sizes = state.x, state.y, state.size
+        coords = self.canvas.coords
+        for item, x, y, s in zip(islice(self.ids, n), xs, ys, sizes):
+            coords(item, x, y, x + s, y + s)
+
+    def _active_changed(self, old: int, new: int):
+        if new < old:
+            for item in self.ids[new:old]:
+                self.canvas.itemconfigure(item, state='hidden')
+        else:
+            for item in self.ids[old:new]:
+                self.canvas.itemconfigure(item, state='normal')
+
+    def destroy(self):
+        for item in self.ids:
+            try:
+                self.canvas.delete(item)
+            except Exception:
+                pass
+
+
+class ImageParticleRenderer(ParticleRenderer):
+    """Rasteriza todas as partículas em uma imagem e atualiza um único PhotoImage"""
+
+    def __init__(self, *args, **kwargs):
+        from PIL import Image, ImageTk
+
+        super().__init__(*args, **kwargs)
+        self._fill = _hex_to_rgb(self.color)
+        self._base = Image.new("RGB", (self.width, self.height), _hex_to_rgb(self.bg_color))
+        self._base_arr = None
+        self._photo = ImageTk.PhotoImage(self._base)
+        self._item = self.canvas.create_image(0, 0, image=self._photo, anchor="nw",
+                                              tags="particles")
+
+    def set_background(self, image: Optional["Image.Image"]):
+        if image is None:
+            return
+        if image.size != (self.width, self.height):
+            image = image.resize((self.width, self.height))
+        self._base = image.convert("RGB")
+        self._base_arr = None
+
+    def compose(self) -> "Image.Image":
+        """Gera o frame (fundo + partículas) sem tocar no Tk"""
+        if self.state.backend == 'numpy':
+            return self._compose_numpy()
+        return self._compose_array()
+
+    def _compose_numpy(self) -> "Image.Image":
+        import numpy as np
+        from PIL import Image
+
+        if self._base_arr is None:
+            self._base_arr = np.asarray(self._base, dtype=np.uint8)
+
+        state = self.state
+        n = state.active
+        frame = self._base_arr.copy()
+        height, width = frame.shape[:2]
+        xi = state.x[:n].astype(np.intp)
+        yi = state.y[:n].astype(np.intp)
+        sizes = state.size[:n]
+        alpha = state.opacity()
+        color = np.asarray(self._fill, dtype=np.float32)
+        max_size = int(state.size_range[1])
+
+        # Um gather/scatter por deslocamento do "pincel", não por partícula
+        for dy in range(max_size):
+            for dx in range(max_size):
+                mask = sizes > max(dx, dy)
+                xx = xi + dx
+                yy = yi + dy
+                mask &= (xx < width) & (yy < height) & (yy >= 0)
+                if not mask.any():
+                    continue
+                xx, yy = xx[mask], yy[mask]
+                a = alpha[mask][:, None]
+                px = frame[yy, xx].astype(np.float32)
+                frame[yy, xx] = (px + (color - px) * a).astype(np.uint8)
+
+        return Image.fromarray(frame, "RGB")
+
+    def _compose_array(self) -> "Image.Image":
+        from PIL import Image, ImageDraw
+
+        state = self.state
+        overlay = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+        r, g, b = self._fill
+
+        # Agrupa por nível de opacidade: um draw.point por nível
+        levels = 8
+        buckets = [[] for _ in range(levels)]
+        for x, y, s, a in zip(state.x, state.y, state.size, state.opacity()):
+            level = min(int(a * levels), levels - 1)
+            x, y, s = int(x), int(y), int(s)
+            bucket = buckets[level]
+            for dy in range(s):
+                for dx in range(s):
+                    bucket.append((x + dx, y + dy))
+
+        for level, points in enumerate(buckets):
+            if points:
+                draw.point(points, fill=(r, g, b, int(255 * (level + 0.5) / levels)))
+
+        return Image.alpha_composite(self._base.convert("RGBA"), overlay).convert("RGB")
+
+    def render(self):
+        self._photo.paste(self.compose())
+
+    def destroy(self):
+        try:
+            self.canvas.delete(self._item)
+        except Exception:
+            pass
+
+
+def create_particle_renderer(backend: str, canvas: tk.Canvas, width: int, height: int,
+                             color: str = "white", count: int = 40,
+                             speed_range: Tuple[float, float] = (0.2, 0.8),
+                             bg_color: str = "#05050a") -> ParticleRenderer:
+    """Cria o renderizador de partículas do backend escolhido"""
+    if backend == 'canvas':
+        return CanvasParticleRenderer(canvas, width, height, color, count, speed_range,
+                                      bg_color=bg_color)
+    if backend == 'image':
+        return ImageParticleRenderer(canvas, width, height, color, count, speed_range,
+                                     bg_color=bg_color)
+    raise ValueError(f"Backend de partículas inválido: {backend!r} "
+                     f"(use um de {', '.join(PARTICLE_BACKENDS)})")
@@ -0,0 +1,131 @@
+"""Rastreamento opcional das fases de inicialização do ClivMenu"""
+
+import functools
+import json
+import os
+import time
+import tkinter as tk
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List
+
+PROFILE_ENV_VAR = "CLIVGUI_PROFILE_STARTUP"
+PROFILE_OUTPUT_ENV_VAR = "CLIVGUI_PROFILE_OUTPUT"
+
+
+def profiling_requested(flag: Optional[bool] = None) -> bool:
+    """Retorna se o trace deve ser ativado (parâmetro explícito ou variável de ambiente)"""
+    if flag is not None:
+        return flag
+    return os.environ.get(PROFILE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class StartupProfiler:
+    """Mede tempo, widgets Tk e itens de canvas de cada fase da inicialização"""
+
+    def __init__(self, root: Optional[tk.Misc] = None):
+        """
+        Args:
+            root: Janela raiz usada para contar widgets (pode ser definida depois)
+        """
+        self.root = root
+        self.started_at = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+        self.first_paint_ms: Optional[float] = None
+        self._depth = 0
+
+    def attach(self, root: tk.Misc):
+        """Define a janela raiz usada nas contagens"""
+        self.root = root
+
+    def _count(self) -> Dict[str, int]:
+        """Conta widgets Tk e itens de canvas na árvore da janela raiz"""
+        if self.root is None:
+            return {'tk_widgets': 0, 'canvas_items': 0}
+
+        widgets = 0
+        items = 0
+        stack = [self.root]
+        try:
+            while stack:
+                widget = stack.pop()
+                widgets += 1
+                if isinstance(widget, tk.Canvas):
+                    items += len(widget.find_all())
+                stack.extend(widget.winfo_children())
+        except tk.TclError:
+            pass
+        return {'tk_widgets': widgets, 'canvas_items': items}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Context manager que registra uma fase (fases podem ser aninhadas)"""
+        before = self._count()
+        start = time.perf_counter()
+        entry = {
+            'name': name,
+            'depth': self._depth,
+            'start_ms': (start - self.started_at) * 1000,
+        }
+        # Registrar na ordem de entrada para manter a hierarquia legível
+        self.phases.append(entry)
+        self._depth += 1
+        try:
+            yield entry
+        finally:
+            self._depth -= 1
+            elapsed = time.perf_counter() - start
+            after = self._count()
+            entry['wall_ms'] = elapsed * 1000
+            entry['tk_widgets'] = after['tk_widgets'] - before['tk_widgets']
+            entry['canvas_items'] = after['canvas_items'] - before['canvas_items']
+            entry['total_tk_widgets'] = after['tk_widgets']
+            entry['total_canvas_items'] = after['canvas_items']
+
+    def mark_first_paint(self):
+        """Registra o momento em que o Tk ficou ocioso pela primeira vez"""
+        if self.first_paint_ms is None:
+            self.first_paint_ms = (time.perf_counter() - self.started_at) * 1000
+            output = os.environ.get(PROFILE_OUTPUT_ENV_VAR)
+            if output:
+                try:
+                    with open(output, "w", encoding="utf-8") as fh:
+                        fh.write(self.to_json())
+                except OSError:
+                    pass
+
+    def report(self) -> Dict[str, Any]:
+        """Retorna o relatório estruturado das fases"""
+        totals = self._count()
+        return {
+            'total_ms': (time.perf_counter() - self.started_at) * 1000,
+            'first_paint_ms': self.first_paint_ms,
+            'tk_widgets': totals['tk_widgets'],
+            'canvas_items': totals['canvas_items'],
+            'phases': [dict(p) for p in self.phases],
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Retorna o relatório em JSON"""
+        return json.dumps(self.report(), indent=indent)
+
+
+def _find_profiler(args, kwargs) -> Optional[StartupProfiler]:
+    """Procura o profiler do menu entre os argumentos de um construtor"""
+    candidates = [kwargs.get('menu_ref')] + list(args)
+    for candidate in candidates:
+        profiler = getattr(candidate, 'startup_profiler', None)
+        if isinstance(profiler, StartupProfiler):
+            return profiler
+    return None
+
+
+def traced_init(init):
+    """Decorator para ``__init__`` de widgets: registra a construção como uma fase"""
+    @functools.wraps(init)
+    def wrapper(self, *args, **kwargs):
+        profiler = _find_profiler(args, kwargs)
+        if profiler is None:
+            return init(self, *args, **kwargs)
+        with profiler.phase(type(self).__name__):
+            return init(self, *args, **kwargs)
+    return wrapper
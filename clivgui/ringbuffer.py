@@ -0,0 +1,134 @@
+"""
+Buffer circular de capacidade fixa para séries de gráficos.
+
+Guarda as amostras em um buffer com o dobro da capacidade: cada valor é
+escrito em duas posições (``i`` e ``i + capacity``), então a janela da mais
+antiga para a mais recente é sempre um trecho contínuo. ``append`` é O(1) e
+``view`` devolve esse trecho sem copiar (fatia NumPy ou ``memoryview`` de um
+``array`` da biblioteca padrão).
+"""
+
+from array import array
+from itertools import islice
+from typing import Optional, Iterable, List, Any
+
+from .optional import load_numpy
+
+
+class RingBuffer:
+    """Janela deslizante com as últimas ``capacity`` amostras (NumPy ou array)"""
+
+    def __init__(self, capacity: int, fill: float = 0.0, use_numpy: Optional[bool] = None):
+        """
+        Args:
+            capacity: Quantidade de amostras guardadas
+            fill: Valor inicial de todas as posições
+            use_numpy: Força (True) ou desativa (False) o NumPy; None = automático
+        """
+        if capacity < 1:
+            raise ValueError("capacity deve ser >= 1")
+        # Importa o NumPy só aqui, quando o backend é escolhido
+        np = load_numpy(use_numpy)
+
+        self.capacity = capacity
+        self.backend = 'numpy' if np is not None else 'array'
+        # Próxima posição de escrita; a janela é _buf[_head:_head + capacity]
+        self._head = 0
+        # Amostras gravadas desde o último reset (sem contar o preenchimento)
+        self.written = 0
+
+        if self.backend == 'numpy':
+            self._buf = np.full(capacity * 2, fill, dtype=np.float64)
+        else:
+            self._buf = array('d', [fill]) * (capacity * 2)
+
+    def __len__(self) -> int:
+        return self.capacity
+
+    @property
+    def filled(self) -> int:
+        """Amostras reais na janela (o resto é o valor de preenchimento)"""
+        return min(self.written, self.capacity)
+
+    def append(self, value: float):
+        """Adiciona uma amostra, descartando a mais antiga (O(1))"""
+        head = self._head
+        buf = self._buf
+        buf[head] = value
+        buf[head + self.capacity] = value
+        head += 1
+        self._head = 0 if head == self.capacity else head
+        self.written += 1
+
+    def extend(self, values: Iterable[float]):
+        """Adiciona várias amostras; só as últimas ``capacity`` são copiadas"""
+        if self.backend == 'numpy':
+            import numpy as np
+
+            if not isinstance(values, (list, tuple, array, np.ndarray)):
+                values = list(values)
+            chunk = np.asarray(values, dtype=np.float64).ravel()
+        elif isinstance(values, (list, tuple, array)):
+            chunk = values
+        else:
+            chunk = list(values)
+        total = len(chunk)
+        if not total:
+            return
+
+        cap = self.capacity
+        if total > cap:
+            chunk = chunk[total - cap:]
+        n = len(chunk)
+        buf, head = self._buf, self._head
+
+        # Até duas fatias contínuas por metade do buffer
+        first = min(n, cap - head)
+        if self.backend == 'array' and not (isinstance(chunk, array) and chunk.typecode == 'd'):
+            chunk = array('d', chunk)
+        buf[head:head + first] = chunk[:first]
+        buf[head + cap:head + cap + first] = chunk[:first]
+        rest = n - first
+        if rest:
+            buf[0:rest] = chunk[first:]
+            buf[cap:cap + rest] = chunk[first:]
+        self._head = (head + n) % cap
+        self.written += total
+
+    def view(self) -> Any:
+        """Janela da mais antiga para a mais recente, sem cópia
+
+        Válida até a próxima escrita; para guardar, use ``snapshot``.
+        """
+        head = self._head
+        if self.backend == 'numpy':
+            return self._buf[head:head + self.capacity]
+        return memoryview(self._buf)[head:head + self.capacity]
+
+    def snapshot(self) -> List[float]:
+        """Cópia da janela como lista"""
+        if self.backend == 'numpy':
+            return self.view().tolist()
+        return list(islice(self._buf, self._head, self._head + self.capacity))
+
+    def __getitem__(self, index: int) -> float:
+        cap = self.capacity
+        if not -cap <= index < cap:
+            raise IndexError("índice fora da janela")
+        return float(self._buf[self._head + index % cap])
+
+    @property
+    def last(self) -> float:
+        """Amostra mais recente"""
+        return self[-1]
+
+    def reset(self, values: Optional[Iterable[float]] = None, fill: float = 0.0):
+        """Preenche com ``fill`` e, se informado, grava ``values``"""
+        if self.backend == 'numpy':
+            self._buf.fill(fill)
+        else:
+            self._buf[:] = array('d', [fill]) * (self.capacity * 2)
+        self._head = 0
+        self.written = 0
+        if values is not None:
+            self.extend(values)
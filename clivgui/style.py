@@ -0,0 +1,23 @@
+"""Estilos configuráveis compartilhados pelos widgets"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass
+class WidgetStyle:
+    """Estilo configurável para widgets"""
+    x: int = 0
+    y: int = 0
+    width: Optional[int] = None
+    height: Optional[int] = None
+    bg_color: str = "#1a1a1a"
+    fg_color: str = "white"
+    border_radius: int = 0
+    border_width: int = 0
+    border_color: str = "#555555"
+    padding: Tuple[int, int, int, int] = (10, 10, 10, 10)  # top, right, bottom, left
+    margin: Tuple[int, int, int, int] = (5, 5, 5, 5)
+    font: Tuple[str, int, str] = ("Arial", 9, "normal")
+    anchor: str = "nw"  # nw, n, ne, w, center, e, sw, s, se
+    pack: bool = True  # Se False, usa place() com x, y
@@ -0,0 +1,262 @@
+"""
+Motor de tweens com tabelas de easing pré-calculadas.
+
+Anima geometria e transparência de janelas, coordenadas de itens de canvas e
+cores ao longo do tempo, sobre o ``FrameClock`` da janela raiz. Cada tween
+tem uma chave (alvo + propriedade): iniciar outro tween com a mesma chave
+substitui o anterior partindo do valor atual, sem saltos nem consultas
+``winfo`` (ex.: um ``_smooth_move`` reiniciado no meio do movimento).
+
+Em regime, um frame não aloca estruturas do motor: os valores de cada tween
+ficam em arrays pré-alocados e atualizados no lugar.
+"""
+
+import time
+import tkinter as tk
+from array import array
+from typing import Optional, Callable, Sequence, Dict, Any, List, Tuple
+
+from .clock import FrameClock, FrameHandle
+
+EASING_TABLE_SIZE = 512
+
+# Atributo da janela raiz que guarda o Tweener dela
+_ROOT_ATTR = "_cliv_tweener"
+
+
+def _build_table(fn: Callable[[float], float]) -> array:
+    last = EASING_TABLE_SIZE - 1
+    return array('d', (fn(i / last) for i in range(EASING_TABLE_SIZE)))
+
+
+EASING_TABLES: Dict[str, array] = {
+    'linear': _build_table(lambda t: t),
+    'in_cubic': _build_table(lambda t: t * t * t),
+    'out_cubic': _build_table(lambda t: 1 - (1 - t) ** 3),
+    'in_out_cubic': _build_table(lambda t: 4 * t * t * t if t < 0.5
+                                 else 1 - (-2 * t + 2) ** 3 / 2),
+    'out_quad': _build_table(lambda t: 1 - (1 - t) * (1 - t)),
+}
+
+
+def ease(name: str, t: float) -> float:
+    """Consulta a tabela de easing ``name`` em ``t`` (0.0 a 1.0)"""
+    table = EASING_TABLES[name]
+    return table[int(max(0.0, min(t, 1.0)) * (EASING_TABLE_SIZE - 1))]
+
+
+def _hex_to_rgb(widget: tk.Misc, color: str) -> List[float]:
+    r, g, b = widget.winfo_rgb(color)
+    return [r / 257, g / 257, b / 257]
+
+
+class Tween:
+    """Interpolação de N valores; criada por Tweener.tween()"""
+
+    __slots__ = ('key', 'start', 'delta', 'current', 'duration', 'started_at',
+                 'table', 'apply', 'on_done', 'active', '_tweener')
+
+    def __init__(self, tweener: "Tweener", key: Any, start: Sequence[float],
+                 end: Sequence[float], duration_ms: float, easing: str,
+                 apply: Callable[[array], None], on_done: Optional[Callable[[], None]]):
+        if len(start) != len(end):
+            raise ValueError("start e end devem ter o mesmo tamanho")
+        self._tweener = tweener
+        self.key = key
+        self.start = array('d', start)
+        self.delta = array('d', (e - s for s, e in zip(start, end)))
+        self.current = array('d', start)
+        self.duration = max(duration_ms, 1) / 1000
+        self.started_at = time.perf_counter()
+        self.table = EASING_TABLES[easing]
+        self.apply = apply
+        self.on_done = on_done
+        self.active = True
+
+    @property
+    def end(self) -> Tuple[float, ...]:
+        """Valores finais do tween"""
+        return tuple(s + d for s, d in zip(self.start, self.delta))
+
+    def cancel(self):
+        """Interrompe o tween onde está (on_done não é chamado)"""
+        if self.active:
+            self.active = False
+            self._tweener._forget(self)
+
+    def _advance(self, now: float) -> bool:
+        """Atualiza ``current`` no lugar e aplica; retorna True ao terminar"""
+        t = (now - self.started_at) / self.duration
+        done = t >= 1.0
+        k = self.table[-1] if done else self.table[int(t * (EASING_TABLE_SIZE - 1))]
+        start, delta, current = self.start, self.delta, self.current
+        for i in range(len(current)):
+            current[i] = start[i] + delta[i] * k
+        self.apply(current)
+        return done
+
+
+class Tweener:
+    """Executa todos os tweens de uma janela raiz em um único callback do relógio"""
+
+    def __init__(self, root: tk.Misc, interval_ms: int = 16):
+        """
+        Args:
+            root: Janela raiz (tk.Tk)
+            interval_ms: Intervalo entre frames dos tweens
+        """
+        self.root = root
+        self.clock = FrameClock.for_widget(root)
+        self.interval_ms = interval_ms
+        self._tweens: List[Tween] = []
+        self._by_key: Dict[Any, Tween] = {}
+        self._handle: Optional[FrameHandle] = None
+
+    @classmethod
+    def for_widget(cls, widget: tk.Misc) -> "Tweener":
+        """Retorna (criando se preciso) o Tweener da janela raiz do widget"""
+        root = widget._root()
+        tweener = getattr(root, _ROOT_ATTR, None)
+        if tweener is None or tweener.clock._closed:
+            tweener = cls(root)
+            setattr(root, _ROOT_ATTR, tweener)
+        return tweener
+
+    def set_interval(self, interval_ms: int):
+        """Altera o intervalo entre frames (ex.: governador de qualidade)"""
+        self.interval_ms = interval_ms
+        if self._handle is not None:
+            self._handle.interval_ms = interval_ms
+
+    def __len__(self) -> int:
+        return len(self._tweens)
+
+    def get(self, key: Any) -> Optional[Tween]:
+        """Tween ativo da chave, se houver"""
+        return self._by_key.get(key)
+
+    def tween(self, key: Any, start: Sequence[float], end: Sequence[float],
+              duration_ms: float, apply: Callable[[array], None],
+              easing: str = 'out_cubic',
+              on_done: Optional[Callable[[], None]] = None) -> Tween:
+        """
+        Inicia um tween genérico.
+
+        Se já houver um tween ativo com a mesma chave e o mesmo número de
+        valores, ele é substituído e o novo parte do valor atual dele.
+        """
+        previous = self._by_key.get(key)
+        if previous is not None:
+            if len(previous.current) == len(start):
+                start = previous.current
+            previous.active = False
+            self._tweens.remove(previous)
+
+        tw = Tween(self, key, start, end, duration_ms, easing, apply, on_done)
+        self._tweens.append(tw)
+        self._by_key[key] = tw
+        if self._handle is None or not self._handle.active:
+            self._handle = self.clock.add(self._tick, self.interval_ms)
+        return tw
+
+    def _forget(self, tw: Tween):
+        if tw in self._tweens:
+            self._tweens.remove(tw)
+        if self._by_key.get(tw.key) is tw:
+            del self._by_key[tw.key]
+
+    def cancel(self, key: Any):
+        """Cancela o tween ativo da chave"""
+        tw = self._by_key.get(key)
+        if tw is not None:
+            tw.cancel()
+
+    def _tick(self) -> Optional[bool]:
+        now = time.perf_counter()
+        finished = None
+        for tw in self._tweens:
+            try:
+                done = tw._advance(now)
+            except Exception:
+                # Alvo destruído: encerra o tween sem callback
+                tw.on_done = None
+                done = True
+            if done:
+                if finished is None:
+                    finished = []
+                finished.append(tw)
+
+        if finished:
+            for tw in finished:
+                tw.active = False
+                self._forget(tw)
+            for tw in finished:
+                if tw.on_done is not None:
+                    try:
+                        tw.on_done()
+                    except Exception:
+                        pass
+
+        if not self._tweens:
+            self._handle = None
+            return False
+        return None
+
+    # ------------------------------------------------------------------
+    # Atalhos para alvos comuns
+    # ------------------------------------------------------------------
+
+    def move_window(self, window: tk.Misc, x: float, y: float,
+                    duration_ms: float = 225, easing: str = 'out_cubic',
+                    start: Optional[Sequence[float]] = None,
+                    on_done: Optional[Callable[[], None]] = None) -> Tween:
+        """Anima a posição de uma janela (retoma de onde um tween anterior parou)"""
+        key = (window, 'position')
+        if start is None and key not in self._by_key:
+            start = (window.winfo_x(), window.winfo_y())
+
+        def apply(v):
+            window.geometry(f"+{int(v[0])}+{int(v[1])}")
+
+        return self.tween(key, start or (x, y), (x, y), duration_ms, apply, easing, on_done)
+
+    def fade_window(self, window: tk.Misc, alpha: float,
+                    duration_ms: float = 225, easing: str = 'linear',
+                    start: Optional[float] = None,
+                    on_done: Optional[Callable[[], None]] = None) -> Tween:
+        """Anima a transparência (-alpha) de uma janela"""
+        key = (window, 'alpha')
+        if start is None and key not in self._by_key:
+            start = float(window.attributes("-alpha"))
+
+        def apply(v):
+            window.attributes("-alpha", v[0])
+
+        begin = (alpha,) if start is None else (start,)
+        return self.tween(key, begin, (alpha,), duration_ms, apply, easing, on_done)
+
+    def move_item(self, canvas: tk.Canvas, item: Any, coords: Sequence[float],
+                  duration_ms: float = 225, easing: str = 'out_cubic',
+                  start: Optional[Sequence[float]] = None,
+                  on_done: Optional[Callable[[], None]] = None) -> Tween:
+        """Anima as coordenadas de um item de canvas"""
+        key = (canvas, item, 'coords')
+        if start is None and key not in self._by_key:
+            start = canvas.coords(item)
+
+        def apply(v):
+            canvas.coords(item, *v)
+
+        return self.tween(key, start or coords, coords, duration_ms, apply, easing, on_done)
+
+    def color(self, widget: tk.Misc, start_color: str, end_color: str,
+              setter: Callable[[str], None], key: Any = None,
+              duration_ms: float = 225, easing: str = 'linear',
+              on_done: Optional[Callable[[], None]] = None) -> Tween:
+        """Anima uma cor; ``setter`` recebe a cor em hex a cada frame"""
+        def apply(v):
+            setter('#%02x%02x%02x' % (int(v[0]), int(v[1]), int(v[2])))
+
+        return self.tween(key if key is not None else (widget, 'color'),
+                          _hex_to_rgb(widget, start_color), _hex_to_rgb(widget, end_color),
+                          duration_ms, apply, easing, on_done)
@@ -0,0 +1,1019 @@
+"""Widgets independentes com estilo configurável"""
+
+import colorsys
+import math
+import os
+import threading
+import tkinter as tk
+from typing import Optional, Callable, Any, List, Sequence, Iterable, Dict, Tuple
+
+from .clock import FrameClock, FrameHandle
+from .autoscale import AxisScaler
+from .decimate import create_decimator, _Decimator
+from .dispatch import ui_thread
+from .menu import ClivMenu
+from .profiling import traced_init
+from .ringbuffer import RingBuffer
+from .style import WidgetStyle
+
+
+def _run_callback(menu: Optional[ClivMenu], callback: Callable, *args):
+    """Chama o callback do widget; callbacks async rodam no loop asyncio do menu"""
+    if menu is not None:
+        return menu.run_callback(callback, *args)
+    return callback(*args)
+
+
+class ImageSeparator:
+    """Separador visual com ícone opcional"""
+
+    @traced_init
+    def __init__(self, container: tk.Frame, text: str,
+                 icon_path: Optional[str] = None, menu_ref: Optional[ClivMenu] = None,
+                 style: Optional[WidgetStyle] = None):
+        """
+        Cria um separador visual
+
+        Args:
+            container: Container pai
+            text: Texto do separador
+            icon_path: Caminho para ícone opcional
+            menu_ref: Referência ao menu
+            style: Estilo customizado
+        """
+        if style is None:
+            style = WidgetStyle()
+
+        theme = menu_ref.theme if menu_ref else "#8e44ad"
+        bg = menu_ref.bg_color if menu_ref else style.bg_color
+
+        self.shell = tk.Frame(container, bg=bg, pady=style.padding[0],
+                             bd=0, highlightthickness=0)
+
+        if style.pack:
+            self.shell.pack(fill='x', padx=style.padding[3])
+        else:
+            self.shell.place(x=style.x, y=style.y, width=style.width, height=style.height)
+
+        if icon_path and os.path.exists(icon_path):
+            try:
+                from PIL import Image, ImageTk
+
+                img = Image.open(icon_path).resize((16, 16), Image.Resampling.LANCZOS)
+                self.photo = ImageTk.PhotoImage(img)
+                tk.Label(self.shell, image=self.photo, bg=bg).pack(side='left', padx=5)
+            except Exception:
+                pass
+
+        tk.Label(self.shell, text=text.upper(), fg=theme, bg=bg,
+                font=style.font).pack(side='left')
+        tk.Frame(self.shell, bg=theme, height=2, bd=0).pack(fill='x',
+                                                            side='bottom', pady=2)
+
+
+class _GraphCanvas:
+    """
+    Base dos gráficos: canvas, grade, rótulos do eixo e redesenho por frame
+
+    Subclasses definem ``update_graph()`` (o redesenho) e, se precisarem,
+    ``_layout()`` (itens que dependem do tamanho do canvas).
+    """
+
+    def __init__(self, container: tk.Frame, label: str, menu_ref: ClivMenu,
+                 style: Optional[WidgetStyle], max_fps: Optional[float],
+                 axis_labels: bool):
+        self.menu = menu_ref
+        self.max_fps = max_fps
+        self.samples_ingested = 0
+        self.frames_rendered = 0
+        self._dirty = False
+        self._redraw_handle: Optional[FrameHandle] = None
+
+        if style is None:
+            style = WidgetStyle()
+
+        self.shell = tk.Frame(container, bg=style.bg_color,
+                             pady=style.padding[0], bd=0)
+
+        if style.pack:
+            self.shell.pack(fill='x', padx=style.padding[3])
+        else:
+            self.shell.place(x=style.x, y=style.y, width=style.width, height=style.height)
+
+        tk.Label(self.shell, text=label, fg=menu_ref.theme, bg=style.bg_color,
+                font=style.font).pack(anchor="w")
+
+        canvas_width = style.width if style.width else 350
+        canvas_height = style.height if style.height else 60
+
+        self.canvas = tk.Canvas(self.shell, width=canvas_width, height=canvas_height,
+                               bg="#0a0a15", highlightthickness=1,
+                               highlightbackground="#222", bd=0)
+        self.canvas.pack()
+
+        # Modo retido: os itens são criados uma vez e atualizados com coords;
+        # a quantidade de itens do canvas não muda com as amostras
+        self._width = canvas_width
+        self._height = canvas_height
+        self._grid_items: List[int] = []
+        # Rótulos do eixo: texto só é trocado quando a faixa muda
+        self._axis_items: Tuple[int, ...] = ()
+        self._axis_range: Optional[Tuple[float, float]] = None
+        if axis_labels:
+            self._axis_items = tuple(
+                self.canvas.create_text(3, 0, anchor=anchor, fill="#555",
+                                        font=("Arial", 6), tags="axis")
+                for anchor in ('nw', 'sw'))
+        self.canvas.bind("<Configure>", self._on_resize, add='+')
+
+    def set_max_fps(self, max_fps: Optional[float]):
+        """Altera o limite de redesenhos por segundo (None = a cada amostra)"""
+        self.max_fps = max_fps
+        if self._redraw_handle is not None:
+            self._redraw_handle.cancel()
+            self._redraw_handle = None
+        if self._dirty:
+            self._invalidate()
+
+    def _invalidate(self):
+        """Marca o gráfico para redesenho no próximo frame"""
+        if self.max_fps is None:
+            self.update_graph()
+            return
+        self._dirty = True
+        if self._redraw_handle is None or not self._redraw_handle.active:
+            interval = max(1, int(1000 / self.max_fps))
+            self._redraw_handle = FrameClock.for_widget(self.canvas).add(self._redraw_tick,
+                                                                         interval)
+
+    def _redraw_tick(self) -> Optional[bool]:
+        if not self._dirty:
+            # Sem amostras novas: sai do relógio até a próxima
+            return False
+        self.update_graph()
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Amostras recebidas x frames desenhados"""
+        return {
+            'samples_ingested': self.samples_ingested,
+            'frames_rendered': self.frames_rendered,
+            'samples_per_frame': (self.samples_ingested / self.frames_rendered
+                                  if self.frames_rendered else 0.0),
+        }
+
+    def _build_grid(self):
+        """(Re)cria as linhas da grade para o tamanho atual"""
+        for item in self._grid_items:
+            self.canvas.delete(item)
+        self._grid_items = [
+            self.canvas.create_line(0, i, self._width, i, fill="#1a1a2e", dash=(2, 4))
+            for i in range(0, self._height + 1, 20)
+        ]
+        self.canvas.tag_lower("fill")
+        for item in self._grid_items:
+            self.canvas.tag_lower(item)
+
+    def _on_resize(self, event):
+        width, height = event.width, event.height
+        if width <= 1 or height <= 1 or (width, height) == (self._width, self._height):
+            return
+        self._width, self._height = width, height
+        self._build_grid()
+        self._axis_range = None
+        self._layout()
+        self.update_graph()
+
+    def _layout(self):
+        """Reposiciona itens que dependem do tamanho do canvas"""
+
+    def _plot(self, values: Any, low: float, high: float) -> List[float]:
+        """Coordenadas da linha de ``values`` na faixa [low, high]"""
+        width, height = self._width, self._height
+        count = len(values)
+        spacing = width / count
+        scale = height / (high - low)
+        coords = []
+        append = coords.append
+        for i, v in enumerate(values):
+            append(i * spacing)
+            append(height - (min(max(v, low), high) - low) * scale)
+        return coords
+
+    def _plot_points(self, xs: List[float], ys: List[float], count: int,
+                     low: float, high: float) -> List[float]:
+        """Coordenadas de uma série reduzida (índices ``xs`` de uma janela de ``count``)"""
+        height = self._height
+        spacing = self._width / count
+        scale = height / (high - low)
+        coords = []
+        append = coords.append
+        for x, v in zip(xs, ys):
+            append(x * spacing)
+            append(height - (min(max(v, low), high) - low) * scale)
+        return coords
+
+    def _update_axis(self, low: float, high: float):
+        """Reescreve os rótulos do eixo (só quando a faixa muda)"""
+        self._axis_range = (low, high)
+        if not self._axis_items:
+            return
+        top, bottom = self._axis_items
+        self.canvas.itemconfig(top, text=f"{round(high, 6):g}")
+        self.canvas.itemconfig(bottom, text=f"{round(low, 6):g}")
+        self.canvas.coords(bottom, 3, self._height - 1)
+
+
+class ModernGraph(_GraphCanvas):
+    """Gráfico de linhas moderno"""
+
+    @traced_init
+    def __init__(self, container: tk.Frame, label: str, menu_ref: ClivMenu,
+                 style: Optional[WidgetStyle] = None, max_values: int = 50,
+                 use_numpy: Optional[bool] = None, max_fps: Optional[float] = 60,
+                 autoscale: str = 'fixed', y_range: Tuple[float, float] = (0, 120),
+                 percentiles: Tuple[float, float] = (5, 95),
+                 axis_labels: Optional[bool] = None,
+                 decimation: Optional[str] = 'minmax'):
+        """
+        Cria um gráfico de linhas
+
+        Args:
+            container: Container pai
+            label: Label do gráfico
+            menu_ref: Referência ao menu
+            style: Estilo customizado
+            max_values: Número máximo de valores exibidos
+            use_numpy: Backend do buffer e dos percentis (None = NumPy se instalado)
+            max_fps: Redesenhos por segundo no máximo; as amostras entram na
+                hora e o canvas é redesenhado uma vez por frame (None =
+                redesenha a cada amostra)
+            autoscale: Escala do eixo Y: 'fixed' (y_range), 'window' (mínimo e
+                máximo da janela) ou 'percentile' (entre os percentis)
+            y_range: Faixa do modo 'fixed'
+            percentiles: Percentis inferior e superior do modo 'percentile'
+            axis_labels: Mostra os valores do eixo (None = só com autoscale)
+            decimation: Redução quando há mais valores que pixels: 'minmax'
+                (envelope por coluna), 'lttb' ou None (desenha todos)
+        """
+        self.max_values = max_values
+        self.decimation = decimation
+        # Buffer circular: add_value é O(1) mesmo com milhares de valores
+        self.buffer = RingBuffer(max_values, use_numpy=use_numpy)
+        self.scaler = AxisScaler(autoscale, max_values, y_range, percentiles, use_numpy)
+        super().__init__(container, label, menu_ref, style, max_fps,
+                         axis_labels if axis_labels is not None else autoscale != 'fixed')
+
+        self._fill_item = self.canvas.create_polygon(0, 0, 0, 0, 0, 0, fill=self.menu.theme,
+                                                     outline="", stipple="gray50", tags="fill")
+        self._line_item = self.canvas.create_line(0, 0, 0, 0, fill=self.menu.theme,
+                                                  width=2, tags="plot")
+        self.canvas.tag_raise("axis")
+        self._build_grid()
+        self._layout()
+        self.update_graph()
+
+    def _layout(self):
+        """Recria o estágio de redução para a largura atual"""
+        self._decimator = create_decimator(self.decimation, self.max_values, self._width)
+
+    @property
+    def values(self) -> List[float]:
+        """Cópia dos valores exibidos, do mais antigo para o mais recente"""
+        return self.buffer.snapshot()
+
+    @values.setter
+    def values(self, values: Sequence[float]):
+        self.buffer.reset()
+        self.scaler.reset()
+        self._layout()
+        self.add_values(values)
+
+    @ui_thread
+    def add_value(self, val: float):
+        """Adiciona um valor ao gráfico"""
+        self.buffer.append(val)
+        self.scaler.push(val)
+        self.samples_ingested += 1
+        self._invalidate()
+
+    @ui_thread
+    def add_values(self, values: Iterable[float]):
+        """Adiciona várias amostras de uma vez (um único redesenho)"""
+        if self.scaler.window is not None and not isinstance(values, (list, tuple)):
+            values = list(values)
+        before = self.buffer.written
+        self.buffer.extend(values)
+        added = self.buffer.written - before
+        self.scaler.extend(values, added)
+        self.samples_ingested += added
+        self._invalidate()
+
+    def update_graph(self):
+        """Atualiza o gráfico (um coords na linha e outro no preenchimento)"""
+        self._dirty = False
+        self.frames_rendered += 1
+        values = self.buffer.view()
+        count = len(values)
+        if count < 2:
+            return
+
+        low, high = self.scaler.range(values)
+        if (low, high) != self._axis_range:
+            self._update_axis(low, high)
+
+        if self._decimator is None:
+            coords = self._plot(values, low, high)
+        else:
+            xs, ys = self._decimator.points(self.buffer)
+            coords = self._plot_points(xs, ys, count, low, high)
+        self.canvas.coords(self._line_item, coords)
+        coords.extend((coords[-2], self._height, 0, self._height))
+        self.canvas.coords(self._fill_item, coords)
+
+
+class GraphSeries:
+    """Uma série do MultiSeriesGraph"""
+
+    def __init__(self, name: str, color: str, buffer: RingBuffer, scaler: AxisScaler,
+                 line_item: int, legend_item: int, decimator: Optional[_Decimator] = None):
+        self.name = name
+        self.color = color
+        self.buffer = buffer
+        self.scaler = scaler
+        self.line_item = line_item
+        self.legend_item = legend_item
+        self.decimator = decimator
+        self.visible = True
+
+    @property
+    def values(self) -> List[float]:
+        """Cópia dos valores, do mais antigo para o mais recente"""
+        return self.buffer.snapshot()
+
+
+class MultiSeriesGraph(_GraphCanvas):
+    """Várias séries em um único canvas, com grade, eixo e legenda compartilhados"""
+
+    PALETTE = ("#2ecc71", "#3498db", "#f39c12", "#e74c3c", "#1abc9c", "#e84393")
+
+    @traced_init
+    def __init__(self, container: tk.Frame, label: str, menu_ref: ClivMenu,
+                 style: Optional[WidgetStyle] = None, max_values: int = 50,
+                 series: Sequence[str] = (), use_numpy: Optional[bool] = None,
+                 max_fps: Optional[float] = 60, autoscale: str = 'fixed',
+                 y_range: Tuple[float, float] = (0, 120),
+                 percentiles: Tuple[float, float] = (5, 95),
+                 axis_labels: Optional[bool] = None,
+                 decimation: Optional[str] = 'minmax'):
+        """
+        Cria um gráfico com várias séries
+
+        Args:
+            container: Container pai
+            label: Label do gráfico
+            menu_ref: Referência ao menu
+            style: Estilo customizado
+            max_values: Valores exibidos por série (eixo de tempo comum)
+            series: Nomes das séries iniciais (mais podem ser criadas com add_series)
+            use_numpy: Backend dos buffers e dos percentis (None = NumPy se instalado)
+            max_fps: Redesenhos por segundo no máximo (None = a cada amostra)
+            autoscale: 'fixed', 'window' ou 'percentile' (faixa comum a todas as séries)
+            y_range: Faixa do modo 'fixed'
+            percentiles: Percentis do modo 'percentile'
+            axis_labels: Mostra os valores do eixo (None = só com autoscale)
+            decimation: Redução por série: 'minmax', 'lttb' ou None
+        """
+        self.max_values = max_values
+        self.decimation = decimation
+        self.use_numpy = use_numpy
+        self.autoscale = autoscale
+        self.y_range = y_range
+        self.percentiles = percentiles
+        # Faixa comum (arredondamento e histerese); as séries só fornecem limites
+        self.scaler = AxisScaler(autoscale, max_values, y_range, percentiles, use_numpy)
+        self.series: Dict[str, GraphSeries] = {}
+        # Largura para a qual as reduções das séries foram criadas
+        self._decimator_width = 0
+        super().__init__(container, label, menu_ref, style, max_fps,
+                         axis_labels if axis_labels is not None else autoscale != 'fixed')
+        self._build_grid()
+
+        for name in series:
+            self.add_series(name)
+
+    def add_series(self, name: str, color: Optional[str] = None) -> GraphSeries:
+        """Cria uma série (pode ser chamado com o gráfico em uso)"""
+        if name in self.series:
+            raise ValueError(f"Série já existe: {name!r}")
+        if color is None:
+            color = self.PALETTE[len(self.series) % len(self.PALETTE)]
+
+        canvas = self.canvas
+        line = canvas.create_line(0, 0, 0, 0, fill=color, width=2, tags="plot")
+        legend = canvas.create_text(0, 2, anchor='ne', text=f"● {name.upper()}", fill=color,
+                                    font=("Arial", 6, "bold"), tags="legend")
+        series = GraphSeries(name, color,
+                             RingBuffer(self.max_values, use_numpy=self.use_numpy),
+                             AxisScaler(self.autoscale, self.max_values, self.y_range,
+                                        self.percentiles, self.use_numpy),
+                             line, legend,
+                             create_decimator(self.decimation, self.max_values, self._width))
+        self.series[name] = series
+        canvas.tag_raise("legend")
+        canvas.tag_raise("axis")
+        self._layout()
+        self._invalidate()
+        return series
+
+    def remove_series(self, name: str):
+        """Remove uma série e os itens dela do canvas"""
+        series = self.series.pop(name)
+        self.canvas.delete(series.line_item)
+        self.canvas.delete(series.legend_item)
+        self._layout()
+        self._invalidate()
+
+    def set_visible(self, name: str, visible: bool):
+        """Mostra ou oculta uma série (continua recebendo amostras)"""
+        series = self.series[name]
+        series.visible = visible
+        self.canvas.itemconfig(series.line_item, state='normal' if visible else 'hidden')
+        self._invalidate()
+
+    @ui_thread
+    def add_value(self, name: str, val: float):
+        """Adiciona um valor à série ``name``"""
+        series = self.series[name]
+        series.buffer.append(val)
+        series.scaler.push(val)
+        self.samples_ingested += 1
+        self._invalidate()
+
+    @ui_thread
+    def add_values(self, name: str, values: Iterable[float]):
+        """Adiciona várias amostras à série ``name`` (um único redesenho)"""
+        series = self.series[name]
+        if series.scaler.window is not None and not isinstance(values, (list, tuple)):
+            values = list(values)
+        before = series.buffer.written
+        series.buffer.extend(values)
+        added = series.buffer.written - before
+        series.scaler.extend(values, added)
+        self.samples_ingested += added
+        self._invalidate()
+
+    @ui_thread
+    def add_sample(self, values: Dict[str, float]):
+        """Adiciona um valor a cada série do dicionário (ex.: uma leitura de CPU/RAM/disco)"""
+        for name, val in values.items():
+            series = self.series[name]
+            series.buffer.append(val)
+            series.scaler.push(val)
+        self.samples_ingested += len(values)
+        self._invalidate()
+
+    def _layout(self):
+        """Legenda alinhada à direita e redução recriada para a largura atual"""
+        canvas = self.canvas
+        x = self._width - 4
+        # Séries sem redução também são reavaliadas: encolher pode exigi-la
+        rebuild = self._decimator_width != self._width
+        self._decimator_width = self._width
+        for series in reversed(list(self.series.values())):
+            if rebuild:
+                series.decimator = create_decimator(self.decimation, self.max_values,
+                                                    self._width)
+            canvas.coords(series.legend_item, x, 2)
+            bbox = canvas.bbox(series.legend_item)
+            if bbox:
+                x -= bbox[2] - bbox[0] + 8
+
+    def update_graph(self):
+        """Redesenha todas as séries em uma passada (um coords por série)"""
+        self._dirty = False
+        self.frames_rendered += 1
+        visible = [s for s in self.series.values() if s.visible]
+        if not visible or self.max_values < 2:
+            return
+
+        if self.autoscale == 'fixed':
+            low, high = self.scaler.range(None)
+        else:
+            bounds = [s.scaler.bounds(s.buffer.view()) for s in visible]
+            low, high = self.scaler.fit(min(b[0] for b in bounds), max(b[1] for b in bounds))
+        if (low, high) != self._axis_range:
+            self._update_axis(low, high)
+
+        coords, count = self.canvas.coords, self.max_values
+        for series in visible:
+            if series.decimator is None:
+                coords(series.line_item, self._plot(series.buffer.view(), low, high))
+            else:
+                xs, ys = series.decimator.points(series.buffer)
+                coords(series.line_item, self._plot_points(xs, ys, count, low, high))
+
+
+class DynamicColorPicker:
+    """Seletor de cores dinâmico com roda HSV"""
+
+    @traced_init
+    def __init__(self, container: tk.Frame, var_name: str, menu_ref: ClivMenu,
+                 style: Optional[WidgetStyle] = None,
+                 callback: Optional[Callable[[str], None]] = None):
+        """
+        Cria um seletor de cores
+
+        Args:
+            container: Container pai
+            var_name: Nome da variável para armazenar a cor
+            menu_ref: Referência ao menu
+            style: Estilo customizado
+            callback: Função chamada quando a cor muda
+        """
+        self.menu = menu_ref
+        self.var_name = var_name
+        self.h, self.s, self.v = 0.0, 1.0, 1.0
+        self.callback = callback
+
+        if style is None:
+            style = WidgetStyle()
+
+        self.shell = tk.Frame(container, bg=style.bg_color,
+                             pady=style.padding[0], bd=0)
+
+        if style.pack:
+            self.shell.pack(fill='x', padx=style.padding[3])
+        else:
+            self.shell.place(x=style.x, y=style.y, width=style.width, height=style.height)
+
+        head = tk.Frame(self.shell, bg=style.bg_color)
+        head.pack(fill='x', pady=5)
+
+        tk.Label(head, text=var_name.upper(), fg="white", bg=style.bg_color,
+                font=style.font).pack(side='left')
+
+        self.preview = tk.Canvas(head, width=40, height=20, highlightthickness=2,
+                                highlightbackground="white", bd=0)
+        self.preview.pack(side='right')
+
+        self.wheel_canvas = tk.Canvas(self.shell, width=150, height=150,
+                                      bg=style.bg_color, highlightthickness=0, bd=0)
+        self.wheel_canvas.pack(pady=5)
+        self._render_hue_wheel()
+
+        # Saturação
+        sat_frame = tk.Frame(self.shell, bg=style.bg_color)
+        sat_frame.pack(fill='x', pady=2)
+        tk.Label(sat_frame, text="SAT", fg="gray", bg=style.bg_color,
+                font=("Arial", 7)).pack(side='left', padx=5)
+
+        self.sat_canvas = tk.Canvas(sat_frame, height=10, highlightthickness=0, bd=0)
+        self.sat_canvas.pack(side='left', fill='x', expand=True)
+
+        # Valor (brilho)
+        val_frame = tk.Frame(self.shell, bg=style.bg_color)
+        val_frame.pack(fill='x', pady=2)
+        tk.Label(val_frame, text="VAL", fg="gray", bg=style.bg_color,
+                font=("Arial", 7)).pack(side='left', padx=5)
+
+        self.val_canvas = tk.Canvas(val_frame, height=10, highlightthickness=0, bd=0)
+        self.val_canvas.pack(side='left', fill='x', expand=True)
+
+        self.wheel_canvas.bind("<B1-Motion>", self._pick_hue)
+        self.wheel_canvas.bind("<Button-1>", self._pick_hue)
+        self.sat_canvas.bind("<B1-Motion>", self._pick_sat)
+        self.sat_canvas.bind("<Button-1>", self._pick_sat)
+        self.val_canvas.bind("<B1-Motion>", self._pick_val)
+        self.val_canvas.bind("<Button-1>", self._pick_val)
+
+        self._update_all()
+
+    def _render_hue_wheel(self):
+        """Renderiza a roda de cores"""
+        from PIL import Image, ImageDraw, ImageTk
+
+        img = Image.new("RGBA", (150, 150), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        center = 75
+
+        for y in range(150):
+            for x in range(150):
+                dx, dy = x - center, y - center
+                dist = math.sqrt(dx*dx + dy*dy)
+                if 50 < dist < 70:
+                    angle = math.atan2(dy, dx) / (2 * math.pi) + 0.5
+                    r, g, b = colorsys.hsv_to_rgb(angle, 1, 1)
+                    draw.point((x, y), fill=(int(r*255), int(g*255), int(b*255), 255))
+
+        self.wheel_tk = ImageTk.PhotoImage(img)
+        self.wheel_canvas.create_image(75, 75, image=self.wheel_tk)
+        self.cursor = self.wheel_canvas.create_oval(0, 0, 0, 0, outline="white", width=3)
+
+    def _update_all(self):
+        """Atualiza todos os componentes"""
+        rgb = colorsys.hsv_to_rgb(self.h, self.s, self.v)
+        hex_c = '#%02x%02x%02x' % tuple(int(x*255) for x in rgb)
+        self.preview.config(bg=hex_c)
+        self.menu.data[self.var_name] = hex_c
+
+        if self.callback:
+            _run_callback(self.menu, self.callback, hex_c)
+
+        # Atualizar barra de saturação
+        self.sat_canvas.delete("all")
+        width = self.sat_canvas.winfo_width() if self.sat_canvas.winfo_width() > 1 else 150
+        for i in range(width):
+            r, g, b = colorsys.hsv_to_rgb(self.h, i/width, self.v)
+            color = '#%02x%02x%02x' % (int(r*255), int(g*255), int(b*255))
+            self.sat_canvas.create_line(i, 0, i, 10, fill=color)
+
+        # Atualizar barra de valor
+        self.val_canvas.delete("all")
+        for i in range(width):
+            r, g, b = colorsys.hsv_to_rgb(self.h, self.s, i/width)
+            color = '#%02x%02x%02x' % (int(r*255), int(g*255), int(b*255))
+            self.val_canvas.create_line(i, 0, i, 10, fill=color)
+
+    def _pick_hue(self, e):
+        """Seleciona matiz (hue)"""
+        dx, dy = e.x - 75, e.y - 75
+        dist = math.sqrt(dx*dx + dy*dy)
+
+        if 50 < dist < 70:
+            self.h = (math.atan2(dy, dx) / (2 * math.pi)) % 1.0
+            angle = self.h * 2 * math.pi
+            cursor_x = 75 + 60 * math.cos(angle)
+            cursor_y = 75 + 60 * math.sin(angle)
+            self.wheel_canvas.coords(self.cursor, cursor_x-4, cursor_y-4,
+                                    cursor_x+4, cursor_y+4)
+            self._update_all()
+
+    def _pick_sat(self, e):
+        """Seleciona saturação"""
+        width = self.sat_canvas.winfo_width()
+        self.s = max(0, min(e.x/width, 1.0))
+        self._update_all()
+
+    def _pick_val(self, e):
+        """Seleciona valor (brightness)"""
+        width = self.val_canvas.winfo_width()
+        self.v = max(0, min(e.x/width, 1.0))
+        self._update_all()
+
+    def get_color(self) -> str:
+        """Retorna a cor atual em formato hexadecimal"""
+        rgb = colorsys.hsv_to_rgb(self.h, self.s, self.v)
+        return '#%02x%02x%02x' % tuple(int(x*255) for x in rgb)
+
+
+class ModernSlider:
+    """Slider moderno com estilo customizável"""
+
+    @traced_init
+    def __init__(self, container: tk.Frame, text: str, de: int, ate: int,
+                 menu_ref: ClivMenu, default: Optional[int] = None,
+                 callback: Optional[Callable[[int], None]] = None,
+                 style: Optional[WidgetStyle] = None):
+        """
+        Cria um slider
+
+        Args:
+            container: Container pai
+            text: Label do slider
+            de: Valor mínimo
+            ate: Valor máximo
+            menu_ref: Referência ao menu
+            default: Valor padrão
+            callback: Função chamada quando o valor muda
+            style: Estilo customizado
+        """
+        self.de, self.ate = de, ate
+        self.menu = menu_ref
+        self.theme = menu_ref.theme
+        self.callback = callback
+        self.current_value = default if default is not None else de
+
+        if style is None:
+            style = WidgetStyle()
+
+        bg = menu_ref.bg_color if menu_ref else style.bg_color
+
+        self.shell = tk.Frame(container, bg=bg, pady=style.padding[0], bd=0)
+
+        if style.pack:
+            self.shell.pack(fill='x', padx=style.padding[3])
+        else:
+            self.shell.place(x=style.x, y=style.y, width=style.width, height=style.height)
+
+        f = tk.Frame(self.shell, bg=bg)
+        f.pack(fill='x')
+
+        tk.Label(f, text=text, bg=bg, fg="white",
+                font=style.font).pack(side='left')
+
+        self.lval = tk.Label(f, text=str(self.current_value), bg=bg,
+                            fg=self.theme, font=style.font)
+        self.lval.pack(side='right')
+
+        canvas_width = style.width if style.width else 320
+        self.canvas = tk.Canvas(self.shell, width=canvas_width, height=20, bg=bg,
+                               highlightthickness=0, bd=0)
+        self.canvas.pack()
+
+        self.canvas.bind("<B1-Motion>", self.update)
+        self.canvas.bind("<Button-1>", self.update)
+
+        initial_pos = 10 + ((self.current_value - self.de) / (self.ate - self.de)) * (canvas_width - 20)
+        self.update(None, initial_pos)
+
+    def update(self, event, mx=None):
+        """Atualiza o slider"""
+        canvas_width = self.canvas.winfo_width() if self.canvas.winfo_width() > 1 else 320
+        x = mx if mx is not None else event.x
+        x = max(10, min(x, canvas_width - 10))
+
+        self.canvas.delete("all")
+
+        # Track
+        self.canvas.create_line(10, 10, canvas_width - 10, 10,
+                               fill="#1a1a1a", width=6, capstyle='round')
+
+        # Progress
+        self.canvas.create_line(10, 10, x, 10, fill=self.theme,
+                               width=6, capstyle='round')
+
+        # Thumb
+        self.canvas.create_oval(x-8, 2, x+8, 18, fill="white",
+                               outline=self.theme, width=3)
+
+        val = int(self.de + ((x-10)/(canvas_width - 20)) * (self.ate - self.de))
+        self.current_value = val
+        self.lval.config(text=str(val))
+
+        if self.callback:
+            _run_callback(self.menu, self.callback, val)
+
+    def get_value(self) -> int:
+        """Retorna o valor atual"""
+        return self.current_value
+
+    @ui_thread
+    def set_value(self, value: int):
+        """Define o valor do slider"""
+        value = max(self.de, min(value, self.ate))
+        canvas_width = self.canvas.winfo_width() if self.canvas.winfo_width() > 1 else 320
+        pos = 10 + ((value - self.de) / (self.ate - self.de)) * (canvas_width - 20)
+        self.update(None, pos)
+
+
+class ModernCheck:
+    """Checkbox moderno"""
+
+    @traced_init
+    def __init__(self, container: tk.Frame, text: str, menu_ref: ClivMenu,
+                 default: bool = False,
+                 callback: Optional[Callable[[bool], None]] = None,
+                 style: Optional[WidgetStyle] = None):
+        """
+        Cria um checkbox
+
+        Args:
+            container: Container pai
+            text: Label do checkbox
+            menu_ref: Referência ao menu
+            default: Estado padrão
+            callback: Função chamada quando o estado muda
+            style: Estilo customizado
+        """
+        self.marcado = default
+        self.menu = menu_ref
+        self.theme = menu_ref.theme
+        self.callback = callback
+
+        if style is None:
+            style = WidgetStyle()
+
+        bg = menu_ref.bg_color if menu_ref else style.bg_color
+
+        self.shell = tk.Frame(container, bg=bg, pady=style.padding[0], bd=0)
+
+        if style.pack:
+            self.shell.pack(fill='x', padx=style.padding[3])
+        else:
+            self.shell.place(x=style.x, y=style.y, width=style.width, height=style.height)
+
+        self.canvas = tk.Canvas(self.shell, width=18, height=18, bg=bg,
+                               highlightthickness=0, bd=0, cursor="hand2")
+        self.canvas.pack(side='left')
+
+        label = tk.Label(self.shell, text=text, bg=bg, fg="white",
+                        font=style.font, cursor="hand2")
+        label.pack(side='left', padx=10)
+
+        self.canvas.bind("<Button-1>", lambda e: self.toggle())
+        label.bind("<Button-1>", lambda e: self.toggle())
+
+        self.draw()
+
+    def draw(self):
+        """Desenha o checkbox"""
+        self.canvas.delete("all")
+
+        if self.marcado:
+            self.canvas.create_rectangle(1, 1, 17, 17, outline=self.theme,
+                                        width=2, fill=self.theme)
+            self.canvas.create_line(5, 9, 8, 13, fill="white", width=2, capstyle='round')
+            self.canvas.create_line(8, 13, 14, 6, fill="white", width=2, capstyle='round')
+        else:
+            bg = self.shell.cget('bg')
+            self.canvas.create_rectangle(1, 1, 17, 17, outline=self.theme,
+                                        width=2, fill=bg)
+
+    @ui_thread
+    def toggle(self):
+        """Alterna estado do checkbox"""
+        self.marcado = not self.marcado
+        self.draw()
+
+        if self.callback:
+            _run_callback(self.menu, self.callback, self.marcado)
+
+    def get_value(self) -> bool:
+        """Retorna estado atual"""
+        return self.marcado
+
+    @ui_thread
+    def set_value(self, value: bool):
+        """Define o estado do checkbox"""
+        self.marcado = value
+        self.draw()
+
+
+class KeyBind:
+    """Widget para captura de teclas"""
+
+    @traced_init
+    def __init__(self, container: tk.Frame, text: str, var_name: str,
+                 menu_ref: ClivMenu, default: str = "NONE",
+                 callback: Optional[Callable[[str], None]] = None,
+                 style: Optional[WidgetStyle] = None):
+        """
+        Cria um capturador de teclas
+
+        Args:
+            container: Container pai
+            text: Label do widget
+            var_name: Nome da variável
+            menu_ref: Referência ao menu
+            default: Tecla padrão
+            callback: Função chamada quando a tecla muda
+            style: Estilo customizado
+        """
+        self.menu = menu_ref
+        self.var_name = var_name
+        self.key = default
+        self.listening = False
+        self._hook = None
+        # Armado antes de registrar o hook; o lock impede que listen veja o
+        # hook registrado mas ainda sem _hook atribuído
+        self._hook_lock = threading.Lock()
+        self._armed = False
+        self.callback = callback
+
+        if style is None:
+            style = WidgetStyle()
+
+        self.shell = tk.Frame(container, bg=menu_ref.bg_color,
+                             pady=style.padding[0], bd=0)
+
+        if style.pack:
+            self.shell.pack(fill='x', padx=style.padding[3])
+        else:
+            self.shell.place(x=style.x, y=style.y, width=style.width, height=style.height)
+
+        tk.Label(self.shell, text=text, bg=menu_ref.bg_color, fg="white",
+                font=style.font).pack(side='left')
+
+        self.btn = tk.Button(self.shell, text=self.key, bg="#1a1a1a",
+                            fg=menu_ref.theme, font=("Arial", 7, "bold"),
+                            bd=2, relief="solid", width=12,
+                            command=self.start_listen, cursor="hand2",
+                            activebackground="#2a2a2a")
+        self.btn.pack(side='right')
+
+        self.menu.data[var_name] = self.key
+
+    def start_listen(self):
+        """Inicia escuta de tecla"""
+        if self.listening:
+            return
+
+        try:
+            import keyboard
+            self.listening = True
+            self.btn.config(text="PRESSIONE...", fg="yellow", state='disabled')
+            # Hook na thread de escuta do próprio keyboard: nenhuma thread por clique
+            with self._hook_lock:
+                self._armed = True
+                try:
+                    self._hook = keyboard.on_press(self.listen)
+                except Exception:
+                    self._armed = False
+                    raise
+        except Exception:
+            self._listen_failed()
+
+    def listen(self, event):
+        """Recebe a tecla pressionada (thread do keyboard; o widget é atualizado via fila)"""
+        # Espera o start_listen terminar de registrar o hook
+        with self._hook_lock:
+            # Só a primeira tecla conta
+            if not self._armed:
+                return
+            self._armed = False
+            hook, self._hook = self._hook, None
+        self.menu.post(self._set_key, event.name.upper(), hook)
+
+    def _set_key(self, key: str, hook: Any = None):
+        """Aplica a tecla capturada (thread do Tk)"""
+        if hook is not None:
+            try:
+                import keyboard
+                keyboard.unhook(hook)
+            except Exception:
+                pass
+        self.key = key
+        self.menu.data[self.var_name] = self.key
+        self.btn.config(text=self.key, fg=self.menu.theme, state='normal')
+        self.listening = False
+
+        if self.callback:
+            _run_callback(self.menu, self.callback, self.key)
+
+    def _listen_failed(self):
+        self.btn.config(text="ERRO", fg="red", state='normal')
+        self.listening = False
+
+    def get_key(self) -> str:
+        """Retorna a tecla atual"""
+        return self.key
+
+
+class ModernButton:
+    """Botão moderno com efeitos"""
+
+    @traced_init
+    def __init__(self, container: tk.Frame, text: str, menu_ref: ClivMenu,
+                 callback: Optional[Callable] = None, button_style: str = "primary",
+                 style: Optional[WidgetStyle] = None):
+        """
+        Cria um botão
+
+        Args:
+            container: Container pai
+            text: Texto do botão
+            menu_ref: Referência ao menu
+            callback: Função chamada ao clicar
+            button_style: Estilo do botão ('primary', 'success', 'danger', 'warning', 'info')
+            style: Estilo customizado
+        """
+        self.menu = menu_ref
+        self.callback = callback
+
+        if style is None:
+            style = WidgetStyle()
+
+        colors = {
+            'primary': menu_ref.theme,
+            'success': '#2ecc71',
+            'danger': '#e74c3c',
+            'warning': '#f39c12',
+            'info': '#3498db'
+        }
+
+        color = colors.get(button_style, menu_ref.theme)
+
+        self.shell = tk.Frame(container, bg=menu_ref.bg_color,
+                             pady=style.padding[0], bd=0)
+
+        if style.pack:
+            self.shell.pack(fill='x', padx=style.padding[3])
+        else:
+            self.shell.place(x=style.x, y=style.y, width=style.width, height=style.height)
+
+        self.btn = tk.Button(self.shell, text=text.upper(), bg=color, fg="white",
+                            font=style.font, bd=0, cursor="hand2",
+                            command=self._on_click, activebackground=color,
+                            relief='flat')
+        self.btn.pack(fill='x', ipady=10)
+
+        self.btn.bind("<Enter>", lambda e: self.btn.config(relief='raised'))
+        self.btn.bind("<Leave>", lambda e: self.btn.config(relief='flat'))
+
+    def _on_click(self):
+        """Callback do botão"""
+        if self.callback:
+            _run_callback(self.menu, self.callback)
+        if self.menu:
+            self.menu._emit("click", self)
@@ -7,8 +7,6 @@ import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 
 from cliv_gui import ClivMenu, ModernGraph, ModernSlider, ModernCheck, ImageSeparator, ModernButton
-import threading
-import time
 import random
 import psutil  # pip install psutil
 
@@ -139,64 +137,56 @@ class SystemMonitor:
         self.show_notifs = True
 
     def start_monitoring(self):
-        """Inicia o loop de monitoramento"""
-        def monitor_loop():
-            last_disk_io = psutil.disk_io_counters()
-
-            while self.running:
-                try:
-                    # CPU
-                    if self.monitor_cpu:
-                        cpu_percent = psutil.cpu_percent(interval=0.1)
-                        self.cpu_graph.add_value(cpu_percent)
-
-                        # Alerta de CPU alta
-                        if cpu_percent > 80 and self.show_notifs:
-                            self.menu.show_notification(
-                                "⚠️ CPU Alert",
-                                f"CPU usage is high: {cpu_percent:.1f}%",
-                                3000,
-                                "warning"
-                            )
-
-                    # RAM
-                    if self.monitor_ram:
-                        ram = psutil.virtual_memory()
-                        ram_percent = ram.percent
-                        self.ram_graph.add_value(ram_percent)
-
-                        # Alerta de RAM alta
-                        if ram_percent > 85 and self.show_notifs:
-                            self.menu.show_notification(
-                                "⚠️ RAM Alert",
-                                f"Memory usage is critical: {ram_percent:.1f}%",
-                                3000,
-                                "error"
-                            )
-
-                    # Disk I/O
-                    if self.monitor_disk:
-                        current_disk_io = psutil.disk_io_counters()
-                        read_mb = (current_disk_io.read_bytes - last_disk_io.read_bytes) / 1024 / 1024
-                        write_mb = (current_disk_io.write_bytes - last_disk_io.write_bytes) / 1024 / 1024
-                        total_io = read_mb + write_mb
-
-                        self.disk_graph.add_value(total_io * 10)  # Escalar para visualização
-                        last_disk_io = current_disk_io
-
-                    time.sleep(self.update_interval / 1000)
-
-                except Exception as e:
-                    print(f"Erro no monitoramento: {e}")
-                    time.sleep(1)
-
-        # Iniciar thread de monitoramento
-        monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
-        monitor_thread.start()
+        """Inicia o loop de monitoramento (pool do menu, encerrado ao fechar)"""
+        last_disk_io = [psutil.disk_io_counters()]
+
+        def monitor_tick():
+            # CPU
+            if self.monitor_cpu:
+                cpu_percent = psutil.cpu_percent(interval=0.1)
+                self.cpu_graph.add_value(cpu_percent)
+
+                # Alerta de CPU alta
+                if cpu_percent > 80 and self.show_notifs:
+                    self.menu.show_notification(
+                        "⚠️ CPU Alert",
+                        f"CPU usage is high: {cpu_percent:.1f}%",
+                        3000,
+                        "warning"
+                    )
+
+            # RAM
+            if self.monitor_ram:
+                ram = psutil.virtual_memory()
+                ram_percent = ram.percent
+                self.ram_graph.add_value(ram_percent)
+
+                # Alerta de RAM alta
+                if ram_percent > 85 and self.show_notifs:
+                    self.menu.show_notification(
+                        "⚠️ RAM Alert",
+                        f"Memory usage is critical: {ram_percent:.1f}%",
+                        3000,
+                        "error"
+                    )
+
+            # Disk I/O
+            if self.monitor_disk:
+                current_disk_io = psutil.disk_io_counters()
+                read_mb = (current_disk_io.read_bytes - last_disk_io[0].read_bytes) / 1024 / 1024
+                write_mb = (current_disk_io.write_bytes - last_disk_io[0].write_bytes) / 1024 / 1024
+                total_io = read_mb + write_mb
+
+                self.disk_graph.add_value(total_io * 10)  # Escalar para visualização
+                last_disk_io[0] = current_disk_io
+
+        self.monitor = self.menu.executor.loop(monitor_tick, self.update_interval,
+                                               name="monitor")
 
     def set_update_interval(self, value):
         """Define intervalo de atualização"""
         self.update_interval = value
+        self.monitor.interval_ms = value
         self.menu.show_notification(
             "Settings",
             f"Update interval set to {value}ms",
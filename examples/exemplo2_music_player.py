@@ -7,8 +7,6 @@ import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 
 from cliv_gui import ClivMenu, AudioPlayer, ModernSlider, ModernCheck, ImageSeparator, ModernButton, ModernGraph
-import threading
-import time
 import random
 from tkinter import filedialog
 import tkinter as tk
@@ -238,19 +236,13 @@ class MusicPlayer:
 
     def start_visualizer(self):
         """Inicia o visualizador de áudio"""
-        def visualizer_loop():
-            while True:
-                try:
-                    if self.visualizer_enabled and self.audio_player.playing:
-                        # Simular dados de espectro de áudio
-                        value = random.randint(30, 100)
-                        self.visualizer.add_value(value)
-                    time.sleep(0.05)  # 20 FPS
-                except:
-                    time.sleep(0.1)
-
-        thread = threading.Thread(target=visualizer_loop, daemon=True)
-        thread.start()
+        def visualizer_tick():
+            if self.visualizer_enabled and self.audio_player.playing:
+                # Simular dados de espectro de áudio
+                value = random.randint(30, 100)
+                self.visualizer.add_value(value)
+
+        self.menu.executor.loop(visualizer_tick, 50, name="visualizer")  # 20 FPS
 
     def load_audio_file(self):
         """Carrega um arquivo de áudio"""
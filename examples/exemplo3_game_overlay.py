@@ -9,8 +9,6 @@ os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 from cliv_gui import (ClivMenu, ProcessOverlay, ModernSlider, ModernCheck,
                       ImageSeparator, ModernButton, KeyBind, DynamicColorPicker,
                       ModernGraph)
-import threading
-import time
 import random
 import tkinter as tk
 
@@ -384,18 +382,12 @@ class GameOverlayController:
 
     def start_overlay_system(self):
         """Inicia o sistema de overlay em background"""
-        def overlay_monitor():
-            while True:
-                try:
-                    if self.overlay_active and self.esp_enabled:
-                        # Atualizar visualizações (simulado)
-                        pass
-                    time.sleep(0.1)
-                except:
-                    time.sleep(1)
-
-        thread = threading.Thread(target=overlay_monitor, daemon=True)
-        thread.start()
+        def overlay_tick():
+            if self.overlay_active and self.esp_enabled:
+                # Atualizar visualizações (simulado)
+                pass
+
+        self.menu.executor.loop(overlay_tick, 100, name="overlay")
 
     def toggle_esp(self, enabled):
         """Ativa/desativa ESP"""
@@ -8,7 +8,6 @@ os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 
 from cliv_gui import (ClivMenu, ModernSlider, ModernCheck, ImageSeparator,
                       ModernButton, ModernGraph)
-import threading
 import time
 import datetime
 import tkinter as tk
@@ -409,49 +408,40 @@ Type your notes here...
 
     def start_timer_system(self):
         """Inicia o sistema de timer em background"""
-        def timer_loop():
-            while True:
-                try:
-                    if self.pomodoro_running and self.current_timer > 0:
-                        time.sleep(1)
-                        self.current_timer -= 1
-
-                        # Atualizar display
-                        minutes = self.current_timer // 60
-                        seconds = self.current_timer % 60
-                        self.timer_label.config(text=f"{minutes:02d}:{seconds:02d}")
-
-                        # Atualizar barra de progresso
-                        self.update_progress_bar()
-
-                        # Timer acabou
-                        if self.current_timer == 0:
-                            self.timer_complete()
-                    else:
-                        time.sleep(0.5)
-                except:
-                    time.sleep(1)
-
-        thread = threading.Thread(target=timer_loop, daemon=True)
-        thread.start()
+        def timer_tick():
+            if self.pomodoro_running and self.current_timer > 0:
+                self.current_timer -= 1
+                return self.current_timer
+            return None
+
+        def show_timer(remaining):
+            if remaining is None:
+                return
+            # Atualizar display (thread do Tk)
+            minutes = remaining // 60
+            seconds = remaining % 60
+            self.timer_label.config(text=f"{minutes:02d}:{seconds:02d}")
+
+            # Atualizar barra de progresso
+            self.update_progress_bar()
+
+            # Timer acabou
+            if remaining == 0:
+                self.timer_complete()
+
+        self.menu.executor.loop(timer_tick, 1000, on_done=show_timer, name="timer")
 
         # Atualizar gráfico de produtividade
         def update_graph():
-            while True:
-                try:
-                    # Simular atividade
-                    if self.pomodoro_running:
-                        value = 80 + (20 * (self.current_timer % 10) / 10)
-                    else:
-                        value = 20 + (10 * (int(time.time()) % 5))
-
-                    self.productivity_graph.add_value(value)
-                    time.sleep(2)
-                except:
-                    time.sleep(2)
-
-        graph_thread = threading.Thread(target=update_graph, daemon=True)
-        graph_thread.start()
+            # Simular atividade
+            if self.pomodoro_running:
+                value = 80 + (20 * (self.current_timer % 10) / 10)
+            else:
+                value = 20 + (10 * (int(time.time()) % 5))
+
+            self.productivity_graph.add_value(value)
+
+        self.menu.executor.loop(update_graph, 2000, name="productivity")
 
     def add_task(self):
         """Adiciona nova tarefa"""
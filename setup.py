@@ -44,6 +44,9 @@ setup(
         "pystray>=0.19.4",
     ],
     extras_require={
+        "numpy": [
+            "numpy>=1.17",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=22.0.0",